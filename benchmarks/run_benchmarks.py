@@ -0,0 +1,223 @@
+"""
+Blackjack Benchmarks
+
+Measures hands/sec, decisions/sec and peak memory for the game engine,
+every strategy, every simulate_* function and build_trajectory, across deck
+counts and hand counts. Results are written as JSON so runs from different
+releases can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --quick
+
+For help:
+    python benchmarks/run_benchmarks.py --help
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from blackjack_game import (
+    BlackjackGame,
+    BatchBlackjackGame,
+    simulate_strategy,
+    simulate_martingale_strategy,
+    simulate_card_counting_strategy,
+    basic_strategy,
+    always_stand_strategy,
+    hit_until_19_strategy,
+    basic_strategy_ignoring_count,
+    index_play_strategy,
+    BASIC_STRATEGY_TABLE,
+    HIT_UNTIL_19_TABLE,
+    INDEX_PLAY_TABLE,
+)
+from blackjack_game.strategy_tester import build_trajectory
+
+PLAY_STRATEGIES = {
+    "basic": basic_strategy,
+    "always_stand": always_stand_strategy,
+    "hit_until_19": hit_until_19_strategy,
+    "basic_table": BASIC_STRATEGY_TABLE,
+    "hit_until_19_table": HIT_UNTIL_19_TABLE,
+}
+
+COUNT_STRATEGIES = {
+    "basic_ignoring_count": basic_strategy_ignoring_count,
+    "index_play": index_play_strategy,
+    "index_play_table": INDEX_PLAY_TABLE,
+}
+
+
+def measure(name: str, fn, units: int, unit: str, memory: bool = True, **params) -> dict:
+    """Time fn() once (and once more under tracemalloc for peak memory)."""
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+
+    result = {
+        "name": name,
+        "params": params,
+        "seconds": seconds,
+        unit: units,
+        f"{unit}_per_sec": units / seconds if seconds > 0 else float("inf"),
+    }
+    if memory:
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory_kb"] = peak / 1024
+    print(f"  {name:<40} {params}  {result[f'{unit}_per_sec']:>14,.0f} {unit}/s")
+    return result
+
+
+def bench_game(hand_counts, deck_counts, memory):
+    results = []
+    for decks in deck_counts:
+        for hands in hand_counts:
+            def dict_api():
+                game = BlackjackGame(num_decks=decks, rng=0)
+                for _ in range(hands):
+                    game.reset()
+                    game.step('stand')
+
+            def tuple_api():
+                game = BlackjackGame(num_decks=decks, rng=0)
+                for _ in range(hands):
+                    game.deal()
+                    game.stand()
+
+            results.append(measure("game.reset/step", dict_api, hands, "hands", memory,
+                                   decks=decks, hands=hands))
+            results.append(measure("game.deal/stand", tuple_api, hands, "hands", memory,
+                                   decks=decks, hands=hands))
+    return results
+
+
+def bench_strategies(decisions, memory):
+    game = BlackjackGame(rng=0)
+    states = [game.reset() for _ in range(decisions)]
+    counts = np.random.default_rng(0).uniform(-6, 6, size=decisions).tolist()
+    results = []
+    for name, strategy in PLAY_STRATEGIES.items():
+        def run(strategy=strategy):
+            for state in states:
+                strategy(state)
+        results.append(measure(f"strategy.{name}", run, decisions, "decisions", memory))
+    for name, strategy in COUNT_STRATEGIES.items():
+        def run(strategy=strategy):
+            for state, tc in zip(states, counts):
+                strategy(state, tc)
+        results.append(measure(f"strategy.{name}", run, decisions, "decisions", memory))
+    return results
+
+
+def bench_simulators(hand_counts, deck_counts, memory):
+    results = []
+    for hands in hand_counts:
+        for name, strategy in (("basic", basic_strategy), ("basic_table", BASIC_STRATEGY_TABLE)):
+            results.append(measure(
+                f"simulate_strategy[{name}]",
+                lambda: simulate_strategy(strategy, num_hands=hands, initial_credits=0.0, rng=0),
+                hands, "hands", memory, hands=hands))
+            results.append(measure(
+                f"simulate_martingale_strategy[{name}]",
+                lambda: simulate_martingale_strategy(strategy, num_hands=hands,
+                                                     initial_credits=1e12, rng=0),
+                hands, "hands", memory, hands=hands))
+        for decks in deck_counts:
+            for name, strategy in (("index_play", index_play_strategy), ("index_play_table", INDEX_PLAY_TABLE)):
+                results.append(measure(
+                    f"simulate_card_counting_strategy[{name}]",
+                    lambda: simulate_card_counting_strategy(strategy, num_hands=hands,
+                                                            initial_credits=1e12,
+                                                            num_decks=decks, rng=0),
+                    hands, "hands", memory, decks=decks, hands=hands))
+    return results
+
+
+def bench_trajectory(hand_counts, memory):
+    results = []
+    for hands in hand_counts:
+        runs = 10
+        max_hands = max(1, hands // runs)
+        results.append(measure(
+            "build_trajectory[basic_table]",
+            lambda: build_trajectory(simulate_strategy, BASIC_STRATEGY_TABLE,
+                                     runs=runs, max_hands=max_hands),
+            runs * max_hands, "hands", memory, runs=runs, max_hands=max_hands))
+    return results
+
+
+def bench_batch(hand_counts, deck_counts, memory):
+    results = []
+    tables = 1000
+    for decks in deck_counts:
+        for hands in hand_counts:
+            rounds = max(1, hands // tables)
+
+            def run():
+                engine = BatchBlackjackGame(tables, num_decks=decks, rng=0)
+                for _ in range(rounds):
+                    engine.play_round(BASIC_STRATEGY_TABLE)
+
+            results.append(measure("BatchBlackjackGame.play_round[basic_table]", run,
+                                   rounds * tables, "hands", memory,
+                                   decks=decks, tables=tables, rounds=rounds))
+    return results
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Blackjack performance benchmarks")
+    parser.add_argument("--hands", type=int, nargs="+", default=[1000, 10000],
+                        help="Hand counts to benchmark (default: 1000 10000)")
+    parser.add_argument("--decks", type=int, nargs="+", default=[1, 4, 6],
+                        help="Deck counts to benchmark (default: 1 4 6)")
+    parser.add_argument("--decisions", type=int, default=20000,
+                        help="Decisions per strategy benchmark (default: 20000)")
+    parser.add_argument("--quick", action="store_true",
+                        help="Small sizes for a smoke run")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the tracemalloc peak-memory pass")
+    parser.add_argument("--output", type=str, default="benchmarks.json",
+                        help="JSON results file (default: benchmarks.json)")
+    args = parser.parse_args()
+    if args.quick:
+        args.hands, args.decks, args.decisions = [500], [4], 2000
+    return args
+
+
+def main():
+    """Main entry point for the script."""
+    args = parse_arguments()
+    memory = not args.no_memory
+
+    print("Benchmarking...")
+    results = []
+    results += bench_game(args.hands, args.decks, memory)
+    results += bench_strategies(args.decisions, memory)
+    results += bench_simulators(args.hands, args.decks, memory)
+    results += bench_trajectory(args.hands, memory)
+    results += bench_batch(args.hands, args.decks, memory)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
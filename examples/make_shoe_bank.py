@@ -0,0 +1,17 @@
+import argparse
+from blackjack_game.shoe_bank import write_shoe_bank
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate a memory-mapped shoe bank")
+    parser.add_argument("path", help="Output .npy file")
+    parser.add_argument("--shoes", type=int, default=1000000, help="Number of shoes (default: 1000000)")
+    parser.add_argument("--decks", type=int, default=4, help="Decks per shoe (default: 4)")
+    parser.add_argument("--seed", type=int, default=None, help="Master seed")
+    args = parser.parse_args()
+    write_shoe_bank(args.path, args.shoes, num_decks=args.decks, rng=args.seed)
+    print(f"Wrote {args.shoes} {args.decks}-deck shoes to {args.path}")
+
+
+if __name__ == '__main__':
+    main()
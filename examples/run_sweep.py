@@ -0,0 +1,51 @@
+"""
+Parameter sweep over betting strategies, play strategies, decks, bets and credits.
+
+Every combination of the given values is one cell of `--runs` sessions; cells
+run across a process pool and finished cells are checkpointed, so rerunning an
+interrupted sweep with the same arguments only plays the missing cells.
+
+Usage:
+    python run_sweep.py --bet-strategy fixed martingale card_counting --play-strategy basic index_play \
+        --decks 2 6 --bet 1 5 --credits 500 1000 --runs 20 --seed 1 \
+        --checkpoint sweep.jsonl --out sweep.csv
+"""
+import argparse
+import time
+from blackjack_game.sweep import BET_STRATEGIES, PLAY_STRATEGIES, sweep_grid, run_sweep, write_sweep_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blackjack parameter sweep")
+    parser.add_argument("--bet-strategy", nargs="+", default=["fixed"], choices=BET_STRATEGIES.keys())
+    parser.add_argument("--play-strategy", nargs="+", default=["basic"], choices=PLAY_STRATEGIES.keys())
+    parser.add_argument("--decks", nargs="+", type=int, default=[6])
+    parser.add_argument("--bet", nargs="+", type=float, default=[1.0])
+    parser.add_argument("--credits", nargs="+", type=float, default=[1000.0])
+    parser.add_argument("--hands", type=int, default=1000, help="Hands per session (default: 1000)")
+    parser.add_argument("--runs", type=int, default=10, help="Sessions per cell (default: 10)")
+    parser.add_argument("--seed", type=int, default=None, help="Master seed (required with --checkpoint)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--checkpoint", default=None, help="JSON-lines file of finished cells")
+    parser.add_argument("--out", default="sweep.csv", help="Results table (default: sweep.csv)")
+    args = parser.parse_args()
+    if args.checkpoint and args.seed is None:
+        parser.error("--checkpoint needs --seed (a resumed sweep must reuse the same seed)")
+
+    configs = sweep_grid(bet_strategy=args.bet_strategy, play_strategy=args.play_strategy,
+                         decks=args.decks, bet=args.bet, credits=args.credits,
+                         hands=args.hands, runs=args.runs)
+    start = time.time()
+
+    def progress(done, total):
+        print(f"\r{done}/{total} cells ({time.time() - start:.1f}s)", end="", flush=True)
+
+    rows = run_sweep(configs, seed=args.seed, workers=args.workers, checkpoint=args.checkpoint,
+                     progress=progress)
+    print()
+    write_sweep_table(rows, args.out)
+    print(f"Wrote {len(rows)} cells to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,9 @@ For help:
 # List all available strategies
 # - python run_user_input.py --list-strategies
 
+# Simulate until the EV per hand is known to +-0.005 (95% CI) or 60 seconds pass
+# - python run_user_input.py --bet-strategy fixed --play-strategy basic --tolerance 0.005 --confidence 0.95 --time-budget 60
+
 import argparse
 import time
 from typing import Callable, Dict, Any
@@ -43,7 +46,10 @@ from blackjack_game import (
     index_play_strategy,
     
     # Game
-    BlackjackGame
+    BlackjackGame,
+
+    # Adaptive simulation
+    simulate_until_converged,
 )
 
 # Define betting strategy descriptions
@@ -136,32 +142,28 @@ def run_simulation(args):
         print(f"  Base Bet: {args.bet}")
         print(f"  Number of Decks: {args.decks}")
     
+    # Keyword arguments each betting strategy expects
+    if args.bet_strategy == "fixed":
+        sim_kwargs = dict(bet=args.bet)
+    elif args.bet_strategy == "martingale":
+        sim_kwargs = dict(initial_bet=args.bet)
+    elif args.bet_strategy == "card_counting":
+        sim_kwargs = dict(base_bet=args.bet, num_decks=args.decks)
+
+    if args.tolerance is not None:
+        run_adaptive(args, bet_strategy, play_function, sim_kwargs)
+        return
+
     print("\nSimulating...", end="", flush=True)
     start_time = time.time()
     
     # Run the simulation with appropriate parameters
-    if args.bet_strategy == "fixed":
-        final_credits = bet_strategy(
-            play_function,
-            num_hands=args.hands,
-            initial_credits=args.credits,
-            bet=args.bet
-        )
-    elif args.bet_strategy == "martingale":
-        final_credits = bet_strategy(
-            play_function,
-            num_hands=args.hands,
-            initial_credits=args.credits,
-            initial_bet=args.bet
-        )
-    elif args.bet_strategy == "card_counting":
-        final_credits = bet_strategy(
-            play_function,
-            num_hands=args.hands,
-            initial_credits=args.credits,
-            base_bet=args.bet,
-            num_decks=args.decks
-        )
+    final_credits = bet_strategy(
+        play_function,
+        num_hands=args.hands,
+        initial_credits=args.credits,
+        **sim_kwargs
+    )
     
     elapsed_time = time.time() - start_time
     print(f" done in {elapsed_time:.2f} seconds.")
@@ -177,6 +179,33 @@ def run_simulation(args):
     print(f"  ROI: {roi:.2f}%")
     print(f"  Average Profit Per Hand: {profit/args.hands:.4f}")
 
+def run_adaptive(args, bet_strategy, play_function, sim_kwargs):
+    """Simulate in batches until the requested precision (or budget) is reached."""
+    target = f"{args.confidence:.0%} CI half-width" if args.confidence else "standard error"
+    print(f"  Target: {target} <= {args.tolerance}")
+    print("\nSimulating...", end="", flush=True)
+
+    result = simulate_until_converged(
+        bet_strategy,
+        play_function,
+        tolerance=args.tolerance,
+        confidence=args.confidence,
+        batch_hands=args.hands,
+        time_budget=args.time_budget,
+        initial_credits=args.credits,
+        **sim_kwargs
+    )
+    print(f" done in {result['elapsed']:.2f} seconds.")
+
+    print("\nRESULTS:")
+    print(f"  Converged: {'yes' if result['converged'] else 'no (budget exhausted)'}")
+    print(f"  Hands Used: {result['hands']} ({result['batches']} sessions of {args.hands})")
+    print(f"  Average Profit Per Hand: {result['ev_per_hand']:.5f}")
+    print(f"  Standard Error: {result['std_error']:.5f}")
+    if args.confidence:
+        print(f"  {args.confidence:.0%} CI: [{result['ci_low']:.5f}, {result['ci_high']:.5f}]")
+    print(f"  ROI Per Hand: {result['roi_per_hand'] * 100:.4f}%")
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Blackjack Strategy Simulator")
@@ -207,6 +236,15 @@ def parse_arguments():
     parser.add_argument("--decks", type=int, default=6,
                         help="Number of decks for card counting (default: 6)")
     
+    # Adaptive mode: --hands becomes the session (batch) length
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="Simulate until the standard error of profit per hand "
+                             "(or CI half-width with --confidence) is at most this")
+    parser.add_argument("--confidence", type=float, default=None,
+                        help="Confidence level for --tolerance, e.g. 0.95")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="Stop adaptive simulation after this many seconds")
+    
     args = parser.parse_args()
     
     if args.bet_strategy and not args.play_strategy:
@@ -16,6 +16,7 @@ setup(
     ],
     extras_require={                       
         "dev": ["pytest", "black", "mypy"],
+        "jit": ["numba"],
     },
     author="Rufushv1",
     author_email="rufushv@gmail.com",
@@ -1,4 +1,4 @@
-from .bj import BlackjackGame
+from .bj import BlackjackGame, resolve_rng, make_game, HI_LO_TAGS
 from .bj_bots import (
     # Core functionality
     compute_payout,
@@ -6,6 +6,9 @@ from .bj_bots import (
     simulate_strategy,
     simulate_martingale_strategy,
     simulate_card_counting_strategy,
+    simulate_rules_strategy,
+    simulate_bet_policy,
+    record_outcomes,
     hi_lo_value,
     
     # Strategy implementations
@@ -15,18 +18,109 @@ from .bj_bots import (
     basic_strategy_ignoring_count,
     index_play_strategy,
 )
-from .strategy_tester import main as run_strategy_test
+from .bj_rules import (
+    TableRules,
+    RulesBlackjackGame,
+    RulesStrategy,
+    full_basic_strategy,
+    FULL_BASIC_STRATEGY,
+)
+from .table import MAX_SEATS, Seat, BlackjackTable, simulate_table
+from .strategy_tables import (
+    StrategyTable,
+    compile_strategy,
+    compile_count_strategy,
+    BASIC_STRATEGY_TABLE,
+    HIT_UNTIL_19_TABLE,
+    ALWAYS_STAND_TABLE,
+    INDEX_PLAY_TABLE,
+    load_strategy_table,
+)
+from .solver import count_composition, hand_evs, solve_strategy, solve_count_strategy, index_plays
+from .rl import VectorBlackjackEnv, TabularTrainer
+from .bj_batch import BatchBlackjackGame, batch_payout, simulate_batch_strategy, simulate_batch_counting
+from .betting import (
+    BetPolicy,
+    FlatBet,
+    Martingale,
+    Paroli,
+    Fibonacci,
+    CountRamp,
+    KellyBet,
+    replay_policy,
+    compare_policies,
+)
+from .risk import (
+    payout_distribution,
+    risk_metrics,
+    bankroll_distribution,
+    risk_of_ruin,
+    bankroll_percentiles,
+)
+from .counting import (
+    CountingSystem,
+    COUNTING_SYSTEMS,
+    register_counting_system,
+    get_counting_system,
+    tag_matrix,
+)
+from .online_stats import TrajectoryStats
+from .adaptive import simulate_until_converged
+from .variance import (
+    deal_common_rounds,
+    antithetic_rounds,
+    play_rounds,
+    control_variates,
+    estimate_mean,
+    compare_strategies,
+)
+from .parallel import spawn_seeds, run_parallel, parallel_trajectory, parallel_trajectory_stats
+from .sweep import sweep_grid, run_cell, run_sweep, write_sweep_table
+from .dealer_cache import DealerCache, pack_shoe, composition
+from .bj_ev import (
+    DEALER_OUTCOMES,
+    DEALER_CACHE,
+    full_shoe,
+    remove_cards,
+    dealer_outcome_probs,
+    stand_outcome,
+    decision_evs,
+    optimal_action,
+    strategy_ev,
+)
+from .event_log import HAND_COLUMNS, HandLogWriter, HandLog
+from .shoe_bank import write_shoe_bank, ShoeBank, BankedBlackjackGame
+from .checkpoint import CHECKPOINT_EVERY, save_checkpoint, load_checkpoint
+from .jit import HAVE_NUMBA, session_kernel
+from .strategy_tester import main as run_strategy_test, build_trajectory, build_trajectory_stats
 
 __all__ = [
     # Core classes
     "BlackjackGame",
     
+    "BatchBlackjackGame",
+    "RulesBlackjackGame",
+    "TableRules",
+    "BlackjackTable",
+    "Seat",
+    "MAX_SEATS",
+    
     # Core functions
+    "resolve_rng",
+    "make_game",
+    "HI_LO_TAGS",
     "compute_payout",
     "simulate_strategy",
     "simulate_martingale_strategy",
     "simulate_card_counting_strategy",
+    "simulate_rules_strategy",
+    "simulate_table",
+    "simulate_bet_policy",
+    "record_outcomes",
     "hi_lo_value",
+    "batch_payout",
+    "simulate_batch_strategy",
+    "simulate_batch_counting",
     
     # Strategy implementations
     "basic_strategy",
@@ -34,7 +128,111 @@ __all__ = [
     "hit_until_19_strategy",
     "basic_strategy_ignoring_count",
     "index_play_strategy",
+    "RulesStrategy",
+    "full_basic_strategy",
+    "FULL_BASIC_STRATEGY",
+    
+    # Bet policies
+    "BetPolicy",
+    "FlatBet",
+    "Martingale",
+    "Paroli",
+    "Fibonacci",
+    "CountRamp",
+    "KellyBet",
+    "replay_policy",
+    "compare_policies",
+    
+    # Bankroll risk
+    "payout_distribution",
+    "risk_metrics",
+    "bankroll_distribution",
+    "risk_of_ruin",
+    "bankroll_percentiles",
+    
+    # Counting systems
+    "CountingSystem",
+    "COUNTING_SYSTEMS",
+    "register_counting_system",
+    "get_counting_system",
+    "tag_matrix",
+    
+    # Compiled strategy tables
+    "StrategyTable",
+    "compile_strategy",
+    "compile_count_strategy",
+    "BASIC_STRATEGY_TABLE",
+    "HIT_UNTIL_19_TABLE",
+    "ALWAYS_STAND_TABLE",
+    "INDEX_PLAY_TABLE",
+    "load_strategy_table",
+    "HAVE_NUMBA",
+    "session_kernel",
+    
+    # Strategy solver
+    "count_composition",
+    "hand_evs",
+    "solve_strategy",
+    "solve_count_strategy",
+    "index_plays",
+    
+    # Reinforcement learning
+    "VectorBlackjackEnv",
+    "TabularTrainer",
+    
+    # Parallel runners
+    "spawn_seeds",
+    "run_parallel",
+    "parallel_trajectory",
+    "parallel_trajectory_stats",
+    "sweep_grid",
+    "run_cell",
+    "run_sweep",
+    "write_sweep_table",
+    
+    # Streaming statistics
+    "TrajectoryStats",
+    "simulate_until_converged",
+    
+    # Variance reduction
+    "deal_common_rounds",
+    "antithetic_rounds",
+    "play_rounds",
+    "control_variates",
+    "estimate_mean",
+    "compare_strategies",
+    
+    # Exact expected values
+    "DealerCache",
+    "pack_shoe",
+    "composition",
+    "DEALER_OUTCOMES",
+    "DEALER_CACHE",
+    "full_shoe",
+    "remove_cards",
+    "dealer_outcome_probs",
+    "stand_outcome",
+    "decision_evs",
+    "optimal_action",
+    "strategy_ev",
+    
+    # Hand-level event logs
+    "HAND_COLUMNS",
+    "HandLogWriter",
+    "HandLog",
+    
+    # Pre-shuffled shoe banks
+    "write_shoe_bank",
+    "ShoeBank",
+    "BankedBlackjackGame",
+    
+    # Checkpoints
+    "CHECKPOINT_EVERY",
+    "save_checkpoint",
+    "load_checkpoint",
     
     # Testing
     "run_strategy_test",
+    "build_trajectory",
+    "build_trajectory_stats",
 ]
\ No newline at end of file
@@ -0,0 +1,68 @@
+import math
+import time
+from statistics import NormalDist
+import numpy as np
+
+# Convergence-driven simulation: keep playing independent sessions of
+# batch_hands hands until the standard error (or confidence-interval
+# half-width) of the mean profit per hand is within tolerance, or until a
+# time/hand budget runs out. The standard error comes from batch means, so it
+# stays valid for bet systems whose hands are not independent (Martingale,
+# count ramps).
+
+
+def simulate_until_converged(sim_fn, strategy_fn, tolerance: float = 0.01, confidence: float = None,
+                             batch_hands: int = 1000, min_batches: int = 10, max_hands: int = None,
+                             time_budget: float = None, seed=None, initial_credits: float = 100.0,
+                             **kwargs) -> dict:
+    """
+    Run sim_fn(strategy_fn, num_hands=batch_hands, return_history=True, rng=...)
+    in batches until the precision target is met.
+    - tolerance: target standard error of profit per hand, or, when
+      confidence is given (e.g. 0.95), target confidence-interval half-width
+    - max_hands / time_budget (seconds): stop early, reported as not converged;
+      every batch has batch_hands hands, so max_hands below one batch raises ValueError
+    Returns a dict with ev_per_hand, std_error, ci_low, ci_high, roi_per_hand
+    (ev_per_hand / initial_credits), hands, batches, elapsed and converged.
+    """
+    if max_hands is not None and max_hands < batch_hands:
+        raise ValueError(f"max_hands={max_hands} does not fit one batch of {batch_hands} hands; "
+                         "lower batch_hands.")
+    z = NormalDist().inv_cdf(0.5 + confidence / 2) if confidence else 1.0
+    seeds = np.random.SeedSequence(seed)
+    start = time.perf_counter()
+
+    batches, mean, m2 = 0, 0.0, 0.0
+    converged = False
+    while True:
+        rng = int(seeds.spawn(1)[0].generate_state(1)[0])
+        history = sim_fn(strategy_fn, num_hands=batch_hands, return_history=True,
+                         rng=rng, initial_credits=initial_credits, **kwargs)
+        batch_mean = (history[-1] - initial_credits) / batch_hands
+        batches += 1
+        delta = batch_mean - mean
+        mean += delta / batches
+        m2 += delta * (batch_mean - mean)
+
+        se = math.sqrt(m2 / (batches - 1) / batches) if batches > 1 else math.inf
+        if batches >= min_batches and z * se <= tolerance:
+            converged = True
+            break
+        if max_hands is not None and (batches + 1) * batch_hands > max_hands:
+            break
+        if time_budget is not None and time.perf_counter() - start >= time_budget:
+            break
+
+    half_width = z * se
+    return {
+        'ev_per_hand': mean,
+        'std_error': se,
+        'confidence': confidence,
+        'ci_low': mean - half_width,
+        'ci_high': mean + half_width,
+        'roi_per_hand': mean / initial_credits,
+        'hands': batches * batch_hands,
+        'batches': batches,
+        'elapsed': time.perf_counter() - start,
+        'converged': converged,
+    }
@@ -0,0 +1,178 @@
+import math
+from abc import ABC, abstractmethod
+import numpy as np
+
+# Bet policies, separated from card play. A hand's profit is linear in the
+# stake (stake * units, units = profit per unit bet), so hands can be played
+# once at a unit bet and any number of policies replayed over the recorded
+# outcome stream (see record_outcomes) without dealing a card again.
+#
+# Policy protocol:
+# - reset(): start a new session
+# - bet(bankroll, true_count) -> stake for the next hand (0 sits the hand out)
+# - settle(stake, profit): update progression state with the hand's result
+# Simulators cap the stake at the bankroll and stop once it is gone.
+
+
+class BetPolicy(ABC):
+    """Base class for bet policies (see module comment for the protocol)."""
+    def reset(self):
+        pass
+
+    @abstractmethod
+    def bet(self, bankroll: float, true_count: float = 0.0) -> float:
+        """Stake for the next hand."""
+
+    def settle(self, stake: float, profit: float):
+        pass
+
+
+class FlatBet(BetPolicy):
+    """Same stake every hand."""
+    def __init__(self, unit: float = 1.0):
+        self.unit = unit
+
+    def bet(self, bankroll: float, true_count: float = 0.0) -> float:
+        return self.unit
+
+
+class Martingale(BetPolicy):
+    """
+    Double the (capped) stake after a loss, back to unit after a win, same
+    after a push; max_bet caps the progression (e.g. the table maximum).
+    """
+    def __init__(self, unit: float = 1.0, max_bet: float = math.inf):
+        self.unit = unit
+        self.max_bet = max_bet
+        self.reset()
+
+    def reset(self):
+        self._next = self.unit
+
+    def bet(self, bankroll: float, true_count: float = 0.0) -> float:
+        return min(self._next, self.max_bet)
+
+    def settle(self, stake: float, profit: float):
+        if profit < 0:
+            self._next = stake * 2
+        elif profit > 0:
+            self._next = self.unit
+
+
+class Paroli(BetPolicy):
+    """Double after each win for up to `presses` wins, back to unit after a loss or a full run."""
+    def __init__(self, unit: float = 1.0, presses: int = 3):
+        self.unit = unit
+        self.presses = presses
+        self.reset()
+
+    def reset(self):
+        self._wins = 0
+
+    def bet(self, bankroll: float, true_count: float = 0.0) -> float:
+        return self.unit * 2 ** self._wins
+
+    def settle(self, stake: float, profit: float):
+        if profit > 0:
+            self._wins = 0 if self._wins + 1 >= self.presses else self._wins + 1
+        elif profit < 0:
+            self._wins = 0
+
+
+class Fibonacci(BetPolicy):
+    """Stake follows 1, 1, 2, 3, 5, ... units: one step up after a loss, two back after a win."""
+    def __init__(self, unit: float = 1.0):
+        self.unit = unit
+        self._sequence = [1, 1]
+        self.reset()
+
+    def reset(self):
+        self._step = 0
+
+    def bet(self, bankroll: float, true_count: float = 0.0) -> float:
+        while self._step >= len(self._sequence):
+            self._sequence.append(self._sequence[-1] + self._sequence[-2])
+        return self.unit * self._sequence[self._step]
+
+    def settle(self, stake: float, profit: float):
+        if profit < 0:
+            self._step += 1
+        elif profit > 0:
+            self._step = max(0, self._step - 2)
+
+
+class CountRamp(BetPolicy):
+    """
+    Count-based ramp: unit * int(true_count), clamped to [table_min, table_max]
+    (table_min defaults to one unit, i.e. unit * max(1, int(true_count))).
+    wong_out: sit out (stake 0) while the true count is below it.
+    """
+    def __init__(self, unit: float = 1.0, table_min: float = None, table_max: float = math.inf,
+                 wong_out: float = None):
+        self.unit = unit
+        self.table_min = unit if table_min is None else table_min
+        self.table_max = table_max
+        self.wong_out = wong_out
+
+    def bet(self, bankroll: float, true_count: float = 0.0) -> float:
+        if self.wong_out is not None and true_count < self.wong_out:
+            return 0.0
+        return min(max(self.unit * int(true_count), self.table_min), self.table_max)
+
+
+class KellyBet(BetPolicy):
+    """
+    Fractional Kelly: fraction * bankroll * edge / variance, with the edge
+    modelled as base_edge + edge_per_count * true_count (defaults: about
+    -0.5% off the top and +0.5% per Hi-Lo true count; variance 1.33 per hand).
+    Bets table_min (0 = sit out) when the edge is not positive, and at most table_max.
+    """
+    def __init__(self, fraction: float = 0.5, base_edge: float = -0.005, edge_per_count: float = 0.005,
+                 variance: float = 1.33, table_min: float = 0.0, table_max: float = math.inf):
+        self.fraction = fraction
+        self.base_edge = base_edge
+        self.edge_per_count = edge_per_count
+        self.variance = variance
+        self.table_min = table_min
+        self.table_max = table_max
+
+    def bet(self, bankroll: float, true_count: float = 0.0) -> float:
+        edge = self.base_edge + self.edge_per_count * true_count
+        if edge <= 0:
+            return self.table_min
+        return min(max(self.fraction * bankroll * edge / self.variance, self.table_min), self.table_max)
+
+
+def replay_policy(policy: BetPolicy, outcomes: dict, initial_credits: float = 100.0,
+                  return_history: bool = False):
+    """
+    Apply a bet policy to a recorded outcome stream ({'units', 'true_count'},
+    see record_outcomes): hand h pays stake * units[h]. Stakes are capped by
+    the bankroll and betting stops once it is gone.
+    Returns the final credits, or with return_history the credits after
+    every hand (hands after going broke repeat the final credits).
+    """
+    units = np.asarray(outcomes['units'], dtype=float).tolist()
+    counts = np.asarray(outcomes['true_count'], dtype=float).tolist()
+    policy.reset()
+    credits = initial_credits
+    history = [] if return_history else None
+    for u, tc in zip(units, counts):
+        if credits <= 0:
+            break
+        stake = min(policy.bet(credits, tc), credits)
+        profit = stake * u
+        credits += profit
+        policy.settle(stake, profit)
+        if history is not None:
+            history.append(credits)
+    if history is not None:
+        return history + [credits] * (len(units) - len(history))
+    return credits
+
+
+def compare_policies(policies: dict, outcomes: dict, initial_credits: float = 100.0,
+                     return_history: bool = False) -> dict:
+    """replay_policy for every {name: policy} over the same outcome stream."""
+    return {name: replay_policy(policy, outcomes, initial_credits, return_history)
+            for name, policy in policies.items()}
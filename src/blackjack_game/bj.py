@@ -1,4 +1,44 @@
 import random
+import numpy as np
+
+def resolve_rng(rng=None):
+    """
+    Normalise an rng argument to an object used for shuffling:
+    - None: the module-level `random` (global state, legacy behaviour)
+    - int: a private random.Random seeded with it
+    - random.Random: used as is
+    - numpy Generator, or a BitGenerator such as np.random.PCG64(seed)
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, np.random.BitGenerator):
+        return np.random.Generator(rng)
+    if isinstance(rng, (int, np.integer)):
+        return random.Random(int(rng))
+    if isinstance(rng, (random.Random, np.random.Generator)):
+        return rng
+    raise TypeError(f"Unsupported rng: {rng!r}")
+
+# Hi-Lo tags indexed by card value (index 0 unused, 1 = ace)
+HI_LO_TAGS = (0, -1, 1, 1, 1, 1, 1, 0, 0, 0, -1)
+
+def make_game(num_decks: int = None, rng=None, penetration: float = None, tags=None) -> "BlackjackGame":
+    """
+    Game used by the simulators: shoe sources that deal their own shoes
+    (anything with make_game, e.g. ShoeBank) build it; otherwise a
+    BlackjackGame shuffling with rng.
+    num_decks=None means the source's own shoe size (4 decks when shuffling).
+    """
+    if hasattr(rng, 'make_game'):
+        return rng.make_game(num_decks, penetration=penetration, tags=tags)
+    return BlackjackGame(num_decks=num_decks or 4, rng=rng, penetration=penetration, tags=tags)
+
+def counting_penetration(num_decks: int):
+    """
+    Default cut card of the counting simulators: reshuffle with one deck left.
+    A single deck has no cut card (None: only the reshuffle below 15 cards).
+    """
+    return 1 - 1 / num_decks if num_decks > 1 else None
 
 class BlackjackGame:
     """Simple Blackjack environment for bots:
@@ -6,38 +46,183 @@ class BlackjackGame:
        - Aces = 1 or 11
        - Dealer hits to 17
        - step('hit') or step('stand') → (state, reward, done)
+       - rng: seed or generator used for shuffling (see resolve_rng)
+       - penetration: share of the shoe dealt before the cut card; the shoe
+         is reshuffled before the next round once it is passed (None: only
+         the mid-round reshuffle below 15 cards)
+       - tags: count tags indexed by card value (default HI_LO_TAGS)
+    Hands are tracked incrementally (hard total, ace flag, card count), so the
+    tuple API deal()/hit()/stand() never re-sums a hand or builds a state dict.
+    The shoe keeps its running count of every card drawn since the last
+    shuffle, so running_count / true_count are O(1) and reset on reshuffle.
     """
-    def __init__(self, num_decks: int = 4):
+    __slots__ = ('num_decks', 'rng', 'deck', 'done', '_player', '_dealer',
+                 'player_total', 'player_ace', 'player_cards',
+                 'dealer_total', 'dealer_ace', 'dealer_cards',
+                 'penetration', 'tags', 'running_count', '_reshuffle_at')
+
+    def __init__(self, num_decks: int = 4, rng=None, penetration: float = None, tags=None):
+        if penetration is not None and not 0 < penetration <= 1:
+            raise ValueError("penetration must be in (0, 1].")
         self.num_decks = num_decks
+        self.rng = resolve_rng(rng)
+        self.penetration = penetration
+        self.tags = HI_LO_TAGS if tags is None else tuple(tags)
+        if len(self.tags) != 11:
+            raise ValueError("tags must have 11 entries (index = card value, 1 = ace).")
+        shoe_size = 52 * num_decks
+        # reshuffle before a round once fewer cards than this remain
+        self._reshuffle_at = 0 if penetration is None else shoe_size - round(penetration * shoe_size)
         self._build_deck()
+        self.player = []
+        self.dealer = []
+        self.done = True
 
     def _build_deck(self):
         # One deck has: A=1×4, 2–9 each 4×, 10/J/Q/K = 16× total
         base = [1]*4 + [2]*4 + [3]*4 + [4]*4 + [5]*4 + \
                [6]*4 + [7]*4 + [8]*4 + [9]*4 + [10]*16
         self.deck = base * self.num_decks
-        random.shuffle(self.deck)
+        if isinstance(self.rng, np.random.Generator):
+            self.deck = self.rng.permutation(self.deck).tolist()
+        else:
+            self.rng.shuffle(self.deck)
+        self.running_count = 0
 
     def _draw(self) -> int:
         if len(self.deck) < 15:  # reshuffle if low
             self._build_deck()
-        return self.deck.pop()
+        card = self.deck.pop()
+        self.running_count += self.tags[card]
+        return card
+
+    def shuffle_if_due(self) -> bool:
+        """Reshuffle if the cut card has been passed; call between rounds."""
+        if len(self.deck) < self._reshuffle_at:
+            self._build_deck()
+            return True
+        return False
+
+    @property
+    def cards_dealt(self) -> int:
+        """Cards drawn since the last shuffle."""
+        return 52 * self.num_decks - len(self.deck)
+
+    @property
+    def true_count(self) -> float:
+        """Running count per remaining deck (at least one deck)."""
+        return self.running_count / max(1, len(self.deck) / 52)
 
-    def _hand_value(self, hand: list[int]) -> int:
+    @staticmethod
+    def _hand_value(hand: list[int]) -> int:
         total = sum(hand)
         # if there's at least one ace (1) and treating one ace as 11 doesn't bust:
         if 1 in hand and total + 10 <= 21:
             return total + 10
         return total
 
+    # Assigning a hand directly (e.g. in tests) resyncs the incremental fields
+    @property
+    def player(self) -> list[int]:
+        return self._player
+
+    @player.setter
+    def player(self, hand: list[int]):
+        self._player = hand
+        self.player_total = sum(hand)
+        self.player_ace = 1 in hand
+        self.player_cards = len(hand)
+
+    @property
+    def dealer(self) -> list[int]:
+        return self._dealer
+
+    @dealer.setter
+    def dealer(self, hand: list[int]):
+        self._dealer = hand
+        self.dealer_total = sum(hand)
+        self.dealer_ace = 1 in hand
+        self.dealer_cards = len(hand)
+
+    def player_value(self) -> tuple[int, bool]:
+        """(best value, is_soft) of the player's hand."""
+        if self.player_ace and self.player_total <= 11:
+            return self.player_total + 10, True
+        return self.player_total, False
+
+    def dealer_value(self) -> int:
+        if self.dealer_ace and self.dealer_total <= 11:
+            return self.dealer_total + 10
+        return self.dealer_total
+
+    # Low-level API: plain ints/tuples, no per-step dicts or hand copies
+
+    def deal(self) -> tuple[int, bool, int]:
+        """Start a new round. Returns (player value, is_soft, dealer upcard)."""
+        if len(self.deck) < self._reshuffle_at:
+            self._build_deck()
+        p1, p2 = self._draw(), self._draw()
+        d1, d2 = self._draw(), self._draw()
+        # fresh lists: a hand assigned through the setters stays the caller's
+        self._player = [p1, p2]
+        self._dealer = [d1, d2]
+        self.player_total = p1 + p2
+        self.player_ace = p1 == 1 or p2 == 1
+        self.player_cards = 2
+        self.dealer_total = d1 + d2
+        self.dealer_ace = d1 == 1 or d2 == 1
+        self.dealer_cards = 2
+        self.done = False
+        value, soft = self.player_value()
+        return value, soft, d1
+
+    def hit(self) -> tuple[int, bool]:
+        """Player draws. Returns (player value, is_soft); value > 21 is a bust (reward -1)."""
+        if self.done:
+            raise RuntimeError("Round over — call reset() to start again.")
+        card = self._draw()
+        self._player.append(card)
+        self.player_total += card
+        self.player_cards += 1
+        if card == 1:
+            self.player_ace = True
+        if self.player_total > 21:
+            self.done = True
+            return self.player_total, False
+        return self.player_value()
+
+    def stand(self) -> int:
+        """Dealer plays out. Returns reward: +1 win, 0 tie, -1 loss."""
+        if self.done:
+            raise RuntimeError("Round over — call reset() to start again.")
+        while self.dealer_value() < 17:
+            card = self._draw()
+            self._dealer.append(card)
+            self.dealer_total += card
+            self.dealer_cards += 1
+            if card == 1:
+                self.dealer_ace = True
+
+        player_val, _ = self.player_value()
+        dealer_val = self.dealer_value()
+        self.done = True
+
+        if dealer_val > 21:
+            return +1
+        elif dealer_val > player_val:
+            return -1
+        elif dealer_val < player_val:
+            return +1
+        return 0
+
+    # Dict API (compatibility wrapper around the tuple API)
+
     def reset(self) -> dict:
         """Start a new round. Returns initial state."""
-        self.player = [self._draw(), self._draw()]
-        self.dealer = [self._draw(), self._draw()]
-        self.done = False
+        self.deal()
         return {
-            'player_hand': self.player.copy(),
-            'dealer_upcard': self.dealer[0]
+            'player_hand': self._player.copy(),
+            'dealer_upcard': self._dealer[0]
         }
 
     def step(self, action: str) -> tuple[dict, int, bool]:
@@ -51,46 +236,21 @@ class BlackjackGame:
 
         # Player hits
         if action == 'hit':
-            self.player.append(self._draw())
-            if self._hand_value(self.player) > 21:
-                self.done = True
-                return (
-                    {'player_hand': self.player.copy(),
-                     'dealer_upcard': self.dealer[0]},
-                    -1,  # player bust
-                    True
-                )
-            else:
-                return (
-                    {'player_hand': self.player.copy(),
-                     'dealer_upcard': self.dealer[0]},
-                    0,
-                    False
-                )
+            value, _ = self.hit()
+            state = {'player_hand': self._player.copy(),
+                     'dealer_upcard': self._dealer[0]}
+            if value > 21:
+                return state, -1, True  # player bust
+            return state, 0, False
 
         # Player stands → dealer’s turn
         elif action == 'stand':
-            while self._hand_value(self.dealer) < 17:
-                self.dealer.append(self._draw())
-
-            player_val = self._hand_value(self.player)
-            dealer_val = self._hand_value(self.dealer)
-
-            if dealer_val > 21:
-                reward = +1
-            elif dealer_val > player_val:
-                reward = -1
-            elif dealer_val < player_val:
-                reward = +1
-            else:
-                reward = 0
-
-            self.done = True
+            reward = self.stand()
             return (
                 {
-                    'player_hand': self.player.copy(),
-                    'dealer_upcard': self.dealer[0],
-                    'dealer_hand': self.dealer.copy()
+                    'player_hand': self._player.copy(),
+                    'dealer_upcard': self._dealer[0],
+                    'dealer_hand': self._dealer.copy()
                 },
                 reward,
                 True
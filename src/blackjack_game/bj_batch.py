@@ -0,0 +1,197 @@
+import numpy as np
+from .strategy_tables import StrategyTable
+from .bj import counting_penetration
+from .counting import get_counting_system, tag_matrix
+
+# Card ranks as dealt by BlackjackGame: A=1, 2-9, 10/J/Q/K=10
+_ONE_DECK = np.array([1]*4 + [2]*4 + [3]*4 + [4]*4 + [5]*4 +
+                     [6]*4 + [7]*4 + [8]*4 + [9]*4 + [10]*16, dtype=np.uint8)
+
+
+def _values(total: np.ndarray, has_ace: np.ndarray):
+    """Vectorised BlackjackGame._hand_value → (value, is_soft)."""
+    soft = has_ace & (total + 10 <= 21)
+    return np.where(soft, total + 10, total), soft
+
+
+class BatchBlackjackGame:
+    """N independent BlackjackGame tables played in lock-step:
+       - each table owns a shoe of num_decks decks stored as a uint8 row
+       - same rules as BlackjackGame (reshuffle below 15 cards, dealer
+         stands on all 17s, deal order player, player, dealer, dealer)
+       - rng: anything np.random.default_rng accepts (seed, PCG64, Generator)
+       - strategies are StrategyTable lookups applied to every table at once
+       - keeps a histogram of the cards dealt from each shoe since its
+         shuffle, so any counting system's count is one dot product
+       - system: counting system used by true_count() (default Hi-Lo)
+       - penetration: as BlackjackGame, reshuffle between rounds past the cut
+    """
+    def __init__(self, num_tables: int, num_decks: int = 4, rng=None, system='hi-lo',
+                 penetration: float = None):
+        self.num_tables = num_tables
+        self.num_decks = num_decks
+        self.rng = np.random.default_rng(rng)
+        self.system = get_counting_system(system)
+        self.shoe_size = len(_ONE_DECK) * num_decks
+        self._reshuffle_at = 0 if penetration is None else self.shoe_size - round(penetration * self.shoe_size)
+        self.shoes = np.empty((num_tables, self.shoe_size), dtype=np.uint8)
+        self.pos = np.zeros(num_tables, dtype=np.int64)
+        self.dealt = np.zeros((num_tables, 11), dtype=np.int64)
+        self._shuffle(np.arange(num_tables))
+
+    def _shuffle(self, idx: np.ndarray):
+        fresh = np.tile(np.tile(_ONE_DECK, self.num_decks), (len(idx), 1))
+        self.shoes[idx] = self.rng.permuted(fresh, axis=1)
+        self.pos[idx] = 0
+        self.dealt[idx] = 0
+
+    def _draw(self, idx: np.ndarray) -> np.ndarray:
+        low = self.shoe_size - self.pos[idx] < 15
+        if low.any():
+            self._shuffle(idx[low])
+        cards = self.shoes[idx, self.pos[idx]].astype(np.int64)
+        self.pos[idx] += 1
+        self.dealt[idx, cards] += 1
+        return cards
+
+    def shuffle_if_due(self):
+        """Reshuffle the shoes that have passed the cut card."""
+        due = np.flatnonzero(self.shoe_size - self.pos < self._reshuffle_at)
+        if len(due):
+            self._shuffle(due)
+
+    @property
+    def running_count(self) -> np.ndarray:
+        """Running count per table with the system's published tags."""
+        return self.dealt @ self.system.tags
+
+    def true_counts(self, systems) -> np.ndarray:
+        """(num_tables, len(systems)) true counts, in betting units, from one matrix product."""
+        decks_remaining = np.maximum(1, (self.shoe_size - self.pos) / 52)
+        return (self.dealt @ tag_matrix(systems).T) / decks_remaining[:, None]
+
+    def true_count(self) -> np.ndarray:
+        """True count per table for self.system (deck estimate as simulate_card_counting_strategy)."""
+        return self.true_counts([self.system])[:, 0]
+
+    def _hits(self, strategy: StrategyTable, value, soft, upcard, true_count) -> np.ndarray:
+        if strategy.counted:
+            ci = np.clip(np.floor(true_count).astype(np.int64), strategy.min_count, strategy.max_count)
+            return strategy.table[ci - strategy.min_count, soft.astype(np.int64), value, upcard]
+        return strategy.table[soft.astype(np.int64), value, upcard]
+
+    def play_round(self, strategy: StrategyTable, true_count: np.ndarray = None):
+        """
+        Play one hand on every table.
+        Returns (reward, is_blackjack) arrays of length num_tables:
+          reward: +1 win, 0 tie, -1 loss (as BlackjackGame.step)
+          is_blackjack: initial two cards total 21
+        Count-indexed strategies use true_count (default: current true count).
+        """
+        if not isinstance(strategy, StrategyTable):
+            raise TypeError("strategy must be a StrategyTable (see compile_strategy).")
+        self.shuffle_if_due()
+        if strategy.counted and true_count is None:
+            true_count = self.true_count()
+
+        every = np.arange(self.num_tables)
+        p_total = self._draw(every)
+        p_ace = p_total == 1
+        card = self._draw(every)
+        p_total += card
+        p_ace |= card == 1
+        upcard = self._draw(every)
+        card = self._draw(every)
+        d_total = upcard + card
+        d_ace = (upcard == 1) | (card == 1)
+
+        value, soft = _values(p_total, p_ace)
+        is_blackjack = value == 21
+        busted = np.zeros(self.num_tables, dtype=bool)
+
+        # Player decisions: tables still hitting move together
+        playing = every
+        while len(playing):
+            value, soft = _values(p_total[playing], p_ace[playing])
+            tc = true_count[playing] if strategy.counted else None
+            playing = playing[self._hits(strategy, value, soft, upcard[playing], tc)]
+            if not len(playing):
+                break
+            card = self._draw(playing)
+            p_total[playing] += card
+            p_ace[playing] |= card == 1
+            bust = p_total[playing] > 21
+            busted[playing[bust]] = True
+            playing = playing[~bust]
+
+        # Dealer draws to 17 on tables where the player stood
+        drawing = np.flatnonzero(~busted)
+        while len(drawing):
+            d_value, _ = _values(d_total[drawing], d_ace[drawing])
+            drawing = drawing[d_value < 17]
+            if not len(drawing):
+                break
+            card = self._draw(drawing)
+            d_total[drawing] += card
+            d_ace[drawing] |= card == 1
+
+        player_val, _ = _values(p_total, p_ace)
+        dealer_val, _ = _values(d_total, d_ace)
+        reward = np.where(dealer_val > 21, 1, np.sign(player_val - dealer_val))
+        reward[busted] = -1
+        return reward.astype(np.int8), is_blackjack
+
+
+def batch_payout(is_blackjack: np.ndarray, reward: np.ndarray, bet) -> np.ndarray:
+    """Vectorised compute_payout."""
+    win = np.where(is_blackjack, 1.5, 1.0) * bet
+    return np.where(reward == 1, win, np.where(reward == -1, -1.0 * bet, 0.0))
+
+
+def simulate_batch_strategy(strategy: StrategyTable, num_hands: int = 100, num_tables: int = 1000,
+                            initial_credits: float = 100.0, bet: float = 1.0,
+                            num_decks: int = 4, rng=None) -> np.ndarray:
+    """
+    Flat-bet simulation (as simulate_strategy) on num_tables tables at once.
+    Returns the final credits of every table.
+    """
+    engine = BatchBlackjackGame(num_tables, num_decks=num_decks, rng=rng)
+    credits = np.full(num_tables, initial_credits, dtype=float)
+    for _ in range(num_hands):
+        reward, is_blackjack = engine.play_round(strategy)
+        credits += batch_payout(is_blackjack, reward, bet)
+    return credits
+
+
+def simulate_batch_counting(strategy: StrategyTable, systems=('hi-lo',), num_hands: int = 100,
+                            num_tables: int = 1000, initial_credits: float = 100.0, base_bet: float = 1.0,
+                            num_decks: int = 6, penetration: float = None, rng=None,
+                            return_history: bool = False) -> np.ndarray:
+    """
+    Bet-ramp sweep over counting systems (as simulate_card_counting_strategy)
+    on num_tables tables at once. Every system bets
+    base_bet * max(1, int(true_count)) on the same dealt cards; count-indexed
+    strategies play from the first system's true count.
+    - penetration: default reshuffles with one deck left (see counting_penetration)
+    Returns final credits of shape (len(systems), num_tables), or with
+    return_history credits after every hand, shape (len(systems), num_tables, num_hands).
+    Tables stop betting once broke.
+    """
+    systems = [get_counting_system(s) for s in systems]
+    if penetration is None:
+        penetration = counting_penetration(num_decks)
+    engine = BatchBlackjackGame(num_tables, num_decks=num_decks, rng=rng, system=systems[0],
+                                penetration=penetration)
+    credits = np.full((len(systems), num_tables), initial_credits, dtype=float)
+    history = np.empty((len(systems), num_tables, num_hands)) if return_history else None
+    for h in range(num_hands):
+        engine.shuffle_if_due()
+        tc = engine.true_counts(systems)
+        bets = np.minimum(base_bet * np.maximum(1, np.trunc(tc.T)), np.maximum(credits, 0))
+        reward, is_blackjack = engine.play_round(strategy, true_count=tc[:, 0])
+        credits += batch_payout(is_blackjack, reward, bets)
+        if history is not None:
+            history[:, :, h] = credits
+    if history is not None:
+        return history
+    return credits
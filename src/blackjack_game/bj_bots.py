@@ -1,4 +1,11 @@
-from .bj import BlackjackGame
+import hashlib
+import numpy as np
+from .bj import BlackjackGame, make_game, counting_penetration
+from .bj_rules import RulesBlackjackGame
+from .counting import get_counting_system
+from .betting import Martingale, CountRamp
+from .checkpoint import CHECKPOINT_EVERY, save_checkpoint, load_checkpoint
+from .jit import HAVE_NUMBA, session_kernel
 
 # Setting up profit structure
 def compute_payout(is_blackjack: bool, reward: int, bet: float) -> float:
@@ -18,68 +25,259 @@ def compute_payout(is_blackjack: bool, reward: int, bet: float) -> float:
 
 # This whole section simulates the game and controls betting values
 
+def _pad_history(history: list, credits: float, num_hands: int) -> list:
+    """Repeat the final credits for hands never played (session ended early)."""
+    history.extend([credits] * (num_hands - len(history)))
+    return history
+
+def _play_hand(game: BlackjackGame, strategy_fn, true_count: float = None) -> tuple[int, bool]:
+    """
+    Play one round and return (reward, is_blackjack).
+    Table strategies (anything with a lookup(value, is_soft, upcard) method,
+    e.g. StrategyTable) run on the tuple API without building state dicts.
+    With a true_count, it is passed on: strategy_fn(state, true_count).
+    """
+    lookup = getattr(strategy_fn, 'lookup', None)
+    if lookup is not None:
+        value, soft, upcard = game.deal()
+        is_blackjack = value == 21
+        if true_count is None:
+            while value <= 21 and lookup(value, soft, upcard):
+                value, soft = game.hit()
+        else:
+            while value <= 21 and lookup(value, soft, upcard, true_count):
+                value, soft = game.hit()
+        return (-1 if value > 21 else game.stand()), is_blackjack
+
+    state = game.reset()
+    is_blackjack = game._hand_value(state['player_hand']) == 21
+    done = False
+    args = () if true_count is None else (true_count,)
+    while not done:
+        action = strategy_fn(state, *args)
+        state, reward, done = game.step(action)
+    return reward, is_blackjack
+
 #Keeps betting constant with 1 credit bets
-def simulate_strategy(strategy_fn, num_hands: int = 100, initial_credits: float = 100.0, bet: float = 1.0) -> float:
+def simulate_strategy(strategy_fn, num_hands: int = 100, initial_credits: float = 100.0, bet: float = 1.0,
+                      return_history: bool = False, rng=None, sink=None, jit: bool = None):
     """
     Simulate `num_hands` rounds of blackjack with a given strategy function.
     strategy_fn(state) -> 'hit' or 'stand'
+    If return_history is True, returns the list of credits after each hand
+    instead of only the final credits.
+    rng: seed or generator for the shoe (see resolve_rng), or a ShoeBank.
+    sink: optional hand log (e.g. HandLogWriter) receiving one row per hand.
+    jit: play StrategyTable strategies with the session kernel (jit.py),
+    same results; None uses it when numba is installed. Count-indexed
+    tables, shoe banks and sinks always take the Python path.
     """
-    game = BlackjackGame()
+    from .strategy_tables import StrategyTable  # strategy_tables imports this module
+    game = make_game(rng=rng)
+    if jit is None:
+        jit = HAVE_NUMBA
+    is_table = isinstance(strategy_fn, StrategyTable) and not strategy_fn.counted
+    if jit and is_table and type(game) is BlackjackGame and sink is None:
+        return _simulate_table_session(game, strategy_fn, num_hands, initial_credits, bet, return_history)
     credits = initial_credits
+    history = [] if return_history else None
 
     for _ in range(num_hands):
-        state = game.reset()
-        player_hand = state['player_hand']
-        is_blackjack = game._hand_value(player_hand) == 21
-        done = False
-
-        while not done:
-            action = strategy_fn(state)
-            state, reward, done = game.step(action)
-
+        reward, is_blackjack = _play_hand(game, strategy_fn)
         payout = compute_payout(is_blackjack, reward, bet)
         credits += payout
+        if sink is not None:
+            sink.record(game, bet, payout)
+        if history is not None:
+            history.append(credits)
 
+    if history is not None:
+        return history
     return credits
 
-# Apply martignale strategy on betting amount
-def simulate_martingale_strategy(strategy_fn, num_hands: int = 100, initial_credits: float = 100.0, initial_bet: float = 1.0) -> float:
+def _simulate_table_session(game: BlackjackGame, table, num_hands: int, initial_credits: float, bet: float,
+                            return_history: bool):
+    """simulate_strategy for a StrategyTable without count index via session_kernel."""
+    deck = np.array(game.deck, dtype=np.uint8)
+    history = np.empty(num_hands if return_history else 0)
+    h, top, credits = 0, len(deck), initial_credits
+    while True:
+        h, top, credits = session_kernel(deck, top, table.table, num_hands, h, credits, bet, history,
+                                         game._reshuffle_at)
+        if h == num_hands:
+            break
+        # This hand reshuffles: play it on the game with its own rng
+        game.deck = deck[:top].tolist()
+        reward, is_blackjack = _play_hand(game, table)
+        credits += compute_payout(is_blackjack, reward, bet)
+        if return_history:
+            history[h] = credits
+        h += 1
+        deck = np.array(game.deck, dtype=np.uint8)
+        top = len(deck)
+    game.deck = deck[:top].tolist()
+    if return_history:
+        return history.tolist()
+    return credits
+
+# Flat betting under a full rule set (double, split, surrender, insurance, peek)
+def simulate_rules_strategy(strategy, num_hands: int = 100, initial_credits: float = 100.0, bet: float = 1.0,
+                            rules=None, insure: bool = False, return_history: bool = False, rng=None, sink=None):
     """
-    Simulate `num_hands` rounds of blackjack using the Martingale betting system:
-    - Double bet after each loss
-    - Reset bet to `initial_bet` after each win
-    - Keep bet same after a tie
-    - Bet is capped by remaining credits
-    Uses `strategy_fn` (e.g., basic strategy) for decisions.
+    Simulate `num_hands` rounds on a RulesBlackjackGame with flat bets.
+    strategy: a RulesStrategy (e.g. FULL_BASIC_STRATEGY), a StrategyTable or
+    strategy_fn(state) -> action (see RulesBlackjackGame.play_round).
+    rules: TableRules (default: 4 decks, S17, DAS, 3:2, late surrender, peek).
+    If return_history is True, returns the list of credits after each hand
+    instead of only the final credits.
+    rng: seed or generator for the shoe (see resolve_rng).
+    sink: optional hand log (e.g. HandLogWriter) receiving one row per round.
     """
-    game = BlackjackGame()
+    game = RulesBlackjackGame(rules=rules, rng=rng)
     credits = initial_credits
-    bet = initial_bet
+    history = [] if return_history else None
 
     for _ in range(num_hands):
-        if credits <= 0:
-            break
-        current_bet = min(bet, credits)
+        payout = game.play_round(strategy, bet, insure)
+        credits += payout
+        if sink is not None:
+            sink.record(game, bet, payout)
+        if history is not None:
+            history.append(credits)
 
-        state = game.reset()
-        player_hand = state['player_hand']
-        is_blackjack = game._hand_value(player_hand) == 21
-        done = False
+    if history is not None:
+        return history
+    return credits
 
-        while not done:
-            action = strategy_fn(state)
-            state, reward, done = game.step(action)
+def _strategy_id(strategy_fn) -> str:
+    """Name of strategy_fn for checkpoint parameters (StrategyTables by content)."""
+    from .strategy_tables import StrategyTable  # strategy_tables imports this module
+    if isinstance(strategy_fn, StrategyTable):
+        digest = hashlib.sha1(np.ascontiguousarray(strategy_fn.table).tobytes()).hexdigest()
+        return f"StrategyTable(min_count={strategy_fn.min_count}, sha1={digest})"
+    name = getattr(strategy_fn, '__qualname__', type(strategy_fn).__qualname__)
+    return f"{getattr(strategy_fn, '__module__', '')}.{name}"
+
+def _policy_id(policy) -> dict:
+    """Type and constructor parameters (public attributes) of a bet policy."""
+    return {'type': type(policy).__name__,
+            **{name: value for name, value in vars(policy).items() if not name.startswith('_')}}
+
+# Single simulation core for pluggable bet policies (see betting.py)
+def simulate_bet_policy(strategy_fn, policy, num_hands: int = 100, initial_credits: float = 100.0,
+                        num_decks: int = None, penetration: float = None, system='hi-lo',
+                        play_with_count: bool = False, return_history: bool = False, rng=None, sink=None,
+                        checkpoint: str = None, checkpoint_every: int = CHECKPOINT_EVERY):
+    """
+    Simulate `num_hands` rounds betting policy.bet(credits, true_count) each hand.
+    - stakes are capped by the remaining credits; play stops once broke
+    - a stake of 0 sits the hand out (its cards are still dealt)
+    - the shoe counts with `system` (see COUNTING_SYSTEMS) and reshuffles past
+      `penetration`; play_with_count calls strategy_fn(state, true_count)
+    If return_history is True, returns the list of credits after each hand;
+    hands after going broke repeat the final credits.
+    rng: seed or generator for the shoe (see resolve_rng), or a ShoeBank.
+    sink: optional hand log (e.g. HandLogWriter) receiving one row per hand,
+    with the running and true count the bet was based on.
+    checkpoint: file the full loop state is saved to every checkpoint_every
+    hands and at the end; if it exists the run resumes from it (rng is then
+    ignored) and returns exactly what an uninterrupted run would. A finished
+    checkpoint is returned unchanged whatever rng is passed. A checkpoint of
+    another strategy, policy (type or parameters) or setting raises ValueError.
+    """
+    system = get_counting_system(system)
+    state = None
+    if checkpoint is not None:
+        if sink is not None:
+            raise ValueError("sink cannot be combined with checkpoint.")
+        params = dict(num_hands=num_hands, initial_credits=initial_credits, num_decks=num_decks,
+                      penetration=penetration, system=system.name, play_with_count=play_with_count,
+                      return_history=return_history, strategy=_strategy_id(strategy_fn),
+                      policy=_policy_id(policy))
+        state = load_checkpoint(checkpoint, params)
+    if state is None:
+        game = make_game(num_decks=num_decks, rng=rng, penetration=penetration, tags=system.scalar_tags())
+        policy.reset()
+        credits = initial_credits
+        history = [] if return_history else None
+        start = 0
+    else:
+        game, credits, history, start = state['game'], state['credits'], state['history'], state['hand']
+        if type(state['policy']) is not type(policy):
+            raise ValueError(f"{checkpoint} holds a {type(state['policy']).__name__}, not a {type(policy).__name__}.")
+        vars(policy).update(vars(state['policy']))
 
-        payout = compute_payout(is_blackjack, reward, current_bet)
-        credits += payout
+    def save(hand):
+        save_checkpoint(checkpoint, dict(params=params, hand=hand, game=game, policy=policy,
+                                         credits=credits, history=history))
 
-        if payout < 0:
-            bet = current_bet * 2
-        elif payout > 0:
-            bet = initial_bet
+    for h in range(start, num_hands):
+        if credits <= 0:
+            break
+        game.shuffle_if_due()
+        true_count = game.true_count
+        bet_count = game.running_count
+        stake = min(policy.bet(credits, true_count), credits)
 
+        reward, is_blackjack = _play_hand(game, strategy_fn, true_count if play_with_count else None)
+        payout = compute_payout(is_blackjack, reward, stake)
+        credits += payout
+        policy.settle(stake, payout)
+        if sink is not None:
+            sink.record(game, stake, payout, bet_count, true_count)
+        if history is not None:
+            history.append(credits)
+        if checkpoint is not None and (h + 1) % checkpoint_every == 0:
+            save(h + 1)
+
+    if checkpoint is not None:
+        save(num_hands)
+    if history is not None:
+        return _pad_history(history, credits, num_hands)
     return credits
 
+def record_outcomes(strategy_fn, num_hands: int = 100, num_decks: int = None, penetration: float = None,
+                    system='hi-lo', play_with_count: bool = False, rng=None) -> dict:
+    """
+    Play num_hands hands at a unit bet and return the outcome stream used by
+    replay_policy / compare_policies:
+    - 'units': profit per unit bet of each hand
+    - 'true_count': the shoe's true count before each hand
+    Shoe arguments as simulate_bet_policy.
+    """
+    tags = get_counting_system(system).scalar_tags()
+    game = make_game(num_decks=num_decks, rng=rng, penetration=penetration, tags=tags)
+    units = np.empty(num_hands)
+    counts = np.empty(num_hands)
+    for h in range(num_hands):
+        game.shuffle_if_due()
+        true_count = game.true_count
+        reward, is_blackjack = _play_hand(game, strategy_fn, true_count if play_with_count else None)
+        units[h] = compute_payout(is_blackjack, reward, 1.0)
+        counts[h] = true_count
+    return {'units': units, 'true_count': counts}
+
+# Apply martignale strategy on betting amount
+def simulate_martingale_strategy(strategy_fn, num_hands: int = 100, initial_credits: float = 100.0, initial_bet: float = 1.0,
+                                 return_history: bool = False, rng=None, sink=None,
+                                 checkpoint: str = None, checkpoint_every: int = CHECKPOINT_EVERY):
+    """
+    Simulate `num_hands` rounds of blackjack using the Martingale betting system:
+    - Double bet after each loss
+    - Reset bet to `initial_bet` after each win
+    - Keep bet same after a tie
+    - Bet is capped by remaining credits
+    Uses `strategy_fn` (e.g., basic strategy) for decisions.
+    If return_history is True, returns the list of credits after each hand;
+    hands after going broke repeat the final credits.
+    rng: seed or generator for the shoe (see resolve_rng), or a ShoeBank.
+    sink: optional hand log (e.g. HandLogWriter) receiving one row per hand.
+    checkpoint / checkpoint_every: periodic snapshots to resume from (see simulate_bet_policy).
+    """
+    return simulate_bet_policy(strategy_fn, Martingale(initial_bet), num_hands=num_hands,
+                               initial_credits=initial_credits, return_history=return_history,
+                               rng=rng, sink=sink, checkpoint=checkpoint, checkpoint_every=checkpoint_every)
+
 def hi_lo_value(card: int) -> int:
     """
     Hi-Lo count value:
@@ -98,50 +296,38 @@ def simulate_card_counting_strategy(
     num_hands: int = 100,
     initial_credits: float = 100.0,
     base_bet: float = 1.0,
-    num_decks: int = 6
-) -> float:
+    num_decks: int = 6,
+    return_history: bool = False,
+    rng=None,
+    sink=None,
+    penetration: float = None,
+    system='hi-lo',
+    checkpoint: str = None,
+    checkpoint_every: int = CHECKPOINT_EVERY
+):
     """
-    Hi-Lo card counting with index plays and bet ramp:
-    - Tracks running and true count
+    Card counting with index plays and bet ramp:
+    - The shoe tracks the running and true count on every draw
     - Bets = base_bet * max(1, int(true_count))
     - Uses strategy_fn(state, true_count) for play decisions
+    - penetration: share of the shoe dealt before the cut card
+      (default: reshuffle with one deck left, see counting_penetration)
+    - system: counting system name or CountingSystem (see COUNTING_SYSTEMS);
+      counts are in its balanced betting units (CountingSystem.bet_tags)
+    If return_history is True, returns the list of credits after each hand;
+    hands after going broke repeat the final credits.
+    rng: seed or generator for the shoe (see resolve_rng), or a ShoeBank.
+    sink: optional hand log (e.g. HandLogWriter) receiving one row per hand,
+    with the running and true count the bet was based on.
+    checkpoint / checkpoint_every: periodic snapshots to resume from (see simulate_bet_policy).
     """
-    game = BlackjackGame(num_decks=num_decks)
-    credits = initial_credits
-    running_count = 0
-
-    for _ in range(num_hands):
-        decks_remaining = max(1, len(game.deck) / 52)
-        true_count = running_count / decks_remaining
-        bet = base_bet * max(1, int(true_count))
-        bet = min(bet, credits)
-
-        state = game.reset()
-        player_cards = state['player_hand']
-        dealer_up = state['dealer_upcard']
-        for c in player_cards + [dealer_up]:
-            running_count += hi_lo_value(c)
-
-        done, reward = False, 0
-        while not done:
-            action = strategy_fn(state, true_count)
-            state, reward, done = game.step(action)
-            if action == 'hit' and not done:
-                running_count += hi_lo_value(state['player_hand'][-1])
-
-        for c in state.get('dealer_hand', [])[1:]:
-            running_count += hi_lo_value(c)
-
-        is_bj = game._hand_value(player_cards) == 21
-        credits += compute_payout(is_bj, reward, bet)
-
-        if len(game.deck) < 52:
-            game._build_deck()
-            running_count = 0
-        if credits <= 0:
-            break
-
-    return credits
+    if penetration is None:
+        penetration = counting_penetration(num_decks)
+    return simulate_bet_policy(strategy_fn, CountRamp(base_bet), num_hands=num_hands,
+                               initial_credits=initial_credits, num_decks=num_decks,
+                               penetration=penetration, system=system, play_with_count=True,
+                               return_history=return_history, rng=rng, sink=sink,
+                               checkpoint=checkpoint, checkpoint_every=checkpoint_every)
 
 # Strategy implementations deciding when you hit or stand
 
@@ -155,8 +341,7 @@ def hit_until_19_strategy(state):
     Hit until the hand value is at least 19, then stand.
     state['player_hand'] is a list of ints representing card values (1 for Ace).
     """
-    game = BlackjackGame()
-    current_value = game._hand_value(state['player_hand'])
+    current_value = BlackjackGame._hand_value(state['player_hand'])
     return 'hit' if current_value < 19 else 'stand'
 
 def basic_strategy(state):
@@ -171,7 +356,6 @@ def basic_strategy(state):
     """
     cards = state['player_hand']
     dealer_up = state['dealer_upcard']
-    game = BlackjackGame()
     total = sum(cards)
     ace_count = cards.count(1)
     soft_total = total + 10 if ace_count > 0 and total + 10 <= 21 else total
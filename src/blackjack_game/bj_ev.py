@@ -0,0 +1,147 @@
+from functools import lru_cache
+from .dealer_cache import DealerCache, pack_shoe
+from .strategy_tables import StrategyTable, compile_strategy
+
+# Exact expected values under BlackjackGame's rules:
+# - dealer draws to 17 and stands on all 17s, no peek (the hole card is
+#   simply the dealer's next unseen card)
+# - a player natural that wins pays 3:2 (compute_payout)
+# A shoe is a tuple of 10 remaining counts, index 0 = aces ... index 9 = tens;
+# internally it is packed into bytes (see dealer_cache.pack_shoe).
+# Every recursion removes the drawn card, so results are exact for the shoe
+# composition given; subresults are memoised on that composition.
+
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, 'bust')
+DEALER_CACHE = DealerCache()
+
+
+def full_shoe(num_decks: int = 4) -> tuple:
+    """Card counts for a fresh shoe of num_decks decks."""
+    return (4 * num_decks,) * 9 + (16 * num_decks,)
+
+
+def remove_cards(shoe: tuple, cards) -> tuple:
+    """Shoe with the given cards (1-10) taken out."""
+    counts = list(shoe)
+    for c in cards:
+        if counts[c - 1] <= 0:
+            raise ValueError(f"No {c} left in shoe.")
+        counts[c - 1] -= 1
+    return tuple(counts)
+
+
+def _draws(shoe: bytes):
+    """(card, probability, remaining shoe) for every card that can be drawn."""
+    n = sum(shoe)
+    if n == 0:
+        raise ValueError("Shoe is empty.")
+    for i, count in enumerate(shoe):
+        if count:
+            yield i + 1, count / n, shoe[:i] + bytes((count - 1,)) + shoe[i + 1:]
+
+
+def _value(total: int, ace: bool) -> int:
+    return total + 10 if ace and total <= 11 else total
+
+
+def dealer_outcome_probs(upcard: int, shoe, cache: DealerCache = None) -> tuple:
+    """
+    Probabilities of the dealer finishing on 17, 18, 19, 20, 21 or busting,
+    given the upcard and the unseen shoe (hole card still inside it).
+    Served from `cache` (default: the shared DEALER_CACHE).
+    """
+    return (cache or DEALER_CACHE).probs(upcard, shoe)
+
+
+def stand_outcome(player_value: int, upcard: int, shoe) -> tuple:
+    """(P(win), P(tie), P(loss)) for standing on player_value."""
+    dist = dealer_outcome_probs(upcard, shoe)
+    if player_value > 21:
+        return 0.0, 0.0, 1.0
+    win = dist[5] + sum(dist[i] for i in range(5) if 17 + i < player_value)
+    tie = dist[player_value - 17] if player_value >= 17 else 0.0
+    return win, tie, 1.0 - win - tie
+
+
+def _stand_ev(player_value: int, upcard: int, shoe: bytes, win_mult: float = 1.0) -> float:
+    win, _, loss = stand_outcome(player_value, upcard, shoe)
+    return win_mult * win - loss
+
+
+@lru_cache(maxsize=1 << 20)
+def _optimal(total: int, ace: bool, upcard: int, shoe: bytes) -> tuple:
+    """(EV, action) of the best hit/stand play from a non-bust hand."""
+    stand = _stand_ev(_value(total, ace), upcard, shoe)
+    hit = _hit_ev(total, ace, upcard, shoe)
+    return (hit, 'hit') if hit > stand else (stand, 'stand')
+
+
+def _hit_ev(total: int, ace: bool, upcard: int, shoe: bytes) -> float:
+    ev = 0.0
+    for card, p, rest in _draws(shoe):
+        new_total = total + card
+        ev += p * (-1.0 if new_total > 21 else _optimal(new_total, ace or card == 1, upcard, rest)[0])
+    return ev
+
+
+def _hand_shoe(hand, upcard: int, shoe, num_decks: int) -> bytes:
+    if shoe is None:
+        shoe = remove_cards(full_shoe(num_decks), list(hand) + [upcard])
+    return pack_shoe(shoe)
+
+
+def decision_evs(hand, upcard: int, num_decks: int = 4, shoe=None) -> dict:
+    """
+    Exact EV (per unit bet) of standing and of hitting (then playing
+    optimally) for a player hand vs dealer upcard.
+    shoe defaults to a fresh num_decks shoe minus the hand and upcard.
+    """
+    shoe = _hand_shoe(hand, upcard, shoe, num_decks)
+    total, ace = sum(hand), 1 in hand
+    win_mult = 1.5 if len(hand) == 2 and _value(total, ace) == 21 else 1.0
+    return {
+        'stand': _stand_ev(_value(total, ace), upcard, shoe, win_mult),
+        'hit': _hit_ev(total, ace, upcard, shoe),
+    }
+
+
+def optimal_action(hand, upcard: int, num_decks: int = 4, shoe=None) -> str:
+    """'hit' or 'stand', whichever has the higher exact EV."""
+    evs = decision_evs(hand, upcard, num_decks=num_decks, shoe=shoe)
+    return 'hit' if evs['hit'] > evs['stand'] else 'stand'
+
+
+def strategy_ev(strategy, num_decks: int = 4, true_count: float = 0.0, shoe=None) -> float:
+    """
+    Exact expected profit per unit bet of a hit/stand strategy dealt from
+    `shoe` (default: a fresh num_decks shoe), including 3:2 naturals.
+    strategy is a StrategyTable or a plain strategy_fn(state) (compiled first);
+    count-indexed tables are evaluated at true_count.
+    """
+    if not isinstance(strategy, StrategyTable):
+        strategy = compile_strategy(strategy)
+    shoe = pack_shoe(full_shoe(num_decks) if shoe is None else shoe)
+    memo = {}
+
+    def play(total, ace, upcard, rest, natural):
+        key = (total, ace, upcard, rest, natural)
+        if key not in memo:
+            value = _value(total, ace)
+            if strategy.lookup(value, ace and total <= 11, upcard, true_count):
+                ev = 0.0
+                for card, p, after in _draws(rest):
+                    new_total = total + card
+                    ev += p * (-1.0 if new_total > 21 else
+                               play(new_total, ace or card == 1, upcard, after, False))
+            else:
+                ev = _stand_ev(value, upcard, rest, 1.5 if natural else 1.0)
+            memo[key] = ev
+        return memo[key]
+
+    ev = 0.0
+    for p1, q1, s1 in _draws(shoe):
+        for p2, q2, s2 in _draws(s1):
+            for up, q3, s3 in _draws(s2):
+                total, ace = p1 + p2, p1 == 1 or p2 == 1
+                ev += q1 * q2 * q3 * play(total, ace, up, s3, _value(total, ace) == 21)
+    return ev
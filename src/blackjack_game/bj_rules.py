@@ -0,0 +1,342 @@
+import math
+from .bj import BlackjackGame
+
+# Full-rules blackjack: dealer peek, insurance, double, split (resplits, split
+# aces), late surrender and configurable table rules. BlackjackGame's hit/stand
+# tuple API is reused for the common case; the extra actions are only offered
+# on a hand's first decision, so later decisions run the plain hit/stand loop.
+
+HIT, STAND, DOUBLE, SPLIT, SURRENDER = 'hit', 'stand', 'double', 'split', 'surrender'
+_HIT_STAND = (HIT, STAND)
+
+
+class TableRules:
+    """
+    Table rules for RulesBlackjackGame:
+    - hit_soft_17: dealer hits soft 17 (H17) instead of standing (S17)
+    - blackjack_payout: 1.5 for 3:2, 1.2 for 6:5
+    - double_after_split (DAS); double_on: None (any two cards) or the hard
+      totals doubling is allowed on, e.g. (9, 10, 11)
+    - max_hands: hands a player may split to (4 = resplit up to three times)
+    - resplit_aces / hit_split_aces: split aces otherwise get one card each
+    - surrender: late surrender (after the peek) of the unsplit first hand
+    - peek: dealer checks for blackjack under an ace or ten; without a peek
+      (European no-hole-card) a dealer blackjack takes every bet
+    - insurance: insurance is offered when the upcard is an ace
+    - penetration: share of the shoe dealt before the cut card (see BlackjackGame)
+    """
+    __slots__ = ('num_decks', 'penetration', 'hit_soft_17', 'blackjack_payout', 'double_after_split', 'double_on',
+                 'max_hands', 'resplit_aces', 'hit_split_aces', 'surrender', 'peek', 'insurance')
+
+    def __init__(self, num_decks: int = 4, hit_soft_17: bool = False, blackjack_payout: float = 1.5,
+                 double_after_split: bool = True, double_on=None, max_hands: int = 4,
+                 resplit_aces: bool = False, hit_split_aces: bool = False, surrender: bool = True,
+                 peek: bool = True, insurance: bool = True, penetration: float = None):
+        if max_hands < 1:
+            raise ValueError("max_hands must be at least 1.")
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.hit_soft_17 = hit_soft_17
+        self.blackjack_payout = blackjack_payout
+        self.double_after_split = double_after_split
+        self.double_on = None if double_on is None else frozenset(double_on)
+        self.max_hands = max_hands
+        self.resplit_aces = resplit_aces
+        self.hit_split_aces = hit_split_aces
+        self.surrender = surrender
+        self.peek = peek
+        self.insurance = insurance
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"TableRules({fields})"
+
+
+# Basic strategy chart codes: 'H' hit, 'S' stand, 'D' double else hit,
+# 'Ds' double else stand, 'P' split, 'Ph' split if DAS else hit,
+# 'Rh'/'Rs'/'Rp' surrender else hit/stand/split. Upcard index 1 is the ace.
+def _row(codes: str, default: str = 'H') -> list:
+    """Chart row from 10 space-separated codes for upcards 2..10, A."""
+    parts = codes.split()
+    return [default] + [parts[9]] + parts[:9]
+
+
+def _basic_chart(hit_soft_17: bool) -> tuple:
+    hard = [_row('H H H H H H H H H H') for _ in range(22)]
+    hard[9] = _row('H D D D D H H H H H')
+    hard[10] = _row('D D D D D D D D H H')
+    hard[11] = _row('D D D D D D D D D ' + ('D' if hit_soft_17 else 'H'))
+    hard[12] = _row('H H S S S H H H H H')
+    for value in (13, 14, 15, 16):
+        hard[value] = _row('S S S S S H H H H H')
+    hard[15] = _row('S S S S S H H H Rh ' + ('Rh' if hit_soft_17 else 'H'))
+    hard[16] = _row('S S S S S H H Rh Rh Rh')
+    for value in range(17, 22):
+        hard[value] = _row('S S S S S S S S S S')
+    if hit_soft_17:
+        hard[17] = _row('S S S S S S S S S Rs')
+
+    soft = [_row('H H H H H H H H H H') for _ in range(22)]
+    soft[13] = soft[14] = _row('H H H D D H H H H H')
+    soft[15] = soft[16] = _row('H H D D D H H H H H')
+    soft[17] = _row('H D D D D H H H H H')
+    soft[18] = _row(('Ds' if hit_soft_17 else 'S') + ' Ds Ds Ds Ds S S H H H')
+    soft[19] = _row('S S S S ' + ('Ds' if hit_soft_17 else 'S') + ' S S S S S')
+    soft[20] = soft[21] = _row('S S S S S S S S S S')
+
+    pairs = [None] * 11
+    pairs[1] = _row('P P P P P P P P P P')
+    pairs[2] = pairs[3] = _row('Ph Ph P P P P H H H H')
+    pairs[4] = _row('H H H Ph Ph H H H H H')
+    pairs[5] = None  # played as hard 10
+    pairs[6] = _row('Ph P P P P H H H H H')
+    pairs[7] = _row('P P P P P P H H H H')
+    pairs[8] = _row('P P P P P P P P P ' + ('Rp' if hit_soft_17 else 'P'))
+    pairs[9] = _row('P P P P P S P P S S')
+    pairs[10] = _row('S S S S S S S S S S')
+    return hard, soft, pairs
+
+
+_FALLBACK = {'H': HIT, 'S': STAND, 'D': HIT, 'Ds': STAND, 'Rh': HIT, 'Rs': STAND}
+
+
+class RulesStrategy:
+    """
+    Chart strategy for RulesBlackjackGame (double/split/surrender aware).
+    decide(hand, value, soft, upcard, actions) returns one of `actions`;
+    codes whose first choice is not allowed fall back as in printed charts,
+    and pairs that are not split are played from the hard/soft chart.
+    """
+    def __init__(self, hard: list, soft: list, pairs: list, double_after_split: bool = True):
+        self.hard = hard
+        self.soft = soft
+        self.pairs = pairs
+        self.double_after_split = double_after_split
+
+    def decide(self, hand: list, value: int, soft: bool, upcard: int, actions: tuple) -> str:
+        code = (self.soft if soft else self.hard)[value][upcard]
+        if actions is _HIT_STAND:
+            return _FALLBACK[code]
+        if SPLIT in actions and self.pairs[hand[0]] is not None:
+            pair_code = self.pairs[hand[0]][upcard]
+            if pair_code == 'P' or (pair_code == 'Ph' and self.double_after_split):
+                return SPLIT
+            if pair_code == 'Rp':
+                return SURRENDER if SURRENDER in actions else SPLIT
+        if HIT not in actions:
+            return STAND
+        if code[0] == 'D' and DOUBLE in actions:
+            return DOUBLE
+        if code[0] == 'R' and SURRENDER in actions:
+            return SURRENDER
+        return _FALLBACK[code]
+
+
+def full_basic_strategy(rules: TableRules = None) -> RulesStrategy:
+    """Multi-deck basic strategy chart for the given rules (S17 or H17)."""
+    rules = rules or TableRules()
+    return RulesStrategy(*_basic_chart(rules.hit_soft_17), double_after_split=rules.double_after_split)
+
+
+FULL_BASIC_STRATEGY = full_basic_strategy()
+
+
+def strategy_decider(strategy) -> tuple:
+    """
+    (decide, lookup) for a strategy: decide(hand, value, soft, upcard, actions)
+    for RulesStrategy-like objects and strategy_fn(state) callables, or
+    lookup(value, is_soft, upcard) for hit/stand tables (decide is then None).
+    """
+    decide = getattr(strategy, 'decide', None)
+    if decide is not None:
+        return decide, None
+    lookup = getattr(strategy, 'lookup', None)
+    if lookup is not None:
+        return None, lookup
+
+    def decide_from_state(hand, value, soft, upcard, actions):
+        return strategy({'player_hand': hand.copy(), 'dealer_upcard': upcard, 'actions': actions})
+    return decide_from_state, None
+
+
+class RulesBlackjackGame(BlackjackGame):
+    """
+    BlackjackGame with a full rule set (see TableRules).
+    - play_round(strategy, bet, insure) plays a whole round and returns the
+      net profit; the tuple API deal()/hit()/stand() still works (with the
+      dealer following rules.hit_soft_17)
+    - strategy: a RulesStrategy (or anything with decide(...)), a hit/stand
+      StrategyTable (played on the tuple API, no per-decision overhead), or
+      strategy_fn(state) -> action where state also lists the legal 'actions'
+    """
+    __slots__ = ('rules', 'hands', 'bets', '_actions')
+
+    def __init__(self, rules: TableRules = None, rng=None, tags=None):
+        self.rules = rules or TableRules()
+        self.hands = []
+        self.bets = []
+        self._actions = {}
+        super().__init__(num_decks=self.rules.num_decks, rng=rng, penetration=self.rules.penetration, tags=tags)
+
+    def _play_dealer(self):
+        h17 = self.rules.hit_soft_17
+        while True:
+            total = self.dealer_total
+            if self.dealer_ace and total <= 11:
+                if total + 10 > 17 or (total == 7 and not h17):
+                    return
+            elif total >= 17:
+                return
+            card = self._draw()
+            self._dealer.append(card)
+            self.dealer_total += card
+            self.dealer_cards += 1
+            if card == 1:
+                self.dealer_ace = True
+
+    def stand(self) -> int:
+        """Dealer plays out under the table rules. Returns +1 win, 0 tie, -1 loss."""
+        if self.done:
+            raise RuntimeError("Round over — call reset() to start again.")
+        self._play_dealer()
+        self.done = True
+        player_val, _ = self.player_value()
+        dealer_val = self.dealer_value()
+        if dealer_val > 21 or dealer_val < player_val:
+            return +1
+        return -1 if dealer_val > player_val else 0
+
+    def _first_actions(self, hand: list, num_hands: int, split_aces: bool) -> tuple:
+        """Legal actions on a two-card hand (memoised: only a few combinations exist)."""
+        rules = self.rules
+        split_hand = num_hands > 1
+        can_split = hand[0] == hand[1] and num_hands < rules.max_hands and \
+            (not split_aces or rules.resplit_aces)
+        can_double = rules.double_on is None or \
+            (hand[0] + hand[1] in rules.double_on and hand[0] != 1 and hand[1] != 1)
+        key = (can_split, can_double, split_hand, split_aces)
+        actions = self._actions.get(key)
+        if actions is None:
+            if split_aces and not rules.hit_split_aces:
+                actions = [STAND]
+            else:
+                actions = [HIT, STAND]
+                if can_double and (not split_hand or rules.double_after_split):
+                    actions.append(DOUBLE)
+            if can_split:
+                actions.append(SPLIT)
+            if rules.surrender and not split_hand:
+                actions.append(SURRENDER)
+            actions = self._actions[key] = tuple(actions)
+        return actions
+
+    def _play_hands(self, hand: list, bet: float, upcard: int, decide,
+                    bankroll: float = math.inf) -> tuple[list, list, bool]:
+        """
+        Play out a two-card (non-natural) hand and any hands split from it.
+        Returns (hands, bets, surrendered); bets are the final stakes.
+        bankroll: most the hands may stake in total; a double or split it
+        cannot cover is not offered (the strategy falls back to hit/stand).
+        """
+        hands, bets = [hand], [bet]
+        split_aces = False
+        i = 0
+        while i < len(hands):
+            hand = hands[i]
+            if len(hand) == 1:
+                hand.append(self._draw())
+            total = hand[0] + hand[1]
+            ace = hand[0] == 1 or hand[1] == 1
+            value, soft = (total + 10, True) if ace and total <= 11 else (total, False)
+
+            actions = self._first_actions(hand, len(hands), split_aces)
+            if sum(bets) + bet > bankroll:
+                actions = tuple(a for a in actions if a != DOUBLE and a != SPLIT)
+            action = decide(hand, value, soft, upcard, actions)
+            if action not in actions:
+                raise ValueError(f"Illegal action {action!r}; allowed: {actions}.")
+            if action == SPLIT:
+                split_aces = hand[0] == 1
+                hands.insert(i + 1, [hand.pop()])
+                bets.insert(i + 1, bet)
+                continue
+            if action == SURRENDER:
+                bets[i] = bet / 2
+                return hands, bets, True
+            if action == DOUBLE:
+                bets[i] *= 2
+                hand.append(self._draw())
+            elif action == HIT:
+                while True:
+                    card = self._draw()
+                    hand.append(card)
+                    total += card
+                    if card == 1:
+                        ace = True
+                    if total > 21:
+                        break
+                    value, soft = (total + 10, True) if ace and total <= 11 else (total, False)
+                    if decide(hand, value, soft, upcard, _HIT_STAND) != HIT:
+                        break
+            i += 1
+        return hands, bets, False
+
+    def _settle(self, hands: list, bets: list) -> float:
+        """Net profit of finished hands against the dealer's final hand."""
+        dealer_val = self.dealer_value()
+        profit = 0.0
+        for hand, stake in zip(hands, bets):
+            total = sum(hand)
+            player_val = total + 10 if 1 in hand and total <= 11 else total
+            if player_val > 21:
+                profit -= stake
+            elif dealer_val > 21 or player_val > dealer_val:
+                profit += stake
+            elif player_val < dealer_val:
+                profit -= stake
+        return profit
+
+    def play_round(self, strategy, bet: float = 1.0, insure: bool = False) -> float:
+        """
+        Play one round and return the net profit.
+        - insure: take insurance (half the bet, pays 2:1) when offered
+        After the round, self.hands / self.bets hold every played hand and its
+        final stake; self.player is the first hand.
+        """
+        decide, lookup = strategy_decider(strategy)
+        rules = self.rules
+        value, soft, upcard = self.deal()
+        hole = self._dealer[1]
+        dealer_bj = (upcard == 1 and hole == 10) or (upcard == 10 and hole == 1)
+        player_bj = value == 21
+        self.hands = [self._player]
+        self.bets = [bet]
+
+        profit = 0.0
+        if insure and rules.insurance and upcard == 1:
+            profit += bet if dealer_bj else -bet / 2
+        if dealer_bj and (rules.peek or player_bj):
+            self.done = True
+            return profit if player_bj else profit - bet
+        if player_bj:
+            self.done = True
+            return profit + bet * rules.blackjack_payout
+        if lookup is not None:
+            # Fast path for hit/stand tables: the plain tuple-API loop
+            if dealer_bj:  # no peek: the hand is lost whatever the player does
+                self.done = True
+                return profit - bet
+            while value <= 21 and lookup(value, soft, upcard):
+                value, soft = self.hit()
+            return profit + (-bet if value > 21 else self.stand() * bet)
+
+        self.hands, self.bets, surrendered = self._play_hands(self._player, bet, upcard, decide)
+        self.player = self.hands[0]
+        self.done = True
+        if surrendered:
+            return profit - self.bets[0]
+        if dealer_bj:  # no peek: dealer blackjack takes every bet
+            return profit - sum(self.bets)
+        if any(sum(hand) <= 21 for hand in self.hands):
+            self._play_dealer()
+        return profit + self._settle(self.hands, self.bets)
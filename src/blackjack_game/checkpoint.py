@@ -0,0 +1,58 @@
+import os
+import pickle
+import random
+import zlib
+
+# Checkpoints for long simulations: the complete loop state (the game with its
+# shoe, running count and RNG, the bet policy's progression, credits, hand
+# index and history) pickled, zlib-compressed and written atomically, so a
+# killed run leaves either the previous snapshot or the new one, never a torn
+# file. Resuming restores every piece of state the next hand depends on, so
+# the result is the same as an uninterrupted run.
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_EVERY = 100_000
+
+
+def save_checkpoint(path: str, state: dict):
+    """
+    Write state (must contain 'game') to path. A game shuffling with the
+    module-level `random` stores that generator's state with it.
+    """
+    game = state['game']
+    uses_global = game.rng is random
+    if uses_global:
+        game.rng = None  # modules do not pickle
+    try:
+        blob = pickle.dumps({**state, 'version': CHECKPOINT_VERSION,
+                             'global_random': random.getstate() if uses_global else None},
+                            protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        if uses_global:
+            game.rng = random
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(zlib.compress(blob, 1))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str, params: dict = None):
+    """
+    State saved by save_checkpoint, or None if path does not exist.
+    params: the run's parameters; a checkpoint saved with different ones
+    raises ValueError instead of silently resuming another run.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        state = pickle.loads(zlib.decompress(f.read()))
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a version {CHECKPOINT_VERSION} checkpoint.")
+    if params is not None and state.get('params') != params:
+        raise ValueError(f"{path} was saved by a run with different parameters: {state.get('params')}.")
+    if state['global_random'] is not None:
+        random.setstate(state['global_random'])
+        state['game'].rng = random
+    return state
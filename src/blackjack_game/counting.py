@@ -0,0 +1,92 @@
+import numpy as np
+
+# Card-counting systems. Each system compiles to 11-entry tag arrays indexed
+# by card value (index 0 unused, 1 = ace), so the count of any set of dealt
+# cards is one dot product with its rank histogram, and many systems can be
+# evaluated at once with a (systems, 11) tag matrix.
+#
+# bet_tags fold two standard corrections into the tags themselves:
+# - unbalanced systems (KO) lose imbalance/52 per card dealt, so the count
+#   is zero on average for a neutral shoe and divides into a true count
+# - ace-neutral systems with an ace side count gain ace_side_weight for
+#   every surplus ace left in the shoe (-weight per ace dealt,
+#   +weight/13 per card dealt)
+
+# Cards of each value in one deck (index = card value)
+DECK_COMPOSITION = np.array([0, 4, 4, 4, 4, 4, 4, 4, 4, 4, 16])
+
+
+def _plain(values) -> tuple:
+    """Tag tuple of Python numbers (ints where exact) for the scalar shoe."""
+    return tuple(int(v) if float(v).is_integer() else float(v) for v in values)
+
+
+class CountingSystem:
+    """
+    A card-counting system.
+    - tags: published tag per card value, (A, 2, ..., 9, 10) → tags[1..10]
+    - ace_side_weight: points per surplus ace for ace-neutral systems that
+      keep an ace side count (0 = none)
+    - imbalance: count of one full deck (0 for balanced systems)
+    - bet_tags: balanced, ace-adjusted tags used for true counts and betting
+    """
+    def __init__(self, name: str, tags, ace_side_weight: float = 0.0):
+        tags = np.asarray(tags, dtype=float)
+        if tags.shape == (10,):
+            tags = np.concatenate([[0.0], tags])
+        if tags.shape != (11,):
+            raise ValueError("tags must give one value per card A, 2, ..., 10 (optionally with a leading 0).")
+        self.name = name
+        self.tags = tags
+        self.ace_side_weight = ace_side_weight
+        self.imbalance = float(DECK_COMPOSITION @ tags)
+        ace = np.zeros(11)
+        ace[1] = 1.0
+        bet_tags = tags - self.imbalance / 52 + ace_side_weight * (1 / 13 - ace)
+        bet_tags[0] = 0.0
+        self.bet_tags = bet_tags
+
+    @property
+    def balanced(self) -> bool:
+        return self.imbalance == 0 and self.ace_side_weight == 0
+
+    def scalar_tags(self) -> tuple:
+        """bet_tags as a tuple for BlackjackGame(tags=...)."""
+        return _plain(self.bet_tags)
+
+    def __repr__(self) -> str:
+        return f"CountingSystem({self.name!r}, tags={_plain(self.tags[1:])}, ace_side_weight={self.ace_side_weight})"
+
+
+COUNTING_SYSTEMS = {}
+
+
+def register_counting_system(system: CountingSystem) -> CountingSystem:
+    """Add a system to the registry under its (lower-case) name."""
+    COUNTING_SYSTEMS[system.name.lower()] = system
+    return system
+
+
+def get_counting_system(system) -> CountingSystem:
+    """A CountingSystem from a registered name or an instance."""
+    if isinstance(system, CountingSystem):
+        return system
+    try:
+        return COUNTING_SYSTEMS[str(system).lower()]
+    except KeyError:
+        raise ValueError(f"Unknown counting system {system!r}; choose from {sorted(COUNTING_SYSTEMS)}.") from None
+
+
+def tag_matrix(systems) -> np.ndarray:
+    """(len(systems), 11) matrix of bet_tags, one row per system."""
+    return np.stack([get_counting_system(s).bet_tags for s in systems])
+
+
+#                                                 A   2    3   4    5   6    7   8    9   10
+HI_LO = register_counting_system(CountingSystem('hi-lo', [-1, 1, 1, 1, 1, 1, 0, 0, 0, -1]))
+KO = register_counting_system(CountingSystem('ko', [-1, 1, 1, 1, 1, 1, 1, 0, 0, -1]))
+HI_OPT_I = register_counting_system(CountingSystem('hi-opt-i', [0, 0, 1, 1, 1, 1, 0, 0, 0, -1], ace_side_weight=1))
+HI_OPT_II = register_counting_system(CountingSystem('hi-opt-ii', [0, 1, 1, 2, 2, 1, 1, 0, 0, -2], ace_side_weight=2))
+OMEGA_II = register_counting_system(CountingSystem('omega-ii', [0, 1, 1, 2, 2, 2, 1, 0, -1, -2], ace_side_weight=2))
+ZEN = register_counting_system(CountingSystem('zen', [-1, 1, 1, 2, 2, 2, 1, 0, 0, -2]))
+WONG_HALVES = register_counting_system(CountingSystem('wong-halves', [-1, 0.5, 1, 1, 1.5, 1, 0.5, 0, -0.5, -1]))
@@ -0,0 +1,83 @@
+from functools import lru_cache
+
+# Dealer-outcome distributions (17, 18, 19, 20, 21, bust) for BlackjackGame's
+# dealer (draws to 17, stands on all 17s), keyed by the dealer's hand and the
+# remaining shoe packed into 10 bytes (counts of A, 2, ..., 9, ten-valued).
+
+
+def pack_shoe(shoe) -> bytes:
+    """
+    Compact key for a 10-entry composition (tuple, list or ndarray of counts).
+    One byte per count: shoes of more than 15 decks (256+ tens) raise ValueError.
+    """
+    counts = [int(c) for c in shoe]
+    if max(counts) > 255:
+        raise ValueError("Card counts above 255 cannot be packed; use at most 15 decks.")
+    return bytes(counts)
+
+
+def composition(cards) -> bytes:
+    """Packed composition of a list of cards such as BlackjackGame.deck."""
+    counts = [0] * 10
+    for c in cards:
+        counts[c - 1] += 1
+    return pack_shoe(counts)
+
+
+class DealerCache:
+    """
+    Bounded LRU cache of dealer final-value distributions.
+    - probs(upcard, shoe) -> 6 probabilities for 17, 18, 19, 20, 21, bust
+    - shoe is the unseen composition (hole card still inside it)
+    - intermediate dealer hands share the cache, so neighbouring shoes reuse work
+    - stats() reports hits, misses, evictions and size
+    """
+    def __init__(self, maxsize: int = 1 << 20):
+        self.maxsize = maxsize
+        self._dist = lru_cache(maxsize=maxsize)(self._compute)
+
+    def _compute(self, total: int, ace: bool, shoe: bytes) -> tuple:
+        n = sum(shoe)
+        if n == 0:
+            raise ValueError("Shoe is empty.")
+        dist = [0.0] * 6
+        for i, count in enumerate(shoe):
+            if not count:
+                continue
+            p = count / n
+            new_total = total + i + 1
+            new_ace = ace or i == 0
+            value = new_total + 10 if new_ace and new_total <= 11 else new_total
+            if value >= 17:
+                # Terminal draws are tallied directly, no recursion or new key
+                dist[5 if value > 21 else value - 17] += p
+                continue
+            rest = shoe[:i] + bytes((count - 1,)) + shoe[i + 1:]
+            for j, q in enumerate(self._dist(new_total, new_ace, rest)):
+                dist[j] += p * q
+        return tuple(dist)
+
+    def probs(self, upcard: int, shoe) -> tuple:
+        """Dealer outcome distribution for an upcard and unseen shoe."""
+        if not isinstance(shoe, bytes):
+            shoe = pack_shoe(shoe)
+        return self._dist(upcard, upcard == 1, shoe)
+
+    def bust_probability(self, upcard: int, shoe) -> float:
+        return self.probs(upcard, shoe)[5]
+
+    def stats(self) -> dict:
+        info = self._dist.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'evictions': max(0, info.misses - info.currsize),
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """Drop all entries and reset the statistics."""
+        self._dist.cache_clear()
@@ -0,0 +1,126 @@
+import json
+import os
+import numpy as np
+
+# Hand-level event logs. A log is a directory with one sub-directory per
+# column, each holding fixed-size .npy chunks (000000.npy, 000001.npy, ...)
+# plus meta.json. Writers keep at most one chunk in memory; readers memory-map
+# the chunks so logs far larger than RAM can be scanned.
+
+HAND_COLUMNS = {
+    'p1': np.uint8,               # player's first card
+    'p2': np.uint8,               # player's second card
+    'upcard': np.uint8,           # dealer upcard
+    'hits': np.uint8,             # hits taken over every played hand (a double's card is not a hit)
+    'player_final': np.uint8,     # final player hand value
+    'dealer_final': np.uint8,     # final dealer hand value (2-card value if the player busted)
+    'bet': np.float64,
+    'payout': np.float64,         # net profit as compute_payout
+    'running_count': np.int32,    # count the bet was based on (0 if not tracked)
+    'true_count': np.float32,
+}
+
+
+def _hits(game, bet: float) -> int:
+    """Hits over the round's played hands (RulesBlackjackGame keeps them in hands/bets)."""
+    hands = getattr(game, 'hands', None)
+    if not hands:
+        return len(game.player) - 2
+    # every hand starts from two cards (split hands get their second card
+    # dealt); a doubled hand's stake is twice the bet and its card is no hit
+    return sum(len(hand) - 2 - (stake > bet) for hand, stake in zip(hands, game.bets))
+
+
+class HandLogWriter:
+    """
+    Streaming sink for simulate_* functions: one row per hand.
+    - record(game, bet, payout, running_count, true_count) after each hand
+      (running_count must be whole: systems with fractional bet tags, such
+      as KO or Wong Halves, raise ValueError)
+    - rows are buffered and written every chunk_size hands
+    - use as a context manager, or call close() to flush the last chunk
+    """
+    def __init__(self, path: str, chunk_size: int = 1 << 16):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.chunks = 0
+        self._buffers = {name: [] for name in HAND_COLUMNS}
+        for name in HAND_COLUMNS:
+            os.makedirs(os.path.join(path, name), exist_ok=True)
+
+    def record(self, game, bet: float, payout: float, running_count: float = 0, true_count: float = 0.0):
+        if running_count != int(running_count):
+            raise ValueError(f"running_count {running_count} is not whole; the log stores integer counts.")
+        player, dealer = game.player, game.dealer
+        b = self._buffers
+        b['p1'].append(player[0])
+        b['p2'].append(player[1])
+        b['upcard'].append(dealer[0])
+        b['hits'].append(_hits(game, bet))
+        b['player_final'].append(game._hand_value(player))
+        b['dealer_final'].append(game._hand_value(dealer))
+        b['bet'].append(bet)
+        b['payout'].append(payout)
+        b['running_count'].append(int(running_count))
+        b['true_count'].append(true_count)
+        if len(b['p1']) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows as the next chunk."""
+        n = len(self._buffers['p1'])
+        if not n:
+            return
+        for name, dtype in HAND_COLUMNS.items():
+            chunk = np.asarray(self._buffers[name], dtype=dtype)
+            np.save(os.path.join(self.path, name, f"{self.chunks:06d}.npy"), chunk)
+            self._buffers[name].clear()
+        self.rows += n
+        self.chunks += 1
+
+    def close(self):
+        self.flush()
+        meta = {
+            'rows': self.rows,
+            'chunks': self.chunks,
+            'columns': {name: np.dtype(dtype).str for name, dtype in HAND_COLUMNS.items()},
+        }
+        with open(os.path.join(self.path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HandLog:
+    """Read side of a HandLogWriter directory; chunks are memory-mapped."""
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.columns = list(self.meta['columns'])
+
+    def __len__(self) -> int:
+        return self.meta['rows']
+
+    def _chunk(self, name: str, i: int) -> np.ndarray:
+        return np.load(os.path.join(self.path, name, f"{i:06d}.npy"), mmap_mode='r')
+
+    def iter_chunks(self, *names):
+        """Yield {column: memmap} per chunk (all columns if none named)."""
+        names = names or self.columns
+        for i in range(self.meta['chunks']):
+            yield {name: self._chunk(name, i) for name in names}
+
+    def column(self, name: str) -> np.ndarray:
+        """Whole column as one in-memory array."""
+        if name not in self.meta['columns']:
+            raise KeyError(f"Unknown column: {name}")
+        parts = [self._chunk(name, i) for i in range(self.meta['chunks'])]
+        if not parts:
+            return np.empty(0, dtype=self.meta['columns'][name])
+        return np.concatenate(parts)
@@ -0,0 +1,97 @@
+# Optional native-code session kernel for table strategies. With numba
+# installed, session_kernel is compiled on first use; without it the same
+# function runs as plain Python, so both paths give identical results and the
+# package never requires numba.
+#
+# The kernel plays hands straight off a uint8 shoe array (next card last, as
+# BlackjackGame pops from its deck list). Shuffling stays with the game's own
+# rng: a hand that needs a reshuffle (cut card, or a draw from a low shoe
+# part-way through) is abandoned uncommitted and the caller plays it on the
+# game itself (see simulate_strategy).
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# BlackjackGame reshuffles before any draw with fewer cards left than this
+_LOW_SHOE = 15
+
+
+@njit(cache=True)
+def session_kernel(deck, top, table, num_hands, start, credits, bet, history, reshuffle_at):
+    """
+    Play hands start, start+1, ... with flat bets until num_hands are done or
+    the next hand needs a reshuffle (cut card, or a draw from a low shoe).
+    - deck: uint8 cards, the next card at index top - 1
+    - table: StrategyTable hit array [soft, value, upcard]
+    - history: credits after each hand are stored here (length 0 = none)
+    Returns (next hand index, top, credits).
+    """
+    h = start
+    while h < num_hands:
+        hand_top = top
+        if top < reshuffle_at or top < _LOW_SHOE + 3:
+            break
+        p1 = int(deck[top - 1])
+        p2 = int(deck[top - 2])
+        up = int(deck[top - 3])
+        hole = int(deck[top - 4])
+        top -= 4
+        p_total = p1 + p2
+        p_ace = p1 == 1 or p2 == 1
+        soft = p_ace and p_total <= 11
+        value = p_total + 10 if soft else p_total
+        is_blackjack = value == 21
+
+        while value <= 21 and table[1 if soft else 0, value, up]:
+            if top < _LOW_SHOE:
+                return h, hand_top, credits
+            card = int(deck[top - 1])
+            top -= 1
+            p_total += card
+            if card == 1:
+                p_ace = True
+            soft = p_ace and p_total <= 11
+            value = p_total + 10 if soft else p_total
+
+        if value > 21:
+            reward = -1
+        else:
+            d_total = up + hole
+            d_ace = up == 1 or hole == 1
+            d_value = d_total + 10 if d_ace and d_total <= 11 else d_total
+            while d_value < 17:
+                if top < _LOW_SHOE:
+                    return h, hand_top, credits
+                card = int(deck[top - 1])
+                top -= 1
+                d_total += card
+                if card == 1:
+                    d_ace = True
+                d_value = d_total + 10 if d_ace and d_total <= 11 else d_total
+            if d_value > 21 or d_value < value:
+                reward = 1
+            elif d_value > value:
+                reward = -1
+            else:
+                reward = 0
+
+        # compute_payout
+        if reward == 1:
+            credits += 1.5 * bet if is_blackjack else 1.0 * bet
+        elif reward == -1:
+            credits += -1.0 * bet
+        else:
+            credits += 0.0
+        if history.shape[0] > 0:
+            history[h] = credits
+        h += 1
+    return h, top, credits
@@ -0,0 +1,152 @@
+import numpy as np
+
+# Streaming per-hand statistics over many credit trajectories. Memory is
+# O(max_hands) (times the number of tracked quantiles), independent of the
+# number of runs, and partial aggregates from separate workers can be merged.
+
+
+class TrajectoryStats:
+    """
+    Online aggregate of credit trajectories of length max_hands:
+    - mean / variance per hand index (Welford, merged with Chan's formula)
+    - quantiles per hand index (P² sketch, 5 markers per quantile)
+    - ruin probability: share of runs at or below ruin_level by hand h
+    update(trajectory) adds one run; merge(other) folds in another aggregate.
+    Merged quantiles are exact while either side has fewer than 5 runs and
+    otherwise combine the P² markers by run-weighted average (approximate).
+    """
+    def __init__(self, max_hands: int, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95), ruin_level: float = 0.0):
+        self.max_hands = max_hands
+        self.quantiles = tuple(float(p) for p in quantiles)
+        self.ruin_level = ruin_level
+        self.runs = 0
+        self.mean = np.zeros(max_hands)
+        self._m2 = np.zeros(max_hands)
+        self._ruined = np.zeros(max_hands, dtype=np.int64)
+        p = np.array(self.quantiles)[:, None]
+        self._dn = np.hstack([np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)])
+        self._first = []  # the first five runs, until the P² markers exist
+        self._q = None
+        self._pos = None
+        self._desired = None
+
+    def _check_compatible(self, other: "TrajectoryStats"):
+        if (other.max_hands, other.quantiles, other.ruin_level) != \
+                (self.max_hands, self.quantiles, self.ruin_level):
+            raise ValueError("Cannot merge TrajectoryStats with different settings.")
+
+    def update(self, trajectory):
+        """Add one run's credits after each hand (length max_hands)."""
+        x = np.asarray(trajectory, dtype=float)
+        if x.shape != (self.max_hands,):
+            raise ValueError(f"Trajectory must have shape ({self.max_hands},).")
+        self.runs += 1
+        delta = x - self.mean
+        self.mean += delta / self.runs
+        self._m2 += delta * (x - self.mean)
+        if self.max_hands:
+            self._ruined += np.minimum.accumulate(x) <= self.ruin_level
+        self._update_sketch(x)
+
+    def _update_sketch(self, x: np.ndarray):
+        if self._q is None:
+            self._first.append(x)
+            if len(self._first) == 5:
+                self._init_sketch()
+            return
+
+        q, pos = self._q, self._pos
+        x = np.broadcast_to(x, q.shape[:2])
+        np.minimum(q[..., 0], x, out=q[..., 0])
+        np.maximum(q[..., 4], x, out=q[..., 4])
+        pos[..., 1:4] += x[..., None] < q[..., 1:4]
+        pos[..., 4] += 1
+        self._desired += self._dn[:, None, :]
+
+        for i in (1, 2, 3):
+            d = self._desired[..., i] - pos[..., i]
+            up = (d >= 1) & (pos[..., i + 1] - pos[..., i] > 1)
+            down = (d <= -1) & (pos[..., i - 1] - pos[..., i] < -1)
+            move = up | down
+            if not move.any():
+                continue
+            s = np.where(up, 1.0, -1.0)
+            qm, qi, qp = q[..., i - 1], q[..., i], q[..., i + 1]
+            nm, ni, np_ = pos[..., i - 1], pos[..., i], pos[..., i + 1]
+            parabolic = qi + s / (np_ - nm) * ((ni - nm + s) * (qp - qi) / (np_ - ni) +
+                                               (np_ - ni - s) * (qi - qm) / (ni - nm))
+            linear = qi + s * (np.where(up, qp, qm) - qi) / (np.where(up, np_, nm) - ni)
+            new = np.where((qm < parabolic) & (parabolic < qp), parabolic, linear)
+            q[..., i] = np.where(move, new, qi)
+            pos[..., i] += np.where(move, s, 0.0)
+
+    def _init_sketch(self):
+        first = np.sort(np.stack(self._first), axis=0)  # (5, max_hands)
+        n_q = len(self.quantiles)
+        self._q = np.broadcast_to(first.T, (n_q, self.max_hands, 5)).copy()
+        self._pos = np.broadcast_to(np.arange(1.0, 6.0), self._q.shape).copy()
+        self._desired = np.broadcast_to((1 + 4 * self._dn)[:, None, :], self._q.shape).copy()
+        self._first = []
+
+    def merge(self, other: "TrajectoryStats") -> "TrajectoryStats":
+        """Fold another aggregate into this one (in place) and return self."""
+        self._check_compatible(other)
+        if other.runs == 0:
+            return self
+        if self.runs == 0:
+            self.__dict__.update({k: (v.copy() if isinstance(v, np.ndarray) else
+                                      list(v) if isinstance(v, list) else v)
+                                  for k, v in other.__dict__.items()})
+            return self
+
+        n = self.runs + other.runs
+        delta = other.mean - self.mean
+        self._m2 = self._m2 + other._m2 + delta ** 2 * self.runs * other.runs / n
+        self.mean = self.mean + delta * other.runs / n
+        self._ruined = self._ruined + other._ruined
+
+        if other._q is None or self._q is None:
+            small, big = (other, self) if other._q is None else (self, other)
+            pending = list(small._first)
+            if big is not self:
+                self._q, self._pos, self._desired = big._q.copy(), big._pos.copy(), big._desired.copy()
+                self._first = list(big._first)
+            for x in pending:
+                self._update_sketch(x)
+        else:
+            w_self = self.runs / n
+            q = self._q * w_self + other._q * (1 - w_self)
+            q[..., 0] = np.minimum(self._q[..., 0], other._q[..., 0])
+            q[..., 4] = np.maximum(self._q[..., 4], other._q[..., 4])
+            self._q = q
+            self._pos = self._pos + other._pos
+            self._pos[..., 0] = 1
+            self._pos[..., 4] = n
+            self._desired = 1 + (n - 1) * np.broadcast_to(self._dn[:, None, :], q.shape).copy()
+        self.runs = n
+        return self
+
+    def variance(self) -> np.ndarray:
+        """Sample variance per hand index (zeros with fewer than two runs)."""
+        if self.runs < 2:
+            return np.zeros(self.max_hands)
+        return self._m2 / (self.runs - 1)
+
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.variance())
+
+    def quantile(self, p: float) -> np.ndarray:
+        """Estimated p-quantile per hand index (p must be one of self.quantiles)."""
+        if p not in self.quantiles:
+            raise ValueError(f"Quantile {p} not tracked; choose from {self.quantiles}.")
+        if self._q is None:
+            if not self._first:
+                return np.full(self.max_hands, np.nan)
+            return np.quantile(np.stack(self._first), p, axis=0)
+        return self._q[self.quantiles.index(p), :, 2].copy()
+
+    def ruin_probability(self) -> np.ndarray:
+        """Share of runs whose credits fell to ruin_level or below by each hand."""
+        if self.runs == 0:
+            return np.zeros(self.max_hands)
+        return self._ruined / self.runs
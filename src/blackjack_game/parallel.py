@@ -0,0 +1,94 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .online_stats import TrajectoryStats
+from .shoe_bank import ShoeBank
+
+# Process-pool runners for the simulate_* functions. Every run gets its own
+# seed spawned from one master seed, so results depend only on (seed, run
+# index) and never on how runs are split across workers.
+
+def spawn_seeds(seed, n: int) -> list:
+    """Derive n independent integer seeds from a master seed (None = fresh entropy)."""
+    return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(n)]
+
+
+def _run_chunk(sim_fn, strategy_fn, seeds, kwargs) -> list:
+    results = []
+    for s in seeds:
+        results.append(sim_fn(strategy_fn, rng=s, **kwargs))
+    return results
+
+
+def run_parallel(sim_fn, strategy_fn, runs: int = 100, seed=None, workers: int = None,
+                 chunk_size: int = None, shoe_bank: str = None, **kwargs) -> list:
+    """
+    Run sim_fn(strategy_fn, **kwargs) `runs` times across a process pool.
+    - run i gets rng=spawn_seeds(seed, runs)[i] (sim_fn must accept rng)
+    - results are returned in run order, identical for any worker count
+    - workers=1 runs in-process (no pickling needed)
+    - shoe_bank: path of a shoe-bank file; run i then deals shoes
+      i, i+runs, ... from it instead of shuffling (seed is ignored)
+    sim_fn and strategy_fn must be picklable (module-level functions or
+    StrategyTable instances) when workers > 1.
+    """
+    if shoe_bank is not None:
+        bank = ShoeBank(shoe_bank)
+        seeds = [bank.reader(i, runs) for i in range(runs)]
+    else:
+        seeds = spawn_seeds(seed, runs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or runs <= 1:
+        return _run_chunk(sim_fn, strategy_fn, seeds, kwargs)
+
+    chunk_size = chunk_size or max(1, -(-runs // (workers * 4)))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, runs, chunk_size)]
+    n = len(chunks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(_run_chunk, [sim_fn] * n, [strategy_fn] * n, chunks, [kwargs] * n)
+        return [r for part in parts for r in part]
+
+
+def parallel_trajectory(sim_fn, strat_fn, runs: int = 100, max_hands: int = 200, seed=None,
+                        workers: int = None, **kwargs) -> np.ndarray:
+    """
+    Parallel build_trajectory: array shape (runs, max_hands) of credits after
+    each hand. sim_fn must accept return_history.
+    """
+    histories = run_parallel(sim_fn, strat_fn, runs=runs, seed=seed, workers=workers,
+                             num_hands=max_hands, return_history=True, **kwargs)
+    return np.array(histories, dtype=float).reshape(runs, max_hands)
+
+
+def _stats_chunk(sim_fn, strategy_fn, seeds, max_hands, stats_kwargs, kwargs) -> TrajectoryStats:
+    stats = TrajectoryStats(max_hands, **stats_kwargs)
+    for s in seeds:
+        stats.update(sim_fn(strategy_fn, num_hands=max_hands, return_history=True, rng=s, **kwargs))
+    return stats
+
+
+def parallel_trajectory_stats(sim_fn, strat_fn, runs: int = 100, max_hands: int = 200, seed=None,
+                              workers: int = None, chunk_size: int = 16,
+                              quantiles=(0.05, 0.25, 0.5, 0.75, 0.95), ruin_level: float = 0.0,
+                              **kwargs) -> TrajectoryStats:
+    """
+    Parallel build_trajectory_stats: each chunk of runs is aggregated in a
+    worker and the partial TrajectoryStats are merged in chunk order. With a
+    fixed chunk_size the result is identical for any worker count.
+    """
+    seeds = spawn_seeds(seed, runs)
+    stats_kwargs = dict(quantiles=quantiles, ruin_level=ruin_level)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, runs, chunk_size)]
+    n = len(chunks)
+    args = ([sim_fn] * n, [strat_fn] * n, chunks, [max_hands] * n, [stats_kwargs] * n, [kwargs] * n)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n <= 1:
+        parts = map(_stats_chunk, *args)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_stats_chunk, *args))
+
+    stats = TrajectoryStats(max_hands, **stats_kwargs)
+    for part in parts:
+        stats.merge(part)
+    return stats
@@ -0,0 +1,152 @@
+import math
+import numpy as np
+from .betting import BetPolicy
+
+# Bankroll risk from a per-hand profit distribution measured once (e.g. from
+# record_outcomes). Profits live on a lattice of `step` credits, so the
+# bankroll after each hand is a Markov chain on that lattice with ruin
+# (credits <= 0) absorbing; one hand is one convolution with the profit pmf.
+# Hands are treated as independent draws from the distribution.
+
+
+def payout_distribution(outcomes: dict, policy: BetPolicy = None, bankroll: float = None,
+                        step: float = 0.5) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (values, probs) of the profit per hand on a lattice of `step` credits.
+    - outcomes: {'units', 'true_count'} as record_outcomes
+    - policy: stake per hand from policy.bet(bankroll, true_count) (default
+      one unit); only policies without progression state (FlatBet,
+      CountRamp, KellyBet at a fixed bankroll) have a per-hand distribution
+    - bankroll: the finite bankroll stakes are sized for (required with a policy)
+    Raises ValueError if a profit is not a multiple of step (choose a finer step).
+    """
+    units = np.asarray(outcomes['units'], dtype=float)
+    if policy is None:
+        profit = units
+    else:
+        if type(policy).settle is not BetPolicy.settle:
+            raise TypeError(f"{type(policy).__name__} depends on past results; use replay_policy instead.")
+        if bankroll is None or not math.isfinite(bankroll):
+            raise ValueError("payout_distribution with a policy needs a finite bankroll.")
+        stakes = np.array([policy.bet(bankroll, tc) for tc in np.asarray(outcomes['true_count']).tolist()])
+        profit = stakes * units
+    k = np.rint(profit / step).astype(np.int64)
+    if not np.allclose(k * step, profit):
+        raise ValueError(f"Profits are not multiples of step={step}; choose a finer step.")
+    k, counts = np.unique(k, return_counts=True)
+    return k * step, counts / counts.sum()
+
+
+def risk_metrics(values: np.ndarray, probs: np.ndarray) -> dict:
+    """
+    Per-hand summary of a profit distribution:
+    - ev, sd, variance
+    - n0: hands until the expected win equals one standard deviation (var / ev²)
+    - di: desirability index, 1000 * ev / sd
+    - score: di², i.e. 10⁶ · ev² / variance (SCORE)
+    """
+    values = np.asarray(values, dtype=float)
+    probs = np.asarray(probs, dtype=float)
+    ev = float(probs @ values)
+    variance = float(probs @ (values - ev) ** 2)
+    sd = math.sqrt(variance)
+    di = 1000 * ev / sd if sd > 0 else math.inf
+    return {
+        'ev': ev,
+        'sd': sd,
+        'variance': variance,
+        'n0': variance / ev ** 2 if ev else math.inf,
+        'di': di,
+        'score': di ** 2 if ev > 0 else 0.0,
+    }
+
+
+def _lattice(values: np.ndarray, probs: np.ndarray, step: float) -> tuple[np.ndarray, int]:
+    """pmf array over lattice offsets kmin..kmax, and kmin."""
+    k = np.rint(np.asarray(values, dtype=float) / step).astype(np.int64)
+    if not np.allclose(k * step, values):
+        raise ValueError(f"Profit values must be multiples of step={step}.")
+    kmin = int(k.min())
+    pmf = np.zeros(int(k.max()) - kmin + 1)
+    np.add.at(pmf, k - kmin, probs)
+    return pmf, kmin
+
+
+def bankroll_distribution(values: np.ndarray, probs: np.ndarray, bankroll: float, hands: int,
+                          step: float = 0.5, tol: float = 1e-15) -> dict:
+    """
+    Exact distribution of the bankroll after `hands` hands (Markov chain
+    with absorbing ruin at credits <= 0).
+    Returns {'levels', 'probs' (surviving mass per level), 'ruin' (per hand,
+    cumulative probability of ruin by hand h+1)}. Upper-tail mass below tol
+    is dropped to bound the state space.
+    """
+    pmf, kmin = _lattice(values, probs, step)
+    start = int(round(bankroll / step))
+    if start <= 0:
+        raise ValueError("bankroll must be positive.")
+    dist = np.zeros(start + 1)
+    dist[start] = 1.0
+    ruin = np.empty(hands)
+    ruined = 0.0
+    for h in range(hands):
+        new = np.convolve(dist, pmf)  # new[i] is the mass at level i + kmin
+        if kmin <= 0:
+            ruined += new[:1 - kmin].sum()
+            dist = np.concatenate(([0.0], new[1 - kmin:]))
+        else:
+            dist = np.concatenate((np.zeros(kmin), new))
+        tail = np.cumsum(dist[::-1])
+        keep = len(dist) - np.searchsorted(tail, tol)
+        dist = dist[:max(keep, 1)]
+        ruin[h] = ruined
+    return {'levels': np.arange(len(dist)) * step, 'probs': dist, 'ruin': ruin}
+
+
+def risk_of_ruin(values: np.ndarray, probs: np.ndarray, bankroll: float, hands: int = None,
+                 step: float = 0.5) -> float:
+    """
+    Probability of losing `bankroll` credits.
+    - hands=None: over an unlimited horizon, exp(-R * bankroll) with R the
+      adjustment coefficient solving E[exp(-R * X)] = 1 (exact for ±1
+      random walks, 1.0 when the edge is not positive)
+    - hands: within that many hands (bankroll_distribution)
+    """
+    if hands is not None:
+        ruin = bankroll_distribution(values, probs, bankroll, hands, step)['ruin']
+        return float(ruin[-1]) if hands else 0.0
+    values = np.asarray(values, dtype=float)
+    probs = np.asarray(probs, dtype=float)
+    if probs @ values <= 0:
+        return 1.0
+    if (values >= 0).all():
+        return 0.0
+
+    def excess(r):
+        return probs @ np.exp(-r * values) - 1.0
+
+    lo, hi = 0.0, 1.0
+    while excess(hi) < 0:
+        lo, hi = hi, hi * 2
+    for _ in range(200):
+        mid = (lo + hi) / 2
+        if excess(mid) < 0:
+            lo = mid
+        else:
+            hi = mid
+    return float(math.exp(-hi * bankroll))
+
+
+def bankroll_percentiles(values: np.ndarray, probs: np.ndarray, bankroll: float, hands: int,
+                         percentiles=(5, 25, 50, 75, 95), step: float = 0.5) -> dict:
+    """
+    Bankroll percentiles after `hands` hands ({percentile: credits}); ruined
+    sessions count as 0 credits.
+    """
+    result = bankroll_distribution(values, probs, bankroll, hands, step)
+    levels = result['levels']
+    mass = result['probs'].copy()
+    mass[0] += result['ruin'][-1] if hands else 0.0  # ruined sessions sit at 0
+    cdf = np.cumsum(mass) / mass.sum()
+    return {p: float(levels[min(np.searchsorted(cdf, p / 100 - 1e-12), len(levels) - 1)])
+            for p in percentiles}
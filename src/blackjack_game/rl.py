@@ -0,0 +1,202 @@
+import numpy as np
+from .bj_batch import BatchBlackjackGame, _values
+from .strategy_tables import MAX_TOTAL, MIN_COUNT, MAX_COUNT, StrategyTable
+
+# Reinforcement learning on many tables at once. VectorBlackjackEnv keeps one
+# hand per table in NumPy arrays over BatchBlackjackGame's shoes, so a step of
+# every environment is a handful of array operations instead of a Python loop
+# over BlackjackGame objects. TabularTrainer learns a hit/stand Q-table on top
+# of it and exports it as a StrategyTable, i.e. a drop-in strategy_fn.
+
+STAND, HIT = 0, 1
+_MAX_DECISIONS = 24  # more than any hand can take without busting
+
+
+class VectorBlackjackEnv:
+    """
+    num_envs BlackjackGame hands played in lock-step (Gym vector-env style):
+    - reset() -> obs; step(actions) -> (obs, reward, done)
+    - obs: float array (num_envs, 4) of player value, soft flag, dealer upcard
+      and the true count the hand was dealt at
+    - actions: 0 stand / 1 hit per env
+    - reward: profit per unit bet (compute_payout: naturals that win pay 1.5)
+    - finished hands are dealt again immediately (auto-reset): their obs is
+      the new hand's and done marks them
+    Rules and shoes are those of BatchBlackjackGame (num_decks, rng, system,
+    penetration).
+    """
+    def __init__(self, num_envs: int, num_decks: int = 4, rng=None, system='hi-lo', penetration: float = None):
+        self.num_envs = num_envs
+        self.engine = BatchBlackjackGame(num_envs, num_decks=num_decks, rng=rng, system=system,
+                                         penetration=penetration)
+        self.p_total = np.zeros(num_envs, dtype=np.int64)
+        self.p_ace = np.zeros(num_envs, dtype=bool)
+        self.natural = np.zeros(num_envs, dtype=bool)
+        self.upcard = np.zeros(num_envs, dtype=np.int64)
+        self.d_total = np.zeros(num_envs, dtype=np.int64)
+        self.d_ace = np.zeros(num_envs, dtype=bool)
+        self.true_count = np.zeros(num_envs)
+        self._every = np.arange(num_envs)
+
+    def _deal(self, idx: np.ndarray):
+        engine = self.engine
+        due = idx[engine.shoe_size - engine.pos[idx] < engine._reshuffle_at]
+        if len(due):
+            engine._shuffle(due)
+        decks_remaining = np.maximum(1, (engine.shoe_size - engine.pos[idx]) / 52)
+        self.true_count[idx] = engine.dealt[idx] @ engine.system.bet_tags / decks_remaining
+        p1, p2 = engine._draw(idx), engine._draw(idx)
+        up, hole = engine._draw(idx), engine._draw(idx)
+        self.p_total[idx] = p1 + p2
+        self.p_ace[idx] = (p1 == 1) | (p2 == 1)
+        self.natural[idx] = self.p_ace[idx] & (self.p_total[idx] == 11)
+        self.upcard[idx] = up
+        self.d_total[idx] = up + hole
+        self.d_ace[idx] = (up == 1) | (hole == 1)
+
+    def _obs(self) -> np.ndarray:
+        value, soft = _values(self.p_total, self.p_ace)
+        return np.column_stack([value, soft, self.upcard, self.true_count])
+
+    def reset(self) -> np.ndarray:
+        """Deal a new hand in every env."""
+        self._deal(self._every)
+        return self._obs()
+
+    def step(self, actions) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Apply one action per env; see the class docstring."""
+        actions = np.asarray(actions).astype(bool)
+        reward = np.zeros(self.num_envs)
+        done = ~actions
+
+        hit = np.flatnonzero(actions)
+        if len(hit):
+            card = self.engine._draw(hit)
+            self.p_total[hit] += card
+            self.p_ace[hit] |= card == 1
+            bust = hit[self.p_total[hit] > 21]
+            reward[bust] = -1.0
+            done[bust] = True
+
+        stand = np.flatnonzero(~actions)
+        if len(stand):
+            # Dealer draws to 17 (stands on all 17s), as BlackjackGame.stand
+            drawing = stand
+            while len(drawing):
+                d_value, _ = _values(self.d_total[drawing], self.d_ace[drawing])
+                drawing = drawing[d_value < 17]
+                if not len(drawing):
+                    break
+                card = self.engine._draw(drawing)
+                self.d_total[drawing] += card
+                self.d_ace[drawing] |= card == 1
+            player, _ = _values(self.p_total[stand], self.p_ace[stand])
+            dealer, _ = _values(self.d_total[stand], self.d_ace[stand])
+            result = np.where(dealer > 21, 1, np.sign(player - dealer))
+            reward[stand] = np.where(result == 1, np.where(self.natural[stand], 1.5, 1.0), result)
+
+        finished = np.flatnonzero(done)
+        if len(finished):
+            self._deal(finished)
+        return self._obs(), reward, done
+
+
+class TabularTrainer:
+    """
+    Tabular control of hit/stand on a VectorBlackjackEnv.
+    - method: 'q_learning' (one-step targets) or 'monte_carlo' (every-visit
+      averages of hand returns)
+    - alpha: Q-learning step on each batch's mean TD error per state-action;
+      None steps by 1/visits (a running average of the targets)
+    - epsilon: exploration rate of the epsilon-greedy behaviour policy
+    - counted: learn a separate table per integer true count in
+      min_count..max_count (as compile_count_strategy)
+    train(steps) steps every env `steps` times; strategy() exports the greedy
+    policy as a StrategyTable (hit where Q(hit) > Q(stand)).
+    """
+    def __init__(self, env: VectorBlackjackEnv, method: str = 'q_learning', alpha: float = None,
+                 epsilon: float = 0.1, counted: bool = False, min_count: int = MIN_COUNT,
+                 max_count: int = MAX_COUNT, rng=None):
+        if method not in ('q_learning', 'monte_carlo'):
+            raise ValueError("method must be 'q_learning' or 'monte_carlo'.")
+        self.env = env
+        self.method = method
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.counted = counted
+        self.min_count = min_count
+        self.max_count = max_count
+        self.rng = np.random.default_rng(rng)
+        num_counts = max_count - min_count + 1 if counted else 1
+        self.shape = (num_counts, 2, MAX_TOTAL + 1, 11)
+        num_states = int(np.prod(self.shape))
+        self.q = np.zeros((num_states, 2))
+        self.visits = np.zeros((num_states, 2), dtype=np.int64)
+        self.steps = 0
+        self._returns = np.zeros((num_states, 2))
+        self._counts = np.zeros((num_states, 2), dtype=np.int64)
+        n = env.num_envs
+        self._trace = np.zeros((n, _MAX_DECISIONS), dtype=np.int64)
+        self._trace_len = np.zeros(n, dtype=np.int64)
+        self._obs = env.reset()
+
+    def _state_index(self, obs: np.ndarray) -> np.ndarray:
+        value = obs[:, 0].astype(np.int64)
+        soft = obs[:, 1].astype(np.int64)
+        upcard = obs[:, 2].astype(np.int64)
+        if self.counted:
+            count = np.clip(np.floor(obs[:, 3]).astype(np.int64), self.min_count, self.max_count) - self.min_count
+        else:
+            count = 0
+        return ((count * 2 + soft) * (MAX_TOTAL + 1) + value) * 11 + upcard
+
+    def train(self, steps: int):
+        """Step every env `steps` times, updating Q after each step."""
+        env, q = self.env, self.q
+        n = env.num_envs
+        every = np.arange(n)
+        size = q.size
+        obs = self._obs
+        for _ in range(steps):
+            state = self._state_index(obs)
+            actions = (q[state, HIT] > q[state, STAND]).astype(np.int64)
+            explore = self.rng.random(n) < self.epsilon
+            actions[explore] = self.rng.integers(0, 2, explore.sum())
+            sa = state * 2 + actions
+            obs, reward, done = env.step(actions)
+            hits = np.bincount(sa, minlength=size)
+            self.visits += hits.reshape(q.shape)
+
+            if self.method == 'q_learning':
+                target = reward.copy()
+                going = ~done
+                target[going] = q[self._state_index(obs[going])].max(axis=1)
+                error = np.bincount(sa, weights=target - q.reshape(-1)[sa], minlength=size)
+                if self.alpha is None:
+                    q += error.reshape(q.shape) / np.maximum(self.visits, 1)
+                else:
+                    q += self.alpha * error.reshape(q.shape) / np.maximum(hits, 1).reshape(q.shape)
+            else:
+                self._trace[every, self._trace_len] = sa
+                self._trace_len += 1
+                ended = np.flatnonzero(done)
+                if len(ended):
+                    lengths = self._trace_len[ended]
+                    mask = np.arange(_MAX_DECISIONS) < lengths[:, None]
+                    pairs = self._trace[ended][mask]
+                    returns = np.repeat(reward[ended], lengths)
+                    self._returns.reshape(-1)[:] += np.bincount(pairs, weights=returns, minlength=size)
+                    self._counts.reshape(-1)[:] += np.bincount(pairs, minlength=size)
+                    seen = self._counts > 0
+                    q[seen] = self._returns[seen] / self._counts[seen]
+                    self._trace_len[ended] = 0
+        self._obs = obs
+        self.steps += steps * n
+        return self
+
+    def strategy(self) -> StrategyTable:
+        """Greedy policy as a StrategyTable (count-indexed if counted)."""
+        hit = (self.q[:, HIT] > self.q[:, STAND]).reshape(self.shape)
+        if self.counted:
+            return StrategyTable(hit, min_count=self.min_count)
+        return StrategyTable(hit[0])
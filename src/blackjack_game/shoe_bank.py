@@ -0,0 +1,106 @@
+import numpy as np
+from .bj import BlackjackGame
+from .bj_batch import _ONE_DECK
+
+# Shoe banks: millions of pre-shuffled shoes stored as one uint8 .npy file of
+# shape (num_shoes, 52 * num_decks). Games read shoes straight out of the
+# memory map, so reshuffling costs nothing in the hot loop and every process
+# opening the same file shares one copy in the page cache.
+
+
+def write_shoe_bank(path: str, num_shoes: int, num_decks: int = 4, rng=None, chunk_shoes: int = 65536) -> str:
+    """Shuffle num_shoes shoes into a memory-mapped .npy file at path, chunk by chunk."""
+    rng = np.random.default_rng(rng)
+    shoe = np.tile(_ONE_DECK, num_decks)
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=(num_shoes, len(shoe)))
+    for start in range(0, num_shoes, chunk_shoes):
+        stop = min(start + chunk_shoes, num_shoes)
+        out[start:stop] = rng.permuted(np.tile(shoe, (stop - start, 1)), axis=1)
+    out.flush()
+    del out
+    return path
+
+
+class ShoeBank:
+    """
+    Read-only view of a shoe-bank file.
+    - shoe(i) is a zero-copy memmap row
+    - start/stride pick which shoes this reader deals (start, start+stride, ...)
+      so parallel workers can use disjoint shoes; indices wrap at the end
+    - pass it as rng= to any simulate_* function (see make_game)
+    Pickles by path, so it can be sent to worker processes.
+    """
+    def __init__(self, path: str, start: int = 0, stride: int = 1):
+        self.path = path
+        self.start = start
+        self.stride = stride
+        self.shoes = np.load(path, mmap_mode='r')
+        if self.shoes.dtype != np.uint8 or self.shoes.ndim != 2 or self.shoes.shape[1] % 52:
+            raise ValueError(f"{path} is not a shoe bank.")
+        self.num_shoes, self.shoe_size = self.shoes.shape
+        self.num_decks = self.shoe_size // 52
+
+    def __getstate__(self):
+        return {'path': self.path, 'start': self.start, 'stride': self.stride}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        return self.num_shoes
+
+    def shoe(self, i: int) -> np.ndarray:
+        return self.shoes[i % self.num_shoes]
+
+    def reader(self, start: int, stride: int = 1) -> "ShoeBank":
+        """Another reader of the same file dealing shoes start, start+stride, ..."""
+        return ShoeBank(self.path, start=start, stride=stride)
+
+    def make_game(self, num_decks: int = None, penetration: float = None, tags=None) -> "BankedBlackjackGame":
+        if num_decks is not None and num_decks != self.num_decks:
+            raise ValueError(f"Shoe bank holds {self.num_decks}-deck shoes, not {num_decks}.")
+        return BankedBlackjackGame(self, penetration=penetration, tags=tags)
+
+
+class BankedBlackjackGame(BlackjackGame):
+    """BlackjackGame dealing from a ShoeBank instead of shuffling a list."""
+    __slots__ = ('bank', '_shoe_index', '_cards', '_view', '_pos')
+
+    def __init__(self, bank: ShoeBank, penetration: float = None, tags=None):
+        self.bank = bank
+        self._shoe_index = bank.start - bank.stride
+        super().__init__(num_decks=bank.num_decks, penetration=penetration, tags=tags)
+
+    def __getstate__(self):
+        # the memoryview is rebuilt from the bank on unpickling (checkpoints)
+        skip = ('deck', '_cards', '_view')
+        return {name: getattr(self, name) for cls in type(self).__mro__
+                for name in getattr(cls, '__slots__', ()) if name not in skip and hasattr(self, name)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._cards = self.bank.shoe(self._shoe_index)
+        self._view = memoryview(self._cards)
+
+    @property
+    def deck(self) -> memoryview:
+        """Undealt cards of the current shoe (zero-copy view, next card first)."""
+        return self._view[self._pos:]
+
+    def _build_deck(self):
+        self._shoe_index += self.bank.stride
+        self._cards = self.bank.shoe(self._shoe_index)
+        # memoryview indexing yields plain ints without copying the row
+        self._view = memoryview(self._cards)
+        self._pos = 0
+        self.running_count = 0
+
+    def _draw(self) -> int:
+        if self.bank.shoe_size - self._pos < 15:  # next shoe if low
+            self._build_deck()
+        card = self._view[self._pos]
+        self._pos += 1
+        self.running_count += self.tags[card]
+        return card
+
@@ -0,0 +1,157 @@
+import numpy as np
+from .bj_rules import TableRules
+from .counting import DECK_COMPOSITION, get_counting_system
+from .strategy_tables import MAX_TOTAL, MIN_COUNT, MAX_COUNT, StrategyTable
+
+# Optimal hit/stand tables by dynamic programming over hand states.
+# A shoe is summarised by its card probabilities (index 0 unused, 1 = ace):
+# - the shoe at a true count is the expected composition of the unseen cards
+#   given that count (linear model of a shuffled shoe: each rank is depleted
+#   in proportion to its tag), scaled to rules.num_decks decks
+# - the upcard is removed from it, and the remaining probabilities are used
+#   for every later draw (total-dependent strategy, exact for an infinite shoe)
+# Hands the dealer peeks away are left out: with hit/stand only, a dealer
+# blackjack costs the same whatever the player does, so decisions are the same
+# with or without the peek.
+
+def count_composition(true_count: float = 0.0, system='hi-lo', num_decks: int = 4) -> np.ndarray:
+    """
+    Expected card counts (index 0 unused, 1 = ace) of a num_decks shoe whose
+    true count under `system` (uses bet_tags) is true_count.
+    """
+    system = get_counting_system(system)
+    p = DECK_COMPOSITION / 52
+    tags = system.bet_tags
+    spread = p @ tags ** 2
+    q = np.clip(p * (1 - tags * true_count / (52 * spread)), 0.0, None)
+    q[0] = 0.0
+    return 52 * num_decks * q / q.sum()
+
+
+def _draw_probs(counts: np.ndarray, card: int = None) -> list:
+    counts = np.array(counts, dtype=float)
+    if card is not None:
+        counts[card] = max(counts[card] - 1, 0.0)
+    return (counts / counts.sum()).tolist()
+
+
+def _dealer_dist(upcard: int, probs: list, hit_soft_17: bool) -> list:
+    """Dealer finishing on 17, 18, 19, 20, 21 or busting, given no blackjack."""
+    memo = {}
+
+    def dist(total, ace):
+        key = (total, ace)
+        if key not in memo:
+            value = total + 10 if ace and total <= 11 else total
+            if value > 21:
+                out = [0.0] * 5 + [1.0]
+            elif value >= 17 and not (hit_soft_17 and value == 17 and ace and total <= 11):
+                out = [0.0] * 6
+                out[value - 17] = 1.0
+            else:
+                out = [0.0] * 6
+                for card in range(1, 11):
+                    for i, x in enumerate(dist(total + card, ace or card == 1)):
+                        out[i] += probs[card] * x
+            memo[key] = out
+        return memo[key]
+
+    # The hole card cannot complete a blackjack
+    hole = list(probs)
+    if upcard == 1:
+        hole[10] = 0.0
+    elif upcard == 10:
+        hole[1] = 0.0
+    norm = sum(hole)
+    result = [0.0] * 6
+    for card in range(1, 11):
+        if hole[card]:
+            for i, x in enumerate(dist(upcard + card, upcard == 1 or card == 1)):
+                result[i] += hole[card] / norm * x
+    return result
+
+
+def hand_evs(upcard: int, counts: np.ndarray, rules: TableRules = None) -> np.ndarray:
+    """
+    EV per unit bet of standing and of hitting (then playing optimally) for
+    every hand vs upcard, drawing from `counts` (upcard still inside).
+    Returns an array [action, soft, value] with action 0 = stand, 1 = hit.
+    """
+    rules = rules or TableRules()
+    probs = _draw_probs(counts, upcard)
+    dealer = _dealer_dist(upcard, probs, rules.hit_soft_17)
+    stand = [0.0] * (MAX_TOTAL + 1)
+    for value in range(MAX_TOTAL + 1):
+        win = dealer[5] + sum(dealer[i] for i in range(5) if 17 + i < value)
+        loss = sum(dealer[i] for i in range(5) if 17 + i > value)
+        stand[value] = win - loss
+
+    evs = np.full((2, 2, MAX_TOTAL + 1), np.nan)
+    best = {}
+    # Highest totals first: every hit only leads to larger totals
+    for total in range(MAX_TOTAL, 1, -1):
+        for ace in (True, False):
+            hit = 0.0
+            for card in range(1, 11):
+                new_total = total + card
+                if new_total > 21:
+                    hit -= probs[card]
+                else:
+                    hit += probs[card] * best[new_total, ace or card == 1]
+            soft = ace and total <= 11
+            value = total + 10 if soft else total
+            best[total, ace] = max(stand[value], hit)
+            evs[:, int(soft), value] = stand[value], hit
+    return evs
+
+
+def solve_strategy(rules: TableRules = None, true_count: float = 0.0, system='hi-lo') -> StrategyTable:
+    """
+    Optimal hit/stand StrategyTable for the rules' dealer (S17/H17) and deck
+    count, for a shoe at true_count under `system`.
+    """
+    rules = rules or TableRules()
+    counts = count_composition(true_count, system, rules.num_decks)
+    hit = np.zeros((2, MAX_TOTAL + 1, 11), dtype=bool)
+    for up in range(1, 11):
+        evs = hand_evs(up, counts, rules)
+        hit[:, :, up] = evs[1] > evs[0]
+    return StrategyTable(hit)
+
+
+def solve_count_strategy(rules: TableRules = None, system='hi-lo', min_count: int = MIN_COUNT,
+                         max_count: int = MAX_COUNT) -> StrategyTable:
+    """
+    Count-indexed StrategyTable: solve_strategy at every integer true count
+    in min_count..max_count (each covers counts in [c, c+1), see StrategyTable).
+    """
+    tables = [solve_strategy(rules, tc, system).table for tc in range(min_count, max_count + 1)]
+    return StrategyTable(np.stack(tables), min_count=min_count)
+
+
+def index_plays(table: StrategyTable, base_count: int = 0) -> dict:
+    """
+    Deviations of a count-indexed table from its play at base_count:
+    {(value, is_soft, upcard): (index, action)} where `action` ('hit' or
+    'stand') is played at true counts >= index when the deviation is
+    above base_count, and below index when it is below.
+    """
+    if not table.counted:
+        raise ValueError("index_plays needs a count-indexed table.")
+    base = table.table[base_count - table.min_count]
+    plays = {}
+    for soft, value, up in zip(*np.nonzero((table.table != base).any(axis=0))):
+        column = table.table[:, soft, value, up].tolist()
+        key = (int(value), bool(soft), int(up))
+        high, low = column[-1], column[0]
+        if high != base[soft, value, up]:
+            # the high-count play holds from index upwards
+            i = len(column)
+            while i > 0 and column[i - 1] == high:
+                i -= 1
+            plays[key] = (table.min_count + i, 'hit' if high else 'stand')
+        else:
+            # the low-count play holds below index
+            i = column.index(not low)
+            plays[key] = (table.min_count + i, 'hit' if low else 'stand')
+    return plays
@@ -0,0 +1,109 @@
+import numpy as np
+from .bj_bots import basic_strategy, hit_until_19_strategy, always_stand_strategy, index_play_strategy
+
+# Compiled strategies: any hit/stand policy that only looks at the hand value,
+# softness and dealer upcard (optionally the true count) is evaluated once on a
+# representative hand per cell and then answered by table lookup.
+
+MAX_TOTAL = 21
+MIN_COUNT, MAX_COUNT = -10, 10
+
+
+def _representative_hand(value: int, is_soft: bool):
+    """A hand with the given value and softness, or None if impossible."""
+    if is_soft:
+        if value == 12:
+            return [1, 1]
+        if 13 <= value <= 21:
+            return [1, value - 11]
+        return None
+    if value in (2, 3):
+        return [value]
+    if 4 <= value <= 11:
+        return [2, value - 2]
+    if 12 <= value <= 20:
+        return [10, value - 10]
+    if value == 21:
+        return [10, 9, 2]
+    return None
+
+
+def _compile_cells(strategy_fn, *args) -> np.ndarray:
+    hit = np.zeros((2, MAX_TOTAL + 1, 11), dtype=bool)
+    for soft in (0, 1):
+        for value in range(MAX_TOTAL + 1):
+            hand = _representative_hand(value, bool(soft))
+            if hand is None:
+                continue
+            for up in range(1, 11):
+                state = {'player_hand': hand, 'dealer_upcard': up}
+                hit[soft, value, up] = strategy_fn(state, *args) == 'hit'
+    return hit
+
+
+class StrategyTable:
+    """
+    Precomputed hit/stand table.
+    - table[soft, value, upcard] is True for 'hit' (value = best hand value)
+    - count-indexed tables carry a leading true-count axis covering
+      min_count..max_count; the true count is floored and clamped to it
+    Instances are drop-in strategy functions: table(state) or table(state, true_count).
+    """
+    def __init__(self, table: np.ndarray, min_count: int = None):
+        self.table = table
+        self.counted = table.ndim == 4
+        self.min_count = min_count if self.counted else None
+        self.max_count = min_count + table.shape[0] - 1 if self.counted else None
+        self._rows = table.tolist()
+
+    def lookup(self, value: int, is_soft: bool, upcard: int, true_count: float = 0.0) -> bool:
+        """True if the table hits on this hand value/softness vs upcard."""
+        if self.counted:
+            i = int(true_count // 1)
+            if i < self.min_count:
+                i = self.min_count
+            elif i > self.max_count:
+                i = self.max_count
+            return self._rows[i - self.min_count][is_soft][value][upcard]
+        return self._rows[is_soft][value][upcard]
+
+    def __call__(self, state: dict, true_count: float = 0.0) -> str:
+        hand = state['player_hand']
+        total = sum(hand)
+        is_soft = 1 in hand and total + 10 <= 21
+        value = total + 10 if is_soft else total
+        if value > MAX_TOTAL:
+            return 'stand'
+        return 'hit' if self.lookup(value, is_soft, state['dealer_upcard'], true_count) else 'stand'
+
+    def save(self, path: str):
+        """Write the table to an .npz file (see load_strategy_table)."""
+        np.savez(path, table=self.table, min_count=np.nan if self.min_count is None else self.min_count)
+
+
+def load_strategy_table(path: str) -> StrategyTable:
+    """Read a StrategyTable written by StrategyTable.save."""
+    with np.load(path) as data:
+        min_count = float(data['min_count'])
+        return StrategyTable(data['table'], min_count=None if np.isnan(min_count) else int(min_count))
+
+
+def compile_strategy(strategy_fn) -> StrategyTable:
+    """Compile strategy_fn(state) -> 'hit'/'stand' into a StrategyTable."""
+    return StrategyTable(_compile_cells(strategy_fn))
+
+
+def compile_count_strategy(strategy_fn, min_count: int = MIN_COUNT, max_count: int = MAX_COUNT) -> StrategyTable:
+    """
+    Compile strategy_fn(state, true_count) into a count-indexed StrategyTable.
+    Each integer count c covers true counts in [c, c+1), which is exact for
+    index plays with integer thresholds such as index_play_strategy.
+    """
+    tables = [_compile_cells(strategy_fn, float(tc)) for tc in range(min_count, max_count + 1)]
+    return StrategyTable(np.stack(tables), min_count=min_count)
+
+
+BASIC_STRATEGY_TABLE = compile_strategy(basic_strategy)
+HIT_UNTIL_19_TABLE = compile_strategy(hit_until_19_strategy)
+ALWAYS_STAND_TABLE = compile_strategy(always_stand_strategy)
+INDEX_PLAY_TABLE = compile_count_strategy(index_play_strategy)
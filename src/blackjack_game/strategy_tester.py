@@ -1,48 +1,84 @@
+import inspect
 import numpy as np
 import matplotlib.pyplot as plt
-from .bj_bots import simulate_strategy, simulate_martingale_strategy, basic_strategy, always_stand_strategy, hit_until_19_strategy,simulate_card_counting_strategy,index_play_strategy,basic_strategy_ignoring_count 
+from .bj_bots import simulate_strategy, simulate_martingale_strategy, simulate_card_counting_strategy
+from .strategy_tables import BASIC_STRATEGY_TABLE, ALWAYS_STAND_TABLE, HIT_UNTIL_19_TABLE, INDEX_PLAY_TABLE
+from .online_stats import TrajectoryStats
+def _supports_history(sim_fn) -> bool:
+    try:
+        return 'return_history' in inspect.signature(sim_fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+def _trajectory(sim_fn, strat_fn, max_hands, **kwargs):
+    """One trial's credits after each of max_hands hands."""
+    if _supports_history(sim_fn):
+        return sim_fn(
+            strat_fn,
+            num_hands=max_hands,
+            return_history=True,
+            **kwargs
+        )
+    return [
+        sim_fn(
+            strat_fn,
+            num_hands=h,
+            **kwargs
+        )
+        for h in range(1, max_hands+1)
+    ]
+
 def build_trajectory(sim_fn, strat_fn, runs=100, max_hands=200, **kwargs):
     """
     Returns an array shape (runs, max_hands) where entry [i,h-1]
     is the ending credits after h hands in the i-th trial.
+    Simulators accepting `return_history` are run once per trial and
+    record every hand; others are replayed once per hand count.
     """
     arr = np.zeros((runs, max_hands))
     for i in range(runs):
-        for h in range(1, max_hands+1):
-            arr[i, h-1] = sim_fn(
-                strat_fn,
-                num_hands=h,
-                **kwargs
-            )
+        arr[i, :] = _trajectory(sim_fn, strat_fn, max_hands, **kwargs)
     return arr
 
+def build_trajectory_stats(sim_fn, strat_fn, runs=100, max_hands=200,
+                           quantiles=(0.05, 0.25, 0.5, 0.75, 0.95), ruin_level=0.0, **kwargs):
+    """
+    Streaming version of build_trajectory: returns a TrajectoryStats with
+    per-hand mean, variance, quantiles and ruin probability, using
+    O(max_hands) memory instead of a (runs, max_hands) array.
+    """
+    stats = TrajectoryStats(max_hands, quantiles=quantiles, ruin_level=ruin_level)
+    for _ in range(runs):
+        stats.update(_trajectory(sim_fn, strat_fn, max_hands, **kwargs))
+    return stats
+
 def main():
     runs, hands = 100, 100
     init_credits = 100.0
     base_bet     = 1.0
 
     # Basic fixed‐bet strategy
-    basic_arr = build_trajectory(
+    basic_arr = build_trajectory_stats(
         simulate_strategy,
-        basic_strategy,
+        BASIC_STRATEGY_TABLE,
         runs=runs,
         max_hands=hands,
         initial_credits=init_credits,
         bet=base_bet
     )
     #always stand
-    basic_stand = build_trajectory(
+    basic_stand = build_trajectory_stats(
         simulate_strategy,
-        always_stand_strategy,
+        ALWAYS_STAND_TABLE,
         runs=runs,
         max_hands=hands,
         initial_credits=init_credits,
         bet=base_bet
     )
     #hit until 19
-    basic_hit = build_trajectory(
+    basic_hit = build_trajectory_stats(
         simulate_strategy,
-        hit_until_19_strategy,
+        HIT_UNTIL_19_TABLE,
         runs=runs,
         max_hands=hands,
         initial_credits=init_credits,
@@ -50,9 +86,9 @@ def main():
     )
     
     # Martingale on basic strategy
-    mart_arr = build_trajectory(
+    mart_arr = build_trajectory_stats(
         simulate_martingale_strategy,
-        basic_strategy,
+        BASIC_STRATEGY_TABLE,
         runs=runs,
         max_hands=hands,
         initial_credits=init_credits,
@@ -60,9 +96,9 @@ def main():
     )
 
     # Hi-Lo card counting with index deviations
-    cc_arr = build_trajectory(
+    cc_arr = build_trajectory_stats(
         simulate_card_counting_strategy,
-        index_play_strategy,
+        INDEX_PLAY_TABLE,
         runs=runs,
         max_hands=hands,
         initial_credits=init_credits,
@@ -71,9 +107,9 @@ def main():
     
     )
     
-    basic_strategy_with_count = build_trajectory(
+    basic_strategy_with_count = build_trajectory_stats(
         simulate_card_counting_strategy,
-        basic_strategy_ignoring_count,
+        BASIC_STRATEGY_TABLE,
         runs=runs,
         max_hands=hands,
         initial_credits=init_credits,
@@ -81,12 +117,12 @@ def main():
         num_decks=4        
     )
 
-    avg_basic = basic_arr.mean(axis=0)
-    avg_mart  = mart_arr.mean(axis=0)
-    avg_cc    = cc_arr.mean(axis=0)
-    avg_stand = basic_stand.mean(axis=0)
-    avg_hit   = basic_hit.mean(axis=0)
-    avg_count_basic = basic_strategy_with_count.mean(axis=0)
+    avg_basic = basic_arr.mean
+    avg_mart  = mart_arr.mean
+    avg_cc    = cc_arr.mean
+    avg_stand = basic_stand.mean
+    avg_hit   = basic_hit.mean
+    avg_count_basic = basic_strategy_with_count.mean
 
     plt.figure(figsize=(8,5))
     plt.plot(range(1, hands+1), avg_basic, label='Basic Strategy')
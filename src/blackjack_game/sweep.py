@@ -0,0 +1,174 @@
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from .betting import FlatBet, Martingale, CountRamp
+from .bj import counting_penetration
+from .bj_bots import simulate_bet_policy
+from .parallel import spawn_seeds
+from .strategy_tables import BASIC_STRATEGY_TABLE, ALWAYS_STAND_TABLE, HIT_UNTIL_19_TABLE, INDEX_PLAY_TABLE
+
+# Parameter sweeps: every cell of a grid of configurations is a batch of
+# independent sessions, run as one task on a process pool. Cells are submitted
+# individually, so idle workers keep taking the next pending cell and slow
+# cells never hold up a fixed share of the grid. Finished cells are appended
+# to a JSON-lines checkpoint as they complete; a rerun with the same grid and
+# seed skips them and gives the same table as an uninterrupted sweep.
+
+# Names as in examples/run_user_input.py (--bet-strategy / --play-strategy)
+BET_STRATEGIES = {
+    'fixed': FlatBet,
+    'martingale': Martingale,
+    'card_counting': CountRamp,
+}
+PLAY_STRATEGIES = {
+    'basic': BASIC_STRATEGY_TABLE,
+    'always_stand': ALWAYS_STAND_TABLE,
+    'hit_until_19': HIT_UNTIL_19_TABLE,
+    'index_play': INDEX_PLAY_TABLE,
+}
+
+DEFAULT_CELL = {
+    'bet_strategy': 'fixed',
+    'play_strategy': 'basic',
+    'decks': 6,
+    'bet': 1.0,
+    'credits': 1000.0,
+    'hands': 1000,
+    'runs': 10,
+}
+RESULT_COLUMNS = ('mean_credits', 'ev_per_hand', 'std_error', 'ruin_rate', 'seconds')
+
+
+def sweep_grid(**axes) -> list:
+    """
+    Cartesian product of the given axes (a value or a list of values per
+    DEFAULT_CELL key) as a list of cell configurations; unspecified keys take
+    their defaults. The last axis varies fastest.
+    """
+    unknown = set(axes) - set(DEFAULT_CELL)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters {sorted(unknown)}; choose from {sorted(DEFAULT_CELL)}.")
+    names = list(axes)
+    values = [v if isinstance(v, (list, tuple)) else [v] for v in axes.values()]
+    return [{**DEFAULT_CELL, **dict(zip(names, combo))} for combo in itertools.product(*values)]
+
+
+def run_cell(config: dict, seed=None) -> dict:
+    """
+    Play config['runs'] sessions of config['hands'] hands for one cell.
+    - card_counting ramps the bet with the true count, reshuffling with one
+      deck left (see counting_penetration)
+    - count-indexed play strategies (index_play) see the true count
+    Returns the config with RESULT_COLUMNS added (ev_per_hand and its
+    std_error are per unit of the cell's bet; ruin_rate is the share of
+    sessions that went broke).
+    """
+    config = {**DEFAULT_CELL, **config}
+    try:
+        policy = BET_STRATEGIES[config['bet_strategy']](config['bet'])
+        strategy = PLAY_STRATEGIES[config['play_strategy']]
+    except KeyError as e:
+        raise ValueError(f"Unknown strategy {e.args[0]!r}.") from None
+    decks = config['decks']
+    counting = config['bet_strategy'] == 'card_counting'
+    start = time.perf_counter()
+    finals = np.array([
+        simulate_bet_policy(strategy, policy, num_hands=config['hands'], initial_credits=config['credits'],
+                            num_decks=decks, penetration=counting_penetration(decks) if counting else None,
+                            play_with_count=strategy.counted, rng=s)
+        for s in spawn_seeds(seed, config['runs'])
+    ])
+    per_hand = (finals - config['credits']) / (config['hands'] * config['bet'])
+    return {
+        **config,
+        'mean_credits': float(finals.mean()),
+        'ev_per_hand': float(per_hand.mean()),
+        'std_error': float(per_hand.std(ddof=1) / np.sqrt(len(per_hand))) if len(per_hand) > 1 else float('nan'),
+        'ruin_rate': float((finals <= 0).mean()),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _read_checkpoint(path: str, configs: list, seed: int) -> tuple[dict, bool]:
+    """
+    Finished rows by cell index, and whether the file ends in a torn line
+    (a write cut short by an interruption, which is ignored).
+    """
+    done = {}
+    if not os.path.exists(path):
+        return done, False
+    with open(path) as f:
+        lines = f.readlines()
+    for line in lines:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        i = row.pop('cell')
+        if row.pop('seed', None) != seed:
+            raise ValueError(f"Checkpoint {path} was written with a different seed.")
+        config = {**DEFAULT_CELL, **configs[i]} if i < len(configs) else None
+        if config is None or any(row.get(k) != v for k, v in config.items()):
+            raise ValueError(f"Checkpoint {path} was written by a different sweep.")
+        done[i] = row
+    return done, bool(lines) and not lines[-1].endswith('\n')
+
+
+def run_sweep(configs: list, seed=None, workers: int = None, checkpoint: str = None, progress=None) -> list:
+    """
+    Run every cell of `configs` (e.g. from sweep_grid) across a process pool
+    and return one result row per cell, in config order.
+    - cell i uses seed spawn_seeds(seed, len(configs))[i], so rows do not
+      depend on the worker count or on the order cells finish in
+    - checkpoint: JSON-lines file of finished cells; existing rows are reused
+      and new ones appended as they complete. Needs an integer seed, which is
+      stored with every row: resuming with another seed raises ValueError
+    - workers=1 runs in-process
+    - progress: optional callback(finished, total) after each cell
+    """
+    if checkpoint:
+        if not isinstance(seed, (int, np.integer)):
+            raise ValueError("A checkpointed sweep needs an integer seed to resume reproducibly.")
+        seed = int(seed)
+    seeds = spawn_seeds(seed, len(configs))
+    rows, torn = _read_checkpoint(checkpoint, configs, seed) if checkpoint else ({}, False)
+    pending = [i for i in range(len(configs)) if i not in rows]
+    out = open(checkpoint, 'a') if checkpoint else None
+    if torn:
+        out.write('\n')
+
+    def finish(i, row):
+        rows[i] = row
+        if out is not None:
+            out.write(json.dumps({'cell': i, 'seed': seed, **row}) + '\n')
+            out.flush()
+        if progress is not None:
+            progress(len(rows), len(configs))
+
+    try:
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(pending) <= 1:
+            for i in pending:
+                finish(i, run_cell(configs[i], seeds[i]))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(run_cell, configs[i], seeds[i]): i for i in pending}
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+    finally:
+        if out is not None:
+            out.close()
+    return [rows[i] for i in range(len(configs))]
+
+
+def write_sweep_table(rows: list, path: str):
+    """Write sweep rows to one CSV table (config columns, then results)."""
+    columns = list(DEFAULT_CELL) + list(RESULT_COLUMNS)
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
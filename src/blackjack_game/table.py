@@ -0,0 +1,121 @@
+from .bj_rules import TableRules, RulesBlackjackGame, strategy_decider, HIT, STAND
+
+# Multi-seat tables: up to seven players dealt from one shoe. Cards go out in
+# casino order (one card to each seat, the upcard, a second card to each seat,
+# the hole card), seats then play their hands left to right, and the dealer
+# draws once for the whole table.
+
+MAX_SEATS = 7
+
+
+class Seat:
+    """
+    One player at a BlackjackTable.
+    - strategy: as RulesBlackjackGame.play_round (RulesStrategy, StrategyTable
+      or strategy_fn(state))
+    - bankroll / bet: a seat sits out rounds it cannot cover, and is not
+      offered doubles, splits or insurance beyond its bankroll
+    - insure: take insurance when offered
+    """
+    __slots__ = ('strategy', 'bankroll', 'bet', 'insure', 'hands', 'bets', '_decide')
+
+    def __init__(self, strategy, bankroll: float = 100.0, bet: float = 1.0, insure: bool = False):
+        self.strategy = strategy
+        self.bankroll = bankroll
+        self.bet = bet
+        self.insure = insure
+        self.hands = []
+        self.bets = []
+        decide, lookup = strategy_decider(strategy)
+        if decide is None:
+            decide = lambda hand, value, soft, upcard, actions: HIT if lookup(value, soft, upcard) else STAND
+        self._decide = decide
+
+
+class BlackjackTable:
+    """
+    1–7 seats sharing one shoe and one dealer (rules: TableRules).
+    - seats: Seat instances, or strategies (seated with default bankroll/bet)
+    - play_round() returns each seat's profit (0.0 for seats sitting out)
+    The shoe is a RulesBlackjackGame (self.game), so penetration, reshuffles
+    and the running/true count (tags: count tags, default Hi-Lo) are shared
+    by every seat.
+    """
+    def __init__(self, seats: list, rules: TableRules = None, rng=None, tags=None):
+        if not 1 <= len(seats) <= MAX_SEATS:
+            raise ValueError(f"A table seats 1 to {MAX_SEATS} players.")
+        self.seats = [seat if isinstance(seat, Seat) else Seat(seat) for seat in seats]
+        self.game = RulesBlackjackGame(rules=rules, rng=rng, tags=tags)
+        self.rules = self.game.rules
+
+    def play_round(self) -> list[float]:
+        """Deal and settle one round; returns each seat's profit."""
+        game, rules = self.game, self.rules
+        game.shuffle_if_due()
+        draw = game._draw
+        seats = self.seats
+        profits = [0.0] * len(seats)
+        active = [i for i, seat in enumerate(seats) if seat.bankroll >= seat.bet]
+        if not active:
+            return profits
+
+        firsts = [draw() for _ in active]
+        upcard = draw()
+        seconds = [draw() for _ in active]
+        hole = draw()
+        game.dealer = [upcard, hole]
+        dealer_bj = (upcard == 1 and hole == 10) or (upcard == 10 and hole == 1)
+
+        pending = []
+        for i, c1, c2 in zip(active, firsts, seconds):
+            seat = seats[i]
+            bet = seat.bet
+            hand = [c1, c2]
+            seat.hands, seat.bets = [hand], [bet]
+            player_bj = (c1 == 1 and c2 == 10) or (c1 == 10 and c2 == 1)
+            if seat.insure and rules.insurance and upcard == 1 and seat.bankroll >= 1.5 * bet:
+                profits[i] += bet if dealer_bj else -bet / 2
+            if dealer_bj and (rules.peek or player_bj):
+                profits[i] += 0.0 if player_bj else -bet
+            elif player_bj:
+                profits[i] += bet * rules.blackjack_payout
+            else:
+                seat.hands, seat.bets, surrendered = game._play_hands(hand, bet, upcard, seat._decide,
+                                                                       seat.bankroll + profits[i])
+                if surrendered:
+                    profits[i] -= seat.bets[0]
+                else:
+                    pending.append(i)
+
+        if dealer_bj:  # no peek: dealer blackjack takes every bet
+            for i in pending:
+                profits[i] -= sum(seats[i].bets)
+        elif pending:
+            if any(sum(hand) <= 21 for i in pending for hand in seats[i].hands):
+                game._play_dealer()
+            for i in pending:
+                profits[i] += game._settle(seats[i].hands, seats[i].bets)
+
+        for seat, profit in zip(seats, profits):
+            seat.bankroll += profit
+        game.done = True
+        return profits
+
+
+def simulate_table(seats: list, num_rounds: int = 100, rules: TableRules = None,
+                   return_history: bool = False, rng=None):
+    """
+    Play num_rounds rounds at a BlackjackTable.
+    Returns each seat's final bankroll, or with return_history a list per
+    seat of its bankroll after every round.
+    """
+    table = BlackjackTable(seats, rules=rules, rng=rng)
+    history = [[] for _ in table.seats] if return_history else None
+    for _ in range(num_rounds):
+        table.play_round()
+        if history is not None:
+            for h, seat in zip(history, table.seats):
+                h.append(seat.bankroll)
+    if history is not None:
+        return history
+    return [seat.bankroll for seat in table.seats]
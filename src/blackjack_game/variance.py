@@ -0,0 +1,207 @@
+import numpy as np
+from .bj_batch import _ONE_DECK, _values
+from .counting import get_counting_system
+from .strategy_tables import StrategyTable
+
+# Variance reduction for strategy comparisons.
+#
+# Common random numbers: rounds are pre-dealt once and every strategy plays
+# the identical cards. Each round takes a fixed block from a continuous shoe:
+# 4 initial cards (player, player, upcard, hole), then a stream of player
+# draws and a separate stream of dealer draws. Because the dealer never draws
+# from the player's stream, the dealer finishes the same way whatever the
+# player did, and the shoe/count evolve identically for every strategy.
+# Block cards are treated as seen for the count (Hi-Lo unless a system is given); shoes are reshuffled
+# when fewer than 52 cards would remain (as simulate_card_counting_strategy).
+#
+# Antithetic rounds swap the player's and dealer's cards (positions in a
+# shuffled shoe are exchangeable, so the swapped round is equally likely).
+# Control variates are zero-mean functions of the dealt cards.
+
+MAX_DRAWS = 10
+
+
+def deal_common_rounds(num_rounds: int, num_decks: int = 4, rng=None, max_draws: int = MAX_DRAWS,
+                       system='hi-lo') -> dict:
+    """
+    Pre-deal num_rounds rounds shared by all strategies (true counts in the
+    counting system's betting units).
+    Returns arrays: 'initial' (N, 4), 'player_draws' (N, max_draws),
+    'dealer_draws' (N, max_draws), 'true_count' (N,) before each round.
+    """
+    rng = np.random.default_rng(rng)
+    shoe_size = len(_ONE_DECK) * num_decks
+    block = 4 + 2 * max_draws
+    per_shoe = (shoe_size - 52) // block
+    if per_shoe < 1:
+        raise ValueError("Shoe too small for one round block; use more decks or fewer max_draws.")
+    num_shoes = -(-num_rounds // per_shoe)
+
+    fresh = np.tile(np.tile(_ONE_DECK, num_decks), (num_shoes, 1))
+    shoes = rng.permuted(fresh, axis=1)[:, :per_shoe * block].reshape(num_shoes, per_shoe, block)
+
+    tags = get_counting_system(system).bet_tags[shoes].sum(axis=2)
+    running = np.cumsum(tags, axis=1) - tags
+    remaining = shoe_size - block * np.arange(per_shoe)
+    true_count = running / np.maximum(1, remaining / 52)
+
+    rounds = shoes.reshape(-1, block)[:num_rounds]
+    return {
+        'initial': rounds[:, :4],
+        'player_draws': rounds[:, 4:4 + max_draws],
+        'dealer_draws': rounds[:, 4 + max_draws:],
+        'true_count': true_count.reshape(-1)[:num_rounds],
+    }
+
+
+def antithetic_rounds(rounds: dict) -> dict:
+    """Same rounds with the player's and dealer's cards exchanged."""
+    initial = rounds['initial']
+    return {
+        'initial': initial[:, [2, 3, 0, 1]],
+        'player_draws': rounds['dealer_draws'],
+        'dealer_draws': rounds['player_draws'],
+        'true_count': rounds['true_count'],
+    }
+
+
+def play_rounds(strategy: StrategyTable, rounds: dict) -> np.ndarray:
+    """
+    Profit per unit bet of each pre-dealt round (3:2 naturals as compute_payout).
+    Raises ValueError if a hand needs more draws than the rounds were dealt with.
+    """
+    if not isinstance(strategy, StrategyTable):
+        raise TypeError("strategy must be a StrategyTable (see compile_strategy).")
+    initial = rounds['initial'].astype(np.int64)
+    player_draws, dealer_draws = rounds['player_draws'], rounds['dealer_draws']
+    last = player_draws.shape[1] - 1
+    n = len(initial)
+
+    p_total = initial[:, 0] + initial[:, 1]
+    p_ace = (initial[:, 0] == 1) | (initial[:, 1] == 1)
+    upcard = initial[:, 2]
+    d_total = upcard + initial[:, 3]
+    d_ace = (upcard == 1) | (initial[:, 3] == 1)
+    natural = _values(p_total, p_ace)[0] == 21
+    busted = np.zeros(n, dtype=bool)
+
+    if strategy.counted:
+        ci = np.clip(np.floor(rounds['true_count']).astype(np.int64),
+                     strategy.min_count, strategy.max_count) - strategy.min_count
+
+    playing = np.arange(n)
+    j = 0
+    while len(playing):
+        value, soft = _values(p_total[playing], p_ace[playing])
+        if strategy.counted:
+            hit = strategy.table[ci[playing], soft.astype(np.int64), value, upcard[playing]]
+        else:
+            hit = strategy.table[soft.astype(np.int64), value, upcard[playing]]
+        playing = playing[hit]
+        if not len(playing):
+            break
+        if j > last:
+            raise ValueError(f"A hand took more than {last + 1} draws; deal the rounds with a larger max_draws.")
+        card = player_draws[playing, j]
+        p_total[playing] += card
+        p_ace[playing] |= card == 1
+        bust = p_total[playing] > 21
+        busted[playing[bust]] = True
+        playing = playing[~bust]
+        j += 1
+
+    drawing = np.flatnonzero(~busted)
+    j = 0
+    while len(drawing):
+        drawing = drawing[_values(d_total[drawing], d_ace[drawing])[0] < 17]
+        if not len(drawing):
+            break
+        if j > last:
+            raise ValueError(f"The dealer took more than {last + 1} draws; deal the rounds with a larger max_draws.")
+        card = dealer_draws[drawing, j]
+        d_total[drawing] += card
+        d_ace[drawing] |= card == 1
+        j += 1
+
+    player_val = _values(p_total, p_ace)[0]
+    dealer_val = _values(d_total, d_ace)[0]
+    reward = np.where(dealer_val > 21, 1, np.sign(player_val - dealer_val))
+    reward[busted] = -1
+    return np.where(reward == 1, np.where(natural, 1.5, 1.0), reward.astype(float))
+
+
+def control_variates(rounds: dict, num_decks: int = 4) -> np.ndarray:
+    """
+    Zero-mean controls per round, shape (N, 3):
+    - Hi-Lo tags of the player's two cards
+    - Hi-Lo tag of the upcard
+    - natural indicator minus its exact probability
+    Every card position is marginally uniform over a full shoe, so the
+    expectations are known exactly.
+    """
+    initial = rounds['initial'].astype(np.int64)
+    tags = get_counting_system('hi-lo').tags[initial]
+    aces, tens, cards = 4 * num_decks, 16 * num_decks, 52 * num_decks
+    p_natural = 2 * aces * tens / (cards * (cards - 1))
+    natural = ((initial[:, 0] == 1) & (initial[:, 1] == 10)) | ((initial[:, 0] == 10) & (initial[:, 1] == 1))
+    return np.column_stack([tags[:, 0] + tags[:, 1], tags[:, 2], natural - p_natural]).astype(float)
+
+
+def estimate_mean(y: np.ndarray, controls: np.ndarray = None) -> tuple:
+    """
+    (mean, standard error) of y, optionally adjusted by zero-mean control
+    variates with regression-estimated coefficients.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if controls is None:
+        return y.mean(), y.std(ddof=1) / np.sqrt(n)
+    x = controls - controls.mean(axis=0)
+    beta, *_ = np.linalg.lstsq(x, y - y.mean(), rcond=None)
+    adjusted = y - controls @ beta
+    dof = max(1, n - 1 - controls.shape[1])
+    resid = adjusted - adjusted.mean()
+    return adjusted.mean(), np.sqrt(resid @ resid / dof / n)
+
+
+def compare_strategies(strategies: dict, num_rounds: int = 100000, baseline: str = None,
+                       num_decks: int = 4, rng=None, antithetic: bool = False,
+                       use_controls: bool = False) -> dict:
+    """
+    Play every StrategyTable in `strategies` ({name: table}) on the same
+    pre-dealt rounds (common random numbers).
+    Returns {name: {'ev', 'se'}} plus, for each non-baseline strategy,
+    'diff' and 'diff_se' against the baseline (default: first entry) and
+    'independent_se' (the SE of the difference without pairing) and
+    'variance_reduction' (independent_se**2 / diff_se**2).
+    antithetic adds the player/dealer-swapped round of every deal and averages
+    each pair; use_controls applies control_variates to every estimate.
+    """
+    names = list(strategies)
+    baseline = baseline or names[0]
+    rounds = deal_common_rounds(num_rounds, num_decks=num_decks, rng=rng)
+    payouts = {name: play_rounds(table, rounds) for name, table in strategies.items()}
+    controls = control_variates(rounds, num_decks) if use_controls else None
+    if antithetic:
+        swapped = antithetic_rounds(rounds)
+        for name, table in strategies.items():
+            payouts[name] = (payouts[name] + play_rounds(table, swapped)) / 2
+        if use_controls:
+            controls = (controls + control_variates(swapped, num_decks)) / 2
+
+    results = {}
+    for name in names:
+        ev, se = estimate_mean(payouts[name], controls)
+        results[name] = {'ev': ev, 'se': se}
+    for name in names:
+        if name == baseline:
+            continue
+        diff, diff_se = estimate_mean(payouts[name] - payouts[baseline], controls)
+        independent_se = np.hypot(results[name]['se'], results[baseline]['se'])
+        results[name].update({
+            'diff': diff,
+            'diff_se': diff_se,
+            'independent_se': independent_se,
+            'variance_reduction': (independent_se / diff_se) ** 2 if diff_se > 0 else np.inf,
+        })
+    return results
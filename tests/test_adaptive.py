@@ -0,0 +1,41 @@
+import pytest
+from blackjack_game.adaptive import simulate_until_converged
+from blackjack_game.bj_bots import simulate_strategy, simulate_martingale_strategy, basic_strategy
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE
+
+def test_converges_to_tolerance():
+    result = simulate_until_converged(simulate_strategy, BASIC_STRATEGY_TABLE, tolerance=0.01,
+                                      batch_hands=500, seed=1)
+    assert result['converged']
+    assert result['std_error'] <= 0.01
+    assert result['hands'] == result['batches'] * 500
+    assert result['ci_low'] <= result['ev_per_hand'] <= result['ci_high']
+
+def test_confidence_interval_tolerance():
+    result = simulate_until_converged(simulate_strategy, BASIC_STRATEGY_TABLE, tolerance=0.02,
+                                      confidence=0.95, batch_hands=500, seed=2)
+    assert result['converged']
+    assert result['ci_high'] - result['ci_low'] <= 2 * 0.02 + 1e-12
+    assert result['std_error'] * 1.96 == pytest.approx((result['ci_high'] - result['ci_low']) / 2, rel=1e-3)
+
+def test_hand_budget_stops_unconverged():
+    result = simulate_until_converged(simulate_strategy, basic_strategy, tolerance=1e-6,
+                                      batch_hands=100, max_hands=1500, seed=3)
+    assert not result['converged']
+    assert result['hands'] == 1500
+
+def test_hand_budget_below_one_batch():
+    calls = []
+    def sim(strategy_fn, num_hands, **kwargs):
+        calls.append(num_hands)
+        return simulate_strategy(strategy_fn, num_hands=num_hands, **kwargs)
+    with pytest.raises(ValueError):
+        simulate_until_converged(sim, BASIC_STRATEGY_TABLE, batch_hands=1000, max_hands=500, seed=3)
+    assert calls == []
+
+def test_reproducible_and_passes_kwargs():
+    kwargs = dict(tolerance=1e-6, batch_hands=50, max_hands=500, seed=4, initial_credits=1e6)
+    a = simulate_until_converged(simulate_martingale_strategy, BASIC_STRATEGY_TABLE, initial_bet=2.0, **kwargs)
+    b = simulate_until_converged(simulate_martingale_strategy, BASIC_STRATEGY_TABLE, initial_bet=2.0, **kwargs)
+    assert a['ev_per_hand'] == b['ev_per_hand']
+    assert a['roi_per_hand'] == pytest.approx(a['ev_per_hand'] / 1e6)
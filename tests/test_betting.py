@@ -0,0 +1,69 @@
+import pytest
+from blackjack_game.betting import (
+    BetPolicy, FlatBet, Martingale, Paroli, Fibonacci, CountRamp, KellyBet, replay_policy, compare_policies,
+)
+from blackjack_game.bj_bots import (
+    simulate_bet_policy, record_outcomes, simulate_martingale_strategy, simulate_card_counting_strategy,
+    basic_strategy, index_play_strategy,
+)
+
+
+def stakes(policy, results):
+    """Stakes a policy places over a sequence of +1/-1/0 unit results."""
+    policy.reset()
+    out = []
+    for r in results:
+        stake = policy.bet(1000.0)
+        out.append(stake)
+        policy.settle(stake, stake * r)
+    return out
+
+def test_policy_without_bet_cannot_be_built():
+    class NoStake(BetPolicy):
+        def settle(self, stake, profit):
+            pass
+    with pytest.raises(TypeError):
+        NoStake()
+
+def test_progressions():
+    assert stakes(Martingale(1), [-1, -1, 0, 1, -1]) == [1, 2, 4, 4, 1]
+    assert stakes(Martingale(1, max_bet=3), [-1, -1, -1]) == [1, 2, 3]
+    assert stakes(Paroli(1, presses=3), [1, 1, 1, 1, -1, 1]) == [1, 2, 4, 1, 2, 1]
+    assert stakes(Fibonacci(2), [-1, -1, -1, -1, 1, 1]) == [2, 2, 4, 6, 10, 4]
+    assert stakes(FlatBet(5), [1, -1]) == [5, 5]
+
+def test_count_ramp_limits_and_wong_out():
+    ramp = CountRamp(unit=10, table_min=10, table_max=50, wong_out=-1)
+    assert ramp.bet(1000, 0.5) == 10
+    assert ramp.bet(1000, 3.9) == 30
+    assert ramp.bet(1000, 12) == 50
+    assert ramp.bet(1000, -1.5) == 0
+
+def test_kelly_scales_with_edge_and_bankroll():
+    kelly = KellyBet(fraction=1.0, base_edge=-0.005, edge_per_count=0.005, variance=1.0)
+    assert kelly.bet(1000, 0) == 0
+    assert kelly.bet(1000, 3) == pytest.approx(10.0)
+    assert kelly.bet(2000, 3) == pytest.approx(20.0)
+
+def test_replay_matches_live_simulation():
+    kwargs = dict(num_decks=6, penetration=0.8, play_with_count=True, rng=7)
+    outcomes = record_outcomes(index_play_strategy, num_hands=500, **kwargs)
+    for policy, credits in ((CountRamp(1.0, table_max=8, wong_out=-1), 1e4), (Martingale(1.0), 30.0)):
+        live = simulate_bet_policy(index_play_strategy, policy, num_hands=500, initial_credits=credits,
+                                   return_history=True, **kwargs)
+        assert replay_policy(policy, outcomes, initial_credits=credits, return_history=True) == \
+            pytest.approx(live)
+
+def test_legacy_simulators_are_policy_wrappers():
+    assert simulate_martingale_strategy(basic_strategy, num_hands=200, rng=3, return_history=True) == \
+        simulate_bet_policy(basic_strategy, Martingale(1.0), num_hands=200, rng=3, return_history=True)
+    assert simulate_card_counting_strategy(index_play_strategy, num_hands=200, rng=3) == \
+        simulate_bet_policy(index_play_strategy, CountRamp(1.0), num_hands=200, num_decks=6,
+                            penetration=5 / 6, play_with_count=True, rng=3)
+
+def test_compare_policies_share_one_stream():
+    outcomes = record_outcomes(basic_strategy, num_hands=300, rng=1)
+    results = compare_policies({'flat': FlatBet(), 'paroli': Paroli(), 'fib': Fibonacci()}, outcomes,
+                               initial_credits=1000.0)
+    assert set(results) == {'flat', 'paroli', 'fib'}
+    assert results['flat'] == pytest.approx(1000.0 + outcomes['units'].sum())
@@ -1,5 +1,5 @@
 import pytest
-from blackjack_game.bj import BlackjackGame
+from blackjack_game.bj import BlackjackGame, HI_LO_TAGS
 
 def test_hand_value_no_ace():
     game = BlackjackGame(num_decks=1)
@@ -101,4 +101,101 @@ def test_dealer_hits_below_17_and_stands_on_soft17():
     game.done = False
     state, reward, done = game.step('stand')
     assert state['dealer_hand'] == [1, 6]
-    assert done is True
\ No newline at end of file
+    assert done is True
+def test_seeded_rng_reproducible():
+    assert BlackjackGame(rng=42).deck == BlackjackGame(rng=42).deck
+    assert BlackjackGame(rng=42).deck != BlackjackGame(rng=43).deck
+
+def test_numpy_generator_rng():
+    import numpy as np
+    a = BlackjackGame(rng=np.random.default_rng(7))
+    b = BlackjackGame(rng=np.random.PCG64(7))
+    assert a.deck == b.deck
+    assert sorted(a.deck) == sorted(BlackjackGame().deck)
+    assert all(type(c) is int for c in a.deck)
+
+def test_invalid_rng_raises_type_error():
+    with pytest.raises(TypeError):
+        BlackjackGame(rng="not an rng")
+
+def test_tuple_api_tracks_hand_incrementally():
+    game = BlackjackGame(num_decks=1, rng=0)
+    value, soft, upcard = game.deal()
+    assert (value, soft) == (game._hand_value(game.player), 1 in game.player and sum(game.player) <= 11)
+    assert upcard == game.dealer[0]
+    assert game.player_cards == 2
+    while value < 17:
+        value, soft = game.hit()
+    assert value == game._hand_value(game.player)
+    if value <= 21:
+        reward = game.stand()
+        assert reward in (-1, 0, 1)
+        assert game.dealer_value() == game._hand_value(game.dealer)
+    assert game.done is True
+
+def test_tuple_api_matches_dict_api():
+    a = BlackjackGame(rng=11)
+    b = BlackjackGame(rng=11)
+    for _ in range(200):
+        state = a.reset()
+        value, soft, upcard = b.deal()
+        assert value == a._hand_value(state['player_hand'])
+        assert upcard == state['dealer_upcard']
+        state, reward, done = a.step('stand')
+        assert b.stand() == reward
+
+def test_assigning_hand_resyncs_totals():
+    game = BlackjackGame(num_decks=1)
+    game.player = [1, 1, 9]
+    assert game.player_value() == (21, True)
+    assert game.player_cards == 3
+
+def test_deal_leaves_assigned_hands_alone():
+    game = BlackjackGame(num_decks=1, rng=0)
+    hand, dealer = [10, 7], [9, 8]
+    game.player, game.dealer = hand, dealer
+    game.deal()
+    assert hand == [10, 7] and dealer == [9, 8]
+    assert game.player is not hand and game.player_cards == 2
+
+def test_step_before_reset_raises():
+    game = BlackjackGame(num_decks=1)
+    with pytest.raises(RuntimeError):
+        game.step('stand')
+
+def test_shoe_tracks_running_count_on_every_draw():
+    game = BlackjackGame(num_decks=1, rng=4)
+    shoe = list(game.deck)
+    drawn = [game._draw() for _ in range(30)]
+    assert drawn == shoe[::-1][:30]
+    assert game.running_count == sum(HI_LO_TAGS[c] for c in drawn)
+    assert game.cards_dealt == 30
+    assert game.true_count == game.running_count  # under one deck left: divide by 1
+
+def test_reshuffle_resets_count():
+    game = BlackjackGame(num_decks=1, rng=4)
+    for _ in range(40):  # crosses the 15-card reshuffle
+        game._draw()
+    assert game.cards_dealt == 40 - 38
+    # Hi-Lo is balanced, so the count of the dealt cards mirrors the rest of the shoe
+    assert game.running_count == -sum(HI_LO_TAGS[c] for c in game.deck)
+
+def test_cut_card_reshuffles_between_rounds():
+    game = BlackjackGame(num_decks=2, rng=1, penetration=0.5)
+    assert not game.shuffle_if_due()
+    while game.cards_dealt <= 52:
+        game.deal()
+    assert game.shuffle_if_due()
+    assert game.cards_dealt == 0 and game.running_count == 0
+    game.deal()
+    assert game.cards_dealt == 4
+
+def test_custom_count_tags():
+    tags = (0, -2, 1, 1, 2, 2, 1, 1, 0, -1, -2)
+    game = BlackjackGame(num_decks=1, rng=2, tags=tags)
+    drawn = [game._draw() for _ in range(20)]
+    assert game.running_count == sum(tags[c] for c in drawn)
+    with pytest.raises(ValueError):
+        BlackjackGame(tags=(1, 2, 3))
+    with pytest.raises(ValueError):
+        BlackjackGame(penetration=1.5)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from blackjack_game.bj import BlackjackGame
+from blackjack_game.bj_bots import compute_payout
+from blackjack_game.bj_batch import BatchBlackjackGame, batch_payout, simulate_batch_strategy
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE, HIT_UNTIL_19_TABLE, INDEX_PLAY_TABLE
+
+def _play_scalar(shoe, strategy, true_count=0.0):
+    # BlackjackGame pops from the end of its deck
+    game = BlackjackGame()
+    game.deck = list(shoe[::-1])
+    state = game.reset()
+    done = False
+    while not done:
+        state, reward, done = game.step(strategy(state, true_count))
+    return reward
+
+@pytest.mark.parametrize("strategy", [BASIC_STRATEGY_TABLE, HIT_UNTIL_19_TABLE])
+def test_batch_matches_blackjack_game(strategy):
+    engine = BatchBlackjackGame(num_tables=500, rng=1)
+    shoes = engine.shoes.copy()
+    reward, _ = engine.play_round(strategy)
+    for i in range(engine.num_tables):
+        assert reward[i] == _play_scalar(shoes[i].tolist(), strategy)
+
+def test_batch_count_table_uses_true_count():
+    engine = BatchBlackjackGame(num_tables=300, rng=2)
+    shoes = engine.shoes.copy()
+    tc = np.linspace(-5, 5, 300)
+    reward, _ = engine.play_round(INDEX_PLAY_TABLE, true_count=tc)
+    for i in range(engine.num_tables):
+        assert reward[i] == _play_scalar(shoes[i].tolist(), INDEX_PLAY_TABLE, tc[i])
+
+def test_batch_reshuffles_and_counts():
+    engine = BatchBlackjackGame(num_tables=10, num_decks=1, rng=3)
+    for _ in range(50):
+        engine.play_round(BASIC_STRATEGY_TABLE)
+        assert (engine.shoe_size - engine.pos >= 0).all()
+    # running count equals the Hi-Lo sum of the cards dealt since the last shuffle
+    for i in range(engine.num_tables):
+        dealt = engine.shoes[i, :engine.pos[i]].astype(int)
+        expected = sum(1 if 2 <= c <= 6 else (-1 if c in (1, 10) else 0) for c in dealt)
+        assert engine.running_count[i] == expected
+
+def test_batch_payout_matches_compute_payout():
+    rewards = np.array([1, 1, 0, -1])
+    naturals = np.array([True, False, False, False])
+    expected = [compute_payout(bool(b), int(r), 2.0) for b, r in zip(naturals, rewards)]
+    assert batch_payout(naturals, rewards, 2.0).tolist() == expected
+
+def test_simulate_batch_strategy_seeded():
+    a = simulate_batch_strategy(BASIC_STRATEGY_TABLE, num_hands=20, num_tables=50, rng=7)
+    b = simulate_batch_strategy(BASIC_STRATEGY_TABLE, num_hands=20, num_tables=50, rng=7)
+    assert a.shape == (50,)
+    assert (a == b).all()
+
+def test_batch_rejects_plain_functions():
+    engine = BatchBlackjackGame(num_tables=2, rng=0)
+    with pytest.raises(TypeError):
+        engine.play_round(lambda state: 'stand')
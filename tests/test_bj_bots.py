@@ -7,6 +7,9 @@ from blackjack_game.bj_bots import (
     basic_strategy,
     basic_strategy_ignoring_count,
     index_play_strategy,
+    simulate_strategy,
+    simulate_martingale_strategy,
+    simulate_card_counting_strategy,
 )
 
 def test_compute_payout():
@@ -71,4 +74,57 @@ def test_index_play_strategy_deviation():
     assert index_play_strategy({'player_hand': [12], 'dealer_upcard': 3}, 2) == 'stand'
     soft_state = {'player_hand': [1,7], 'dealer_upcard': 2}
     for tc in [-5, 0, 5]:
-        assert index_play_strategy(soft_state, tc) == basic_strategy(soft_state)
\ No newline at end of file
+        assert index_play_strategy(soft_state, tc) == basic_strategy(soft_state)
+
+def test_simulators_return_history():
+    history = simulate_strategy(basic_strategy, num_hands=25, return_history=True)
+    assert len(history) == 25
+    # flat one-credit bets move credits by at most 1.5 per hand
+    prev = 100.0
+    for credits in history:
+        assert abs(credits - prev) <= 1.5
+        prev = credits
+
+    history = simulate_martingale_strategy(basic_strategy, num_hands=25, initial_credits=1.0,
+                                           return_history=True)
+    assert len(history) == 25
+
+    history = simulate_card_counting_strategy(index_play_strategy, num_hands=25, return_history=True)
+    assert len(history) == 25
+
+
+def test_simulators_reproducible_with_rng():
+    assert simulate_strategy(basic_strategy, num_hands=50, rng=3, return_history=True) == \
+        simulate_strategy(basic_strategy, num_hands=50, rng=3, return_history=True)
+    assert simulate_martingale_strategy(basic_strategy, num_hands=50, rng=3) == \
+        simulate_martingale_strategy(basic_strategy, num_hands=50, rng=3)
+    assert simulate_card_counting_strategy(index_play_strategy, num_hands=50, rng=3) == \
+        simulate_card_counting_strategy(index_play_strategy, num_hands=50, rng=3)
+
+
+def test_table_strategy_fast_path_matches_dict_path():
+    from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE
+    assert simulate_strategy(basic_strategy, num_hands=300, rng=5, return_history=True) == \
+        simulate_strategy(BASIC_STRATEGY_TABLE, num_hands=300, rng=5, return_history=True)
+
+
+def test_card_counting_penetration_and_table_fast_path():
+    from blackjack_game.strategy_tables import INDEX_PLAY_TABLE
+    deep = simulate_card_counting_strategy(index_play_strategy, num_hands=300, initial_credits=1e6,
+                                           penetration=0.9, rng=8, return_history=True)
+    shallow = simulate_card_counting_strategy(index_play_strategy, num_hands=300, initial_credits=1e6,
+                                              penetration=0.5, rng=8, return_history=True)
+    assert deep != shallow
+    assert simulate_card_counting_strategy(INDEX_PLAY_TABLE, num_hands=300, initial_credits=1e6, rng=8,
+                                           return_history=True) == \
+        simulate_card_counting_strategy(index_play_strategy, num_hands=300, initial_credits=1e6, rng=8,
+                                        return_history=True)
+
+
+def test_card_counting_single_deck():
+    # one deck has no cut card to place a deck from the end: only the low-shoe reshuffle
+    history = simulate_card_counting_strategy(index_play_strategy, num_hands=200, num_decks=1, rng=0,
+                                              return_history=True)
+    assert len(history) == 200
+    from blackjack_game.bj import counting_penetration
+    assert counting_penetration(1) is None and counting_penetration(4) == 0.75
@@ -0,0 +1,56 @@
+import pytest
+from blackjack_game.bj_batch import simulate_batch_strategy
+from blackjack_game.strategy_tables import ALWAYS_STAND_TABLE
+from blackjack_game.bj_ev import (
+    full_shoe,
+    remove_cards,
+    dealer_outcome_probs,
+    stand_outcome,
+    decision_evs,
+    optimal_action,
+    strategy_ev,
+)
+
+TENS_ONLY = (0,) * 9 + (10,)
+
+def test_full_shoe_and_remove_cards():
+    shoe = full_shoe(4)
+    assert sum(shoe) == 208
+    assert remove_cards(shoe, [1, 10, 10]) == (15,) + (16,) * 8 + (62,)
+    with pytest.raises(ValueError):
+        remove_cards(TENS_ONLY, [5])
+
+def test_dealer_probs_sum_to_one():
+    shoe = full_shoe(4)
+    for up in range(1, 11):
+        assert sum(dealer_outcome_probs(up, remove_cards(shoe, [up]))) == pytest.approx(1.0)
+
+def test_dealer_bust_rate_vs_six():
+    bust = dealer_outcome_probs(6, remove_cards(full_shoe(4), [6]))[5]
+    assert 0.40 < bust < 0.44
+
+def test_deterministic_shoe():
+    assert dealer_outcome_probs(10, TENS_ONLY) == (0.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    assert stand_outcome(20, 10, TENS_ONLY) == (0.0, 1.0, 0.0)
+    assert strategy_ev(ALWAYS_STAND_TABLE, shoe=TENS_ONLY) == 0.0
+
+def test_natural_pays_three_to_two():
+    evs = decision_evs([1, 10], 10, shoe=TENS_ONLY)
+    # dealer always makes 20, so the natural wins 1.5 and hitting busts or ties down
+    assert evs['stand'] == 1.5
+
+def test_optimal_actions():
+    assert optimal_action([10, 6], 10) == 'hit'
+    assert optimal_action([10, 7], 10) == 'stand'
+    assert optimal_action([5, 6], 6) == 'hit'
+    assert optimal_action([10, 3], 6) == 'stand'
+
+def test_strategy_ev_matches_simulation():
+    exact = strategy_ev(ALWAYS_STAND_TABLE)
+    sim = simulate_batch_strategy(ALWAYS_STAND_TABLE, num_hands=100, num_tables=2000,
+                                  initial_credits=0.0, rng=0).mean() / 100
+    assert exact == pytest.approx(-0.1647, abs=1e-3)
+    assert sim == pytest.approx(exact, abs=0.01)
+
+def test_strategy_ev_accepts_plain_functions():
+    assert strategy_ev(lambda state: 'stand', shoe=TENS_ONLY) == 0.0
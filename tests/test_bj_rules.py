@@ -0,0 +1,96 @@
+import pytest
+from blackjack_game.bj_rules import (
+    TableRules, RulesBlackjackGame, FULL_BASIC_STRATEGY, full_basic_strategy,
+    HIT, STAND, DOUBLE, SPLIT, SURRENDER,
+)
+from blackjack_game.bj_bots import simulate_rules_strategy, basic_strategy
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE
+
+
+def rigged(cards, **rules):
+    """Game dealing `cards` in order: p1, p2, upcard, hole, then draws."""
+    game = RulesBlackjackGame(TableRules(**rules), rng=0)
+    game.deck = [5] * 20 + cards[::-1]
+    return game
+
+def fixed(*actions):
+    """Strategy playing the given first actions, then standing."""
+    queue = list(actions)
+    return lambda state: queue.pop(0) if queue else STAND
+
+
+def test_dealer_blackjack_peek_ends_round():
+    assert rigged([10, 9, 1, 10]).play_round(fixed(HIT)) == -1
+    assert rigged([10, 9, 1, 10]).play_round(fixed(), insure=True) == 0  # insurance pays 2:1
+    assert rigged([1, 10, 10, 1]).play_round(fixed()) == 0                # blackjack push
+
+def test_no_peek_dealer_blackjack_takes_doubles():
+    game = rigged([6, 5, 10, 1, 2], peek=False)
+    assert game.play_round(fixed(DOUBLE)) == -2
+
+def test_natural_payouts():
+    assert rigged([1, 10, 10, 7]).play_round(fixed()) == 1.5
+    assert rigged([1, 10, 10, 7], blackjack_payout=1.2).play_round(fixed()) == pytest.approx(1.2)
+
+def test_insurance_lost_without_dealer_blackjack():
+    assert rigged([10, 10, 1, 7]).play_round(fixed(), insure=True) == 0.5   # +1 hand, -0.5 insurance
+
+def test_double_and_surrender():
+    assert rigged([6, 5, 10, 7, 10]).play_round(fixed(DOUBLE)) == 2
+    assert rigged([10, 6, 10, 7]).play_round(fixed(SURRENDER)) == -0.5
+
+def test_split_and_double_after_split():
+    # 8,8 vs 6: split, first hand 8+3 doubles to 21, second 8+10 stands; dealer 6+10+10 busts
+    game = rigged([8, 8, 6, 10, 3, 10, 10, 10])
+    assert game.play_round(fixed(SPLIT, DOUBLE, STAND)) == 3
+    assert [len(h) for h in game.hands] == [3, 2] and game.bets == [2, 1]
+
+def test_split_aces_get_one_card_and_21_is_not_blackjack():
+    game = rigged([1, 1, 9, 8, 10, 10])
+    seen = []
+    def strategy(state):
+        seen.append(state['actions'])
+        return SPLIT if SPLIT in state['actions'] else STAND
+    assert game.play_round(strategy) == 2  # two 21s vs 17, paid 1:1
+    assert seen[1] == (STAND,)
+
+def test_illegal_action_raises():
+    with pytest.raises(ValueError):
+        rigged([10, 6, 10, 7]).play_round(fixed(SPLIT))
+    with pytest.raises(ValueError):
+        rigged([10, 6, 10, 7], surrender=False).play_round(fixed(SURRENDER))
+
+def test_max_hands_limits_resplits():
+    game = rigged([8, 8, 6, 10, 8, 8, 8, 10, 10, 10, 10], max_hands=2)
+    profit = game.play_round(fixed(SPLIT, STAND, STAND))
+    assert len(game.hands) == 2 and profit == 2
+
+def test_dealer_soft_17_rule():
+    stand17 = rigged([10, 8, 1, 6])
+    assert stand17.play_round(fixed()) == 1
+    hit17 = rigged([10, 8, 1, 6, 2], hit_soft_17=True)
+    assert hit17.play_round(fixed()) == -1  # dealer draws to 19
+
+def test_chart_decisions():
+    decide = FULL_BASIC_STRATEGY.decide
+    first = (HIT, STAND, DOUBLE, SURRENDER)
+    pair = first + (SPLIT,)
+    assert decide([6, 5], 11, False, 6, first) == DOUBLE
+    assert decide([8, 8], 16, False, 10, pair) == SPLIT
+    assert decide([10, 6], 16, False, 10, first) == SURRENDER
+    assert decide([10, 6], 16, False, 10, (HIT, STAND)) == HIT
+    assert decide([1, 7], 18, True, 4, (HIT, STAND)) == STAND  # Ds falls back to stand
+    assert decide([2, 2], 4, False, 2, pair) == SPLIT
+    assert decide([5, 5], 10, False, 6, pair) == DOUBLE
+    no_das = full_basic_strategy(TableRules(double_after_split=False))
+    assert no_das.decide([2, 2], 4, False, 2, pair) == HIT
+
+def test_simulated_edge_matches_full_rules():
+    hands = 100000
+    full = simulate_rules_strategy(FULL_BASIC_STRATEGY, num_hands=hands, initial_credits=0.0, rng=1)
+    table = simulate_rules_strategy(BASIC_STRATEGY_TABLE, num_hands=hands, initial_credits=0.0, rng=1)
+    assert -0.015 < full / hands < 0.01
+    assert full > table  # doubling/splitting/surrender beat hit/stand only
+    a = simulate_rules_strategy(basic_strategy, num_hands=200, return_history=True, rng=3)
+    b = simulate_rules_strategy(basic_strategy, num_hands=200, return_history=True, rng=3)
+    assert a == b and len(a) == 200
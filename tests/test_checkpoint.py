@@ -0,0 +1,90 @@
+import random
+import numpy as np
+import pytest
+from blackjack_game.betting import FlatBet, Martingale, Fibonacci, Paroli, CountRamp
+from blackjack_game.bj_bots import simulate_bet_policy, simulate_card_counting_strategy
+from blackjack_game.checkpoint import load_checkpoint
+from blackjack_game.shoe_bank import write_shoe_bank, ShoeBank
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE, INDEX_PLAY_TABLE, StrategyTable
+
+class Killed(Exception):
+    pass
+
+class Dying(StrategyTable):
+    # the same table, dying after `hands` decisions like a killed process
+    def __init__(self, strategy, hands):
+        super().__init__(strategy.table, strategy.min_count)
+        self.calls, self.hands = 0, hands
+
+    def lookup(self, value, is_soft, upcard, true_count=0.0):
+        self.calls += 1
+        if self.calls > self.hands:
+            raise Killed
+        return super().lookup(value, is_soft, upcard, true_count)
+
+def _interrupted(tmp_path, run, decisions_before_kill):
+    path = str(tmp_path / "run.ckpt")
+    with pytest.raises(Killed):
+        run(Dying(INDEX_PLAY_TABLE, decisions_before_kill), path)
+    # the shoe and its RNG come from the checkpoint, not from a new rng
+    return run(INDEX_PLAY_TABLE, path, seed=99)
+
+@pytest.mark.parametrize('rng', ['random', 'numpy', 'global'])
+def test_resume_matches_uninterrupted_run(tmp_path, rng):
+    def make_rng(seed):
+        if rng == 'numpy':
+            return np.random.default_rng(seed)
+        if rng == 'global':
+            random.seed(seed)
+            return None
+        return seed
+
+    def run(strategy, checkpoint=None, seed=5):
+        return simulate_bet_policy(strategy, Paroli(2.0), num_hands=3000, initial_credits=500.0,
+                                   num_decks=6, penetration=0.75, play_with_count=True, return_history=True,
+                                   rng=make_rng(seed), checkpoint=checkpoint, checkpoint_every=500)
+
+    expected = run(INDEX_PLAY_TABLE)
+    assert expected[-1] > 0
+    assert _interrupted(tmp_path, run, 1800) == expected
+
+def test_card_counting_resume(tmp_path):
+    def run(strategy, checkpoint=None, seed=3):
+        return simulate_card_counting_strategy(strategy, num_hands=4000, initial_credits=1000.0, num_decks=2,
+                                               rng=seed, checkpoint=checkpoint, checkpoint_every=250)
+    assert _interrupted(tmp_path, run, 3100) == run(INDEX_PLAY_TABLE)
+
+def test_shoe_bank_resume(tmp_path):
+    bank = ShoeBank(write_shoe_bank(str(tmp_path / "shoes.npy"), 50, num_decks=2, rng=0))
+    def run(strategy, checkpoint=None, seed=0):
+        return simulate_bet_policy(strategy, CountRamp(), num_hands=2000, initial_credits=1000.0,
+                                   penetration=0.7, play_with_count=True, rng=bank.reader(seed),
+                                   checkpoint=checkpoint, checkpoint_every=300)
+    assert _interrupted(tmp_path, run, 1000) == run(INDEX_PLAY_TABLE)
+
+def test_finished_checkpoint_and_parameter_check(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    final = simulate_bet_policy(BASIC_STRATEGY_TABLE, Fibonacci(), num_hands=200, rng=1, checkpoint=path)
+    assert load_checkpoint(path)['hand'] == 200
+    # a finished run is returned from the checkpoint without playing again
+    assert simulate_bet_policy(Dying(BASIC_STRATEGY_TABLE, 0), Fibonacci(), num_hands=200, rng=7,
+                               checkpoint=path) == final
+    with pytest.raises(ValueError):
+        simulate_bet_policy(BASIC_STRATEGY_TABLE, Fibonacci(), num_hands=300, checkpoint=path)
+    with pytest.raises(ValueError):
+        simulate_bet_policy(BASIC_STRATEGY_TABLE, Fibonacci(), num_hands=200, checkpoint=path, sink=[])
+
+def test_checkpoint_of_another_policy_or_strategy(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    simulate_bet_policy(BASIC_STRATEGY_TABLE, FlatBet(1.0), num_hands=100, rng=1, checkpoint=path)
+    policy = FlatBet(50.0)
+    with pytest.raises(ValueError):
+        simulate_bet_policy(BASIC_STRATEGY_TABLE, policy, num_hands=100, rng=2, checkpoint=path)
+    assert policy.unit == 50.0
+    with pytest.raises(ValueError):
+        simulate_bet_policy(BASIC_STRATEGY_TABLE, Martingale(1.0), num_hands=100, checkpoint=path)
+    with pytest.raises(ValueError):
+        simulate_bet_policy(INDEX_PLAY_TABLE, FlatBet(1.0), num_hands=100, checkpoint=path)
+
+def test_load_missing_checkpoint(tmp_path):
+    assert load_checkpoint(str(tmp_path / "none.ckpt")) is None
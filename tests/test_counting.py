@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from blackjack_game.bj import BlackjackGame, HI_LO_TAGS
+from blackjack_game.bj_batch import BatchBlackjackGame, simulate_batch_counting
+from blackjack_game.bj_bots import simulate_card_counting_strategy, basic_strategy_ignoring_count
+from blackjack_game.counting import (
+    COUNTING_SYSTEMS, DECK_COMPOSITION, CountingSystem, get_counting_system, tag_matrix,
+    register_counting_system,
+)
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE, INDEX_PLAY_TABLE
+
+
+def test_registry_systems_compile_to_balanced_bet_tags():
+    assert {'hi-lo', 'ko', 'omega-ii', 'zen', 'wong-halves', 'hi-opt-i', 'hi-opt-ii'} <= set(COUNTING_SYSTEMS)
+    for system in COUNTING_SYSTEMS.values():
+        assert system.bet_tags.shape == (11,)
+        assert DECK_COMPOSITION @ system.bet_tags == pytest.approx(0.0, abs=1e-12)
+    assert get_counting_system('Hi-Lo').scalar_tags() == HI_LO_TAGS
+    assert get_counting_system('ko').imbalance == 4
+    assert get_counting_system('wong-halves').balanced
+
+def test_ace_side_count_adjustment():
+    hi_opt = get_counting_system('hi-opt-i')
+    assert hi_opt.tags[1] == 0
+    # an ace dealt early leaves the shoe ace-poor: betting count drops by the weight
+    assert hi_opt.bet_tags[1] - hi_opt.bet_tags[9] == pytest.approx(-1.0)
+
+def test_lookup_errors_and_custom_systems():
+    with pytest.raises(ValueError):
+        get_counting_system('no-such-count')
+    with pytest.raises(ValueError):
+        CountingSystem('short', [1, 2, 3])
+    custom = register_counting_system(CountingSystem('test-custom', [0] * 10))
+    assert get_counting_system('TEST-CUSTOM') is custom
+    del COUNTING_SYSTEMS['test-custom']
+
+def test_scalar_shoe_count_is_histogram_dot_product():
+    system = get_counting_system('omega-ii')
+    game = BlackjackGame(num_decks=2, rng=3, tags=system.scalar_tags())
+    drawn = [game._draw() for _ in range(60)]
+    dealt = np.bincount(drawn, minlength=11)
+    assert game.running_count == pytest.approx(dealt @ system.bet_tags)
+
+def test_batch_counts_all_systems_in_one_product():
+    names = list(COUNTING_SYSTEMS)
+    engine = BatchBlackjackGame(num_tables=50, num_decks=2, rng=4)
+    for _ in range(5):
+        engine.play_round(BASIC_STRATEGY_TABLE)
+    tc = engine.true_counts(names)
+    decks = np.maximum(1, (engine.shoe_size - engine.pos) / 52)
+    for j, name in enumerate(names):
+        expected = engine.dealt @ get_counting_system(name).bet_tags / decks
+        assert np.allclose(tc[:, j], expected)
+    assert np.array_equal(engine.running_count, engine.dealt @ np.array(HI_LO_TAGS))
+    assert tag_matrix(names).shape == (len(names), 11)
+
+def test_simulate_batch_counting_sweeps_systems():
+    systems = ('hi-lo', 'zen', 'ko')
+    history = simulate_batch_counting(INDEX_PLAY_TABLE, systems=systems, num_hands=40, num_tables=30,
+                                      initial_credits=1000.0, rng=5, return_history=True)
+    assert history.shape == (3, 30, 40)
+    final = simulate_batch_counting(INDEX_PLAY_TABLE, systems=systems, num_hands=40, num_tables=30,
+                                    initial_credits=1000.0, rng=5)
+    assert np.array_equal(final, history[:, :, -1])
+    assert not np.array_equal(final[0], final[1])  # level-2 Zen ramps differently
+    single = simulate_batch_counting(INDEX_PLAY_TABLE, num_hands=40, num_tables=30, num_decks=1, rng=5)
+    assert single.shape == (1, 30)
+
+def test_card_counting_simulator_takes_system():
+    kwargs = dict(num_hands=300, initial_credits=1e6, rng=6, return_history=True)
+    hi_lo = simulate_card_counting_strategy(basic_strategy_ignoring_count, system='hi-lo', **kwargs)
+    zen = simulate_card_counting_strategy(basic_strategy_ignoring_count, system=get_counting_system('zen'), **kwargs)
+    assert hi_lo == simulate_card_counting_strategy(basic_strategy_ignoring_count, **kwargs)
+    assert hi_lo != zen
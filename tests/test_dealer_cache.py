@@ -0,0 +1,49 @@
+import pytest
+from blackjack_game.bj_ev import full_shoe, remove_cards
+from blackjack_game.dealer_cache import DealerCache, pack_shoe, composition
+
+def test_pack_shoe_and_composition():
+    assert pack_shoe((1, 2, 3, 4, 5, 6, 7, 8, 9, 10)) == bytes(range(1, 11))
+    assert composition([1, 10, 10, 5]) == pack_shoe((1, 0, 0, 0, 1, 0, 0, 0, 0, 2))
+    with pytest.raises(ValueError):
+        pack_shoe((4, 4, 4, 4, 4, 4, 4, 4, 4, 256))
+
+def test_probs_sum_to_one_and_accept_any_shoe_type():
+    cache = DealerCache()
+    shoe = remove_cards(full_shoe(4), [7])
+    probs = cache.probs(7, shoe)
+    assert sum(probs) == pytest.approx(1.0)
+    assert cache.probs(7, list(shoe)) == probs
+    assert cache.probs(7, pack_shoe(shoe)) == probs
+
+def test_hit_miss_statistics():
+    cache = DealerCache()
+    shoe = remove_cards(full_shoe(1), [5])
+    cache.probs(5, shoe)
+    first = cache.stats()
+    assert first['misses'] > 0
+    cache.probs(5, shoe)
+    second = cache.stats()
+    assert second['hits'] == first['hits'] + 1
+    assert second['misses'] == first['misses']
+    assert 0.0 < second['hit_rate'] < 1.0
+
+def test_bounded_eviction():
+    cache = DealerCache(maxsize=16)
+    shoe = full_shoe(1)
+    unbounded = DealerCache()
+    assert cache.probs(2, shoe) == pytest.approx(unbounded.probs(2, shoe))
+    stats = cache.stats()
+    assert stats['size'] <= 16
+    assert stats['evictions'] > 0
+
+def test_clear_resets():
+    cache = DealerCache()
+    cache.probs(10, full_shoe(1))
+    cache.clear()
+    assert cache.stats()['size'] == 0
+    assert cache.stats()['hits'] == 0
+
+def test_bust_probability_tens_only():
+    cache = DealerCache()
+    assert cache.bust_probability(6, (0,) * 9 + (8,)) == 1.0
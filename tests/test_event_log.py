@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from blackjack_game.bj_bots import (
+    basic_strategy,
+    index_play_strategy,
+    simulate_strategy,
+    simulate_martingale_strategy,
+    simulate_card_counting_strategy,
+)
+from blackjack_game.bj_rules import TableRules, RulesBlackjackGame, FULL_BASIC_STRATEGY, STAND, HIT, DOUBLE, SPLIT
+from blackjack_game.event_log import HandLogWriter, HandLog, HAND_COLUMNS
+
+def test_simulate_strategy_log_roundtrip(tmp_path):
+    with HandLogWriter(str(tmp_path / "log"), chunk_size=64) as sink:
+        final = simulate_strategy(basic_strategy, num_hands=300, initial_credits=100.0, rng=1, sink=sink)
+    log = HandLog(str(tmp_path / "log"))
+    assert len(log) == 300
+    assert log.meta['chunks'] == 5
+    assert set(log.columns) == set(HAND_COLUMNS)
+    assert 100.0 + log.column('payout').sum() == pytest.approx(final)
+    assert (log.column('bet') == 1.0).all()
+    assert (log.column('running_count') == 0).all()
+
+def test_log_rows_are_consistent(tmp_path):
+    with HandLogWriter(str(tmp_path / "log"), chunk_size=50) as sink:
+        simulate_martingale_strategy(basic_strategy, num_hands=200, initial_credits=1e6, rng=2, sink=sink)
+    log = HandLog(str(tmp_path / "log"))
+    player_final = log.column('player_final')
+    payout = log.column('payout')
+    hits = log.column('hits')
+    # busted hands always lose the bet
+    busted = player_final > 21
+    assert (payout[busted] < 0).all()
+    # players never hit with 17 or more under basic strategy
+    assert (hits[(log.column('p1') + log.column('p2') >= 17)] == 0).all()
+
+def test_card_counting_log_records_counts(tmp_path):
+    with HandLogWriter(str(tmp_path / "log")) as sink:
+        final = simulate_card_counting_strategy(index_play_strategy, num_hands=400, initial_credits=1e6,
+                                                rng=3, sink=sink)
+    log = HandLog(str(tmp_path / "log"))
+    assert 1e6 + log.column('payout').sum() == pytest.approx(final)
+    assert log.column('running_count').any()
+    bets = log.column('bet')
+    expected = np.maximum(1, log.column('true_count').astype(np.float64).astype(int))
+    assert (bets == expected).all()
+
+def test_rules_rounds_count_hits_over_split_hands(tmp_path):
+    # 8,8 vs 6 splits: 8,3 doubles onto a 10 (no hit), 8,2 hits twice
+    game = RulesBlackjackGame(TableRules(), rng=0)
+    game.deck = [5] * 20 + [8, 8, 6, 10, 3, 10, 2, 2, 2, 10][::-1]
+    queue = [SPLIT, DOUBLE, HIT, HIT]
+    payout = game.play_round(lambda state: queue.pop(0) if queue else STAND)
+    with HandLogWriter(str(tmp_path / "log")) as sink:
+        sink.record(game, 1.0, payout, running_count=3)
+    log = HandLog(str(tmp_path / "log"))
+    assert log.column('hits').tolist() == [2]
+    assert log.column('running_count').dtype == np.int32
+
+def test_fractional_running_count_rejected(tmp_path):
+    game = RulesBlackjackGame(rng=0)
+    payout = game.play_round(FULL_BASIC_STRATEGY)
+    with HandLogWriter(str(tmp_path / "log")) as sink:
+        with pytest.raises(ValueError):
+            sink.record(game, 1.0, payout, running_count=0.5)
+    assert len(HandLog(str(tmp_path / "log"))) == 0
+
+def test_iter_chunks_memory_maps(tmp_path):
+    with HandLogWriter(str(tmp_path / "log"), chunk_size=10) as sink:
+        simulate_strategy(basic_strategy, num_hands=25, rng=4, sink=sink)
+    chunks = list(HandLog(str(tmp_path / "log")).iter_chunks('upcard', 'payout'))
+    assert [len(c['upcard']) for c in chunks] == [10, 10, 5]
+    assert isinstance(chunks[0]['payout'], np.memmap)
+
+def test_empty_log(tmp_path):
+    HandLogWriter(str(tmp_path / "log")).close()
+    log = HandLog(str(tmp_path / "log"))
+    assert len(log) == 0
+    assert log.column('bet').shape == (0,)
+    with pytest.raises(KeyError):
+        log.column('nope')
@@ -0,0 +1,57 @@
+import random
+import numpy as np
+import pytest
+from blackjack_game.bj_bots import simulate_strategy
+from blackjack_game.jit import HAVE_NUMBA, session_kernel
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE, HIT_UNTIL_19_TABLE, INDEX_PLAY_TABLE
+
+@pytest.mark.parametrize('table', [BASIC_STRATEGY_TABLE, HIT_UNTIL_19_TABLE, INDEX_PLAY_TABLE])
+@pytest.mark.parametrize('seed', [0, 7])
+def test_kernel_matches_python_path(table, seed):
+    for make_rng in (lambda: seed, lambda: np.random.default_rng(seed)):
+        python = simulate_strategy(table, num_hands=3000, bet=2.0, return_history=True, rng=make_rng(), jit=False)
+        kernel = simulate_strategy(table, num_hands=3000, bet=2.0, return_history=True, rng=make_rng(), jit=True)
+        assert kernel == python
+    assert simulate_strategy(table, num_hands=500, rng=seed, jit=True) == \
+        simulate_strategy(table, num_hands=500, rng=seed, jit=False)
+
+def test_global_random_state_matches():
+    random.seed(11)
+    python = simulate_strategy(BASIC_STRATEGY_TABLE, num_hands=1000, jit=False), random.random()
+    random.seed(11)
+    kernel = simulate_strategy(BASIC_STRATEGY_TABLE, num_hands=1000, jit=True), random.random()
+    assert kernel == python
+
+def test_plain_functions_use_python_path():
+    calls = []
+    def strategy(state):
+        calls.append(1)
+        return 'stand'
+    simulate_strategy(strategy, num_hands=10, rng=0, jit=True)
+    assert len(calls) == 10
+
+def test_counted_tables_use_python_path(monkeypatch):
+    import blackjack_game.bj_bots as bj_bots
+    def kernel(*args):
+        raise AssertionError("count-indexed table reached the kernel")
+    monkeypatch.setattr(bj_bots, 'session_kernel', kernel)
+    simulate_strategy(INDEX_PLAY_TABLE, num_hands=10, rng=0, jit=True)
+    with pytest.raises(AssertionError):
+        simulate_strategy(BASIC_STRATEGY_TABLE, num_hands=10, rng=0, jit=True)
+
+def test_kernel_hands_back_reshuffles():
+    # player 10+3 vs 10 (hole 6) hits twice to 17; the dealer's 16 must draw
+    # with 14 cards left, where BlackjackGame would reshuffle: nothing is committed
+    history = np.zeros(1)
+    deck = np.array([10] * 14 + [2, 2, 6, 10, 3, 10], dtype=np.uint8)
+    assert session_kernel(deck, len(deck), BASIC_STRATEGY_TABLE.table, 1, 0, 0.0, 1.0, history, 0) == (0, 20, 0.0)
+    # with enough cards the dealer draws a ten and busts
+    deck = np.array([10] * 30 + [2, 2, 6, 10, 3, 10], dtype=np.uint8)
+    assert session_kernel(deck, len(deck), BASIC_STRATEGY_TABLE.table, 1, 0, 0.0, 1.0, history, 0) == (1, 29, 1.0)
+    assert history[0] == 1.0
+    # past the cut card the next hand is left to the game
+    assert session_kernel(deck, len(deck), BASIC_STRATEGY_TABLE.table, 1, 0, 0.0, 1.0, history, 40)[0] == 0
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed")
+def test_kernel_is_compiled():
+    assert hasattr(session_kernel, 'py_func')
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from blackjack_game.bj_bots import simulate_strategy
+from blackjack_game.online_stats import TrajectoryStats
+from blackjack_game.parallel import parallel_trajectory_stats
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE
+from blackjack_game.strategy_tester import build_trajectory, build_trajectory_stats
+
+def _random_walks(runs, hands, seed=0):
+    rng = np.random.default_rng(seed)
+    return 10 + np.cumsum(rng.choice([-1.0, 1.0], size=(runs, hands)), axis=1)
+
+def test_mean_variance_and_ruin_match_dense():
+    data = _random_walks(500, 40)
+    stats = TrajectoryStats(40, ruin_level=0.0)
+    for row in data:
+        stats.update(row)
+    assert stats.runs == 500
+    assert np.allclose(stats.mean, data.mean(axis=0))
+    assert np.allclose(stats.variance(), data.var(axis=0, ddof=1))
+    ruined = (np.minimum.accumulate(data, axis=1) <= 0).mean(axis=0)
+    assert np.array_equal(stats.ruin_probability(), ruined)
+
+def test_p2_quantiles_close_to_exact():
+    # continuous increments: quantiles of a +-1 walk sit on ties
+    data = 10 + np.cumsum(np.random.default_rng(1).normal(size=(4000, 30)), axis=1)
+    stats = TrajectoryStats(30, quantiles=(0.1, 0.5, 0.9))
+    for row in data:
+        stats.update(row)
+    for p in (0.1, 0.5, 0.9):
+        exact = np.quantile(data, p, axis=0)
+        assert np.abs(stats.quantile(p) - exact).max() <= 0.25
+    with pytest.raises(ValueError):
+        stats.quantile(0.3)
+
+def test_few_runs_quantiles_are_exact():
+    data = _random_walks(3, 5)
+    stats = TrajectoryStats(5, quantiles=(0.5,))
+    for row in data:
+        stats.update(row)
+    assert np.allclose(stats.quantile(0.5), np.median(data, axis=0))
+
+def test_merge_equals_single_pass_moments():
+    data = _random_walks(300, 20, seed=2)
+    whole = TrajectoryStats(20)
+    parts = [TrajectoryStats(20) for _ in range(3)]
+    for i, row in enumerate(data):
+        whole.update(row)
+        parts[i % 3].update(row)
+    merged = TrajectoryStats(20)
+    for part in parts:
+        merged.merge(part)
+    assert merged.runs == 300
+    assert np.allclose(merged.mean, whole.mean)
+    assert np.allclose(merged.variance(), whole.variance())
+    assert np.array_equal(merged.ruin_probability(), whole.ruin_probability())
+    assert np.abs(merged.quantile(0.5) - np.median(data, axis=0)).max() <= 2.0
+
+def test_merge_rejects_mismatched_settings():
+    with pytest.raises(ValueError):
+        TrajectoryStats(5).merge(TrajectoryStats(6))
+
+def test_build_trajectory_stats_matches_dense_mean():
+    dense = build_trajectory(simulate_strategy, BASIC_STRATEGY_TABLE, runs=0, max_hands=10)
+    assert dense.shape == (0, 10)
+    stats = build_trajectory_stats(lambda s, num_hands, **kw: num_hands * 2.0, None, runs=4, max_hands=6)
+    assert np.array_equal(stats.mean, 2.0 * np.arange(1, 7))
+    assert np.array_equal(stats.variance(), np.zeros(6))
+
+def test_parallel_stats_independent_of_workers():
+    kwargs = dict(runs=40, max_hands=25, seed=5, chunk_size=8)
+    a = parallel_trajectory_stats(simulate_strategy, BASIC_STRATEGY_TABLE, workers=1, **kwargs)
+    b = parallel_trajectory_stats(simulate_strategy, BASIC_STRATEGY_TABLE, workers=3, **kwargs)
+    assert a.runs == b.runs == 40
+    assert np.array_equal(a.mean, b.mean)
+    assert np.array_equal(a.variance(), b.variance())
+    assert np.array_equal(a.quantile(0.5), b.quantile(0.5))
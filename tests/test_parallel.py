@@ -0,0 +1,30 @@
+import numpy as np
+from blackjack_game.bj_bots import simulate_strategy, simulate_card_counting_strategy, basic_strategy
+from blackjack_game.strategy_tables import INDEX_PLAY_TABLE
+from blackjack_game.parallel import spawn_seeds, run_parallel, parallel_trajectory
+
+def test_spawn_seeds_deterministic():
+    assert spawn_seeds(5, 4) == spawn_seeds(5, 4)
+    assert len(set(spawn_seeds(5, 100))) == 100
+    # prefix stable: run i's seed doesn't depend on total runs
+    assert spawn_seeds(5, 10)[:4] == spawn_seeds(5, 4)
+
+def test_run_parallel_identical_across_worker_counts():
+    kwargs = dict(runs=12, seed=123, num_hands=30)
+    serial = run_parallel(simulate_strategy, basic_strategy, workers=1, **kwargs)
+    two = run_parallel(simulate_strategy, basic_strategy, workers=2, **kwargs)
+    three = run_parallel(simulate_strategy, basic_strategy, workers=3, chunk_size=5, **kwargs)
+    assert serial == two == three
+    assert len(set(serial)) > 1
+
+def test_parallel_trajectory_shape_and_determinism():
+    a = parallel_trajectory(simulate_card_counting_strategy, INDEX_PLAY_TABLE, runs=4, max_hands=20,
+                            seed=9, workers=2, num_decks=4)
+    b = parallel_trajectory(simulate_card_counting_strategy, INDEX_PLAY_TABLE, runs=4, max_hands=20,
+                            seed=9, workers=1, num_decks=4)
+    assert a.shape == (4, 20)
+    assert np.array_equal(a, b)
+
+def test_parallel_trajectory_zero_runs():
+    arr = parallel_trajectory(simulate_strategy, basic_strategy, runs=0, max_hands=5, workers=1)
+    assert arr.shape == (0, 5)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from blackjack_game.betting import FlatBet, CountRamp, Martingale, KellyBet
+from blackjack_game.bj_bots import record_outcomes, index_play_strategy
+from blackjack_game.risk import (
+    payout_distribution, risk_metrics, bankroll_distribution, risk_of_ruin, bankroll_percentiles,
+)
+
+WALK = (np.array([-1.0, 1.0]), np.array([0.48, 0.52]))
+
+
+def test_infinite_horizon_ruin_matches_gamblers_ruin():
+    values, probs = WALK
+    assert risk_of_ruin(values, probs, 10) == pytest.approx((0.48 / 0.52) ** 10)
+    assert risk_of_ruin(values, probs[::-1], 10) == 1.0  # negative edge
+
+def test_finite_horizon_approaches_infinite_horizon():
+    values, probs = WALK
+    short = risk_of_ruin(values, probs, 10, hands=100)
+    long = risk_of_ruin(values, probs, 10, hands=5000)
+    assert short < long <= risk_of_ruin(values, probs, 10) + 1e-9
+    assert long == pytest.approx(risk_of_ruin(values, probs, 10), rel=1e-3)
+
+def test_chain_without_ruin_is_binomial():
+    values, probs = np.array([-1.0, 1.0]), np.array([0.5, 0.5])
+    result = bankroll_distribution(values, probs, bankroll=100, hands=10, step=1.0)
+    assert result['ruin'][-1] == 0
+    assert result['probs'][100] == pytest.approx(252 / 1024)
+    assert result['probs'].sum() == pytest.approx(1.0)
+    pct = bankroll_percentiles(values, probs, bankroll=100, hands=10, step=1.0)
+    assert pct[50] == 100 and pct[5] < 100 < pct[95]
+
+def test_chain_matches_monte_carlo():
+    values, probs = np.array([-1.0, 0.0, 1.0, 1.5]), np.array([0.48, 0.09, 0.38, 0.05])
+    rng = np.random.default_rng(0)
+    paths = np.cumsum(rng.choice(values, p=probs, size=(20000, 200)), axis=1) + 20
+    mc = (paths.min(axis=1) <= 0).mean()
+    assert risk_of_ruin(values, probs, 20, hands=200) == pytest.approx(mc, abs=0.01)
+
+def test_metrics():
+    values, probs = WALK
+    m = risk_metrics(values, probs)
+    assert m['ev'] == pytest.approx(0.04)
+    assert m['n0'] == pytest.approx(m['variance'] / 0.04 ** 2)
+    assert m['score'] == pytest.approx(1e6 * 0.04 ** 2 / m['variance'])
+
+def test_distribution_from_outcomes_and_policies():
+    outcomes = record_outcomes(index_play_strategy, num_hands=2000, num_decks=6, penetration=0.8,
+                               play_with_count=True, rng=3)
+    values, probs = payout_distribution(outcomes)
+    assert probs.sum() == pytest.approx(1.0)
+    assert set(values) <= {-1.0, 0.0, 1.0, 1.5}
+    ramp_values, _ = payout_distribution(outcomes, CountRamp(1.0, table_max=8), bankroll=100)
+    assert ramp_values.max() > 1.5
+    flat_values, flat_probs = payout_distribution(outcomes, FlatBet(2.0), bankroll=100)
+    assert np.allclose(flat_values, 2 * values) and np.allclose(flat_probs, probs)
+    with pytest.raises(TypeError):
+        payout_distribution(outcomes, Martingale())
+    with pytest.raises(ValueError):
+        payout_distribution(outcomes, KellyBet())
+    # continuous Kelly stakes are not rounded onto the lattice
+    with pytest.raises(ValueError):
+        payout_distribution(outcomes, KellyBet(table_min=1.0), bankroll=1000)
+    capped, _ = payout_distribution(outcomes, KellyBet(table_min=1.0, table_max=4.0), bankroll=1e6)
+    assert capped.max() == 6.0
+    with pytest.raises(ValueError):
+        bankroll_distribution(np.array([-0.3, 1.0]), np.array([0.5, 0.5]), 10, 5)
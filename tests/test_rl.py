@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from blackjack_game.bj_bots import simulate_strategy
+from blackjack_game.bj_ev import strategy_ev
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE
+from blackjack_game.rl import VectorBlackjackEnv, TabularTrainer, STAND, HIT
+
+def test_reset_and_step():
+    env = VectorBlackjackEnv(500, rng=0)
+    obs = env.reset()
+    assert obs.shape == (500, 4)
+    assert ((obs[:, 0] >= 4) & (obs[:, 0] <= 21)).all()
+    assert set(np.unique(obs[:, 2])) <= set(range(1, 11))
+    assert (obs[:, 3] == 0).all()  # fresh shoes
+    hit_obs, reward, done = env.step(np.full(500, HIT))
+    # hitting only ends the hands that bust
+    assert (reward[done] == -1).all() and (reward[~done] == 0).all()
+    assert (hit_obs[~done, 0] > obs[~done, 0]).any()
+    obs, reward, done = env.step(np.full(500, STAND))
+    assert done.all()
+    assert set(np.unique(reward)) <= {-1.0, 0.0, 1.0, 1.5}
+    assert (obs[:, 3] != 0).any()  # new hands dealt from the used shoes
+
+def test_rollout_matches_exact_ev():
+    env = VectorBlackjackEnv(20000, rng=1)
+    obs = env.reset()
+    total, hands = 0.0, 0
+    for _ in range(40):
+        value, soft, upcard = obs[:, 0].astype(int), obs[:, 1].astype(int), obs[:, 2].astype(int)
+        obs, reward, done = env.step(BASIC_STRATEGY_TABLE.table[soft, value, upcard])
+        total += reward.sum()
+        hands += done.sum()
+    assert total / hands == pytest.approx(strategy_ev(BASIC_STRATEGY_TABLE), abs=0.01)
+
+@pytest.mark.parametrize('method', ['q_learning', 'monte_carlo'])
+def test_trainer_learns_basic_strategy(method):
+    trainer = TabularTrainer(VectorBlackjackEnv(4096, rng=2), method=method, rng=3).train(250)
+    assert trainer.steps == 4096 * 250
+    table = trainer.strategy()
+    assert not table.counted
+    assert table.lookup(11, False, 6) and table.lookup(12, False, 10) and table.lookup(15, True, 4)
+    assert not table.lookup(20, False, 10) and not table.lookup(13, False, 6) and not table.lookup(19, True, 9)
+    assert strategy_ev(table) == pytest.approx(strategy_ev(BASIC_STRATEGY_TABLE), abs=0.005)
+    # a drop-in strategy_fn for the simulators
+    assert isinstance(simulate_strategy(table, num_hands=50, rng=0), float)
+
+def test_counted_trainer_is_reproducible():
+    def train():
+        return TabularTrainer(VectorBlackjackEnv(256, rng=4, penetration=0.75), counted=True,
+                              min_count=-3, max_count=3, rng=5).train(50)
+    a, b = train(), train()
+    assert np.array_equal(a.q, b.q)
+    table = a.strategy()
+    assert table.counted and table.table.shape == (7, 2, 22, 11)
+    assert a.visits.reshape(a.shape + (2,))[[0, -1]].sum() > 0  # extreme counts are visited
+    with pytest.raises(ValueError):
+        TabularTrainer(VectorBlackjackEnv(4), method='sarsa')
@@ -0,0 +1,69 @@
+import pickle
+import numpy as np
+import pytest
+from blackjack_game.bj_bots import simulate_strategy, simulate_card_counting_strategy, basic_strategy, index_play_strategy
+from blackjack_game.checkpoint import save_checkpoint, load_checkpoint
+from blackjack_game.parallel import run_parallel
+from blackjack_game.shoe_bank import write_shoe_bank, ShoeBank, BankedBlackjackGame
+
+@pytest.fixture
+def bank_path(tmp_path):
+    return write_shoe_bank(str(tmp_path / "bank.npy"), 50, num_decks=2, rng=0)
+
+def test_written_shoes_are_full_shuffled_shoes(bank_path):
+    bank = ShoeBank(bank_path)
+    assert len(bank) == 50
+    assert bank.num_decks == 2 and bank.shoe_size == 104
+    expected = sorted([1] * 8 + [c for c in range(2, 10) for _ in range(8)] + [10] * 32)
+    for i in range(len(bank)):
+        assert sorted(bank.shoe(i).tolist()) == expected
+    assert not np.array_equal(bank.shoe(0), bank.shoe(1))
+
+def test_banked_game_deals_shoes_in_order(bank_path):
+    bank = ShoeBank(bank_path)
+    game = BankedBlackjackGame(bank)
+    first = bank.shoe(0).tolist()
+    dealt = [game._draw() for _ in range(104 - 14)]
+    assert dealt == first[:90]
+    assert len(game.deck) == 14
+    assert game._draw() == bank.shoe(1)[0]
+
+def test_reader_start_and_stride(bank_path):
+    game = BankedBlackjackGame(ShoeBank(bank_path).reader(3, stride=10))
+    assert game._draw() == ShoeBank(bank_path).shoe(3)[0]
+    game._build_deck()
+    assert game._draw() == ShoeBank(bank_path).shoe(13)[0]
+
+def test_simulators_accept_shoe_bank(bank_path):
+    a = simulate_strategy(basic_strategy, num_hands=200, rng=ShoeBank(bank_path), return_history=True)
+    b = simulate_strategy(basic_strategy, num_hands=200, rng=ShoeBank(bank_path), return_history=True)
+    assert a == b
+    simulate_card_counting_strategy(index_play_strategy, num_hands=100, num_decks=2, rng=ShoeBank(bank_path))
+    with pytest.raises(ValueError):
+        simulate_card_counting_strategy(index_play_strategy, num_hands=10, num_decks=6, rng=ShoeBank(bank_path))
+
+def test_bank_pickles_by_path(bank_path):
+    bank = pickle.loads(pickle.dumps(ShoeBank(bank_path, start=2, stride=3)))
+    assert (bank.start, bank.stride) == (2, 3)
+    assert len(pickle.dumps(bank)) < 1000
+
+def test_banked_game_checkpoints_mid_shoe(bank_path, tmp_path):
+    game = BankedBlackjackGame(ShoeBank(bank_path))
+    game.deal()
+    game.stand()
+    save_checkpoint(str(tmp_path / "game.ckpt"), {'game': game})
+    copy = load_checkpoint(str(tmp_path / "game.ckpt"))['game']
+    assert '_cards' not in copy.__getstate__()
+    assert bytes(copy.deck) == bytes(game.deck)
+    assert (copy.running_count, copy._shoe_index) == (game.running_count, game._shoe_index)
+
+def test_run_parallel_with_shoe_bank(bank_path):
+    one = run_parallel(simulate_strategy, basic_strategy, runs=4, workers=1, shoe_bank=bank_path, num_hands=50)
+    two = run_parallel(simulate_strategy, basic_strategy, runs=4, workers=2, shoe_bank=bank_path, num_hands=50)
+    assert one == two
+
+def test_rejects_non_bank_file(tmp_path):
+    path = str(tmp_path / "x.npy")
+    np.save(path, np.zeros((3, 7), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        ShoeBank(path)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from blackjack_game.bj_ev import strategy_ev, optimal_action
+from blackjack_game.bj_rules import TableRules
+from blackjack_game.counting import HI_LO
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE
+from blackjack_game.solver import (
+    count_composition,
+    hand_evs,
+    solve_strategy,
+    solve_count_strategy,
+    index_plays,
+)
+
+def test_count_composition():
+    neutral = count_composition(0.0, num_decks=6)
+    assert neutral.sum() == pytest.approx(312)
+    assert neutral[1:] == pytest.approx([24] * 9 + [96])
+    rich = count_composition(4.0, num_decks=6)
+    # true count per deck of the expected shoe matches the request
+    assert -(rich @ HI_LO.bet_tags) / 6 == pytest.approx(4.0)
+    assert rich[10] > neutral[10] and rich[5] < neutral[5]
+
+def test_hand_evs_stand_on_21():
+    evs = hand_evs(10, count_composition())
+    assert evs[0, 0, 21] > 0.9
+    assert evs[1, 0, 21] == -1.0
+    assert evs[0, 1, 21] == evs[0, 0, 21]
+
+def test_solved_basic_strategy():
+    table = solve_strategy()
+    for value in range(4, 12):
+        assert table.lookup(value, False, 6)
+    assert table.lookup(16, False, 10) and not table.lookup(17, False, 10)
+    assert not table.lookup(13, False, 2) and not table.lookup(12, False, 5)
+    assert table.lookup(12, False, 2) and table.lookup(12, False, 3)
+    assert table.lookup(18, True, 9) and table.lookup(18, True, 10) and table.lookup(18, True, 1)
+    assert not table.lookup(18, True, 8) and not table.lookup(19, True, 1)
+    # agrees with the exact evaluator and does at least as well as the hand-written chart
+    assert optimal_action([10, 6], 9, num_decks=4) == 'hit'
+    assert strategy_ev(table) >= strategy_ev(BASIC_STRATEGY_TABLE)
+
+def test_hit_soft_17_dealer():
+    s17 = hand_evs(6, count_composition())
+    h17 = hand_evs(6, count_composition(), TableRules(hit_soft_17=True))
+    # an H17 dealer busts more often behind a 6
+    assert h17[0, 0, 12] > s17[0, 0, 12]
+
+def test_count_strategy_indices():
+    table = solve_count_strategy(min_count=-6, max_count=8)
+    assert table.counted and table.table.shape == (15, 2, 22, 11)
+    assert np.array_equal(table.table[6], solve_strategy().table)
+    plays = index_plays(table)
+    # close to the published Hi-Lo indices
+    assert plays[(16, False, 10)] == (1, 'stand')
+    assert plays[(12, False, 3)] == (2, 'stand')
+    assert plays[(16, False, 9)] == (5, 'stand')
+    assert plays[(13, False, 2)] == (-1, 'hit')
+    for value, soft, up in plays:
+        index, action = plays[value, soft, up]
+        above, below = table.lookup(value, soft, up, index), table.lookup(value, soft, up, index - 1)
+        assert above != below
+        assert (above if index > 0 else below) == (action == 'hit')
+    with pytest.raises(ValueError):
+        index_plays(solve_strategy())
@@ -0,0 +1,58 @@
+import itertools
+import numpy as np
+from blackjack_game.bj_bots import basic_strategy, hit_until_19_strategy, index_play_strategy
+from blackjack_game.strategy_tables import (
+    StrategyTable,
+    compile_strategy,
+    compile_count_strategy,
+    BASIC_STRATEGY_TABLE,
+    HIT_UNTIL_19_TABLE,
+    INDEX_PLAY_TABLE,
+    load_strategy_table,
+)
+
+def _all_hands():
+    # Every 2- and 3-card hand that has not busted
+    for n in (2, 3):
+        for hand in itertools.combinations_with_replacement(range(1, 11), n):
+            if sum(hand) <= 21:
+                yield list(hand)
+
+def test_compiled_tables_match_strategies():
+    for hand in _all_hands():
+        for up in range(1, 11):
+            state = {'player_hand': hand, 'dealer_upcard': up}
+            assert BASIC_STRATEGY_TABLE(state) == basic_strategy(state)
+            assert HIT_UNTIL_19_TABLE(state) == hit_until_19_strategy(state)
+
+def test_count_table_matches_index_play():
+    for hand in _all_hands():
+        for up in (2, 3, 10):
+            state = {'player_hand': hand, 'dealer_upcard': up}
+            for tc in (-12.0, -1.0, -0.5, 0.0, 1.99, 2.0, 3.9, 4.0, 15.0):
+                assert INDEX_PLAY_TABLE(state, tc) == index_play_strategy(state, tc)
+
+def test_table_shapes():
+    assert BASIC_STRATEGY_TABLE.table.shape == (2, 22, 11)
+    assert not BASIC_STRATEGY_TABLE.counted
+    table = compile_count_strategy(index_play_strategy, min_count=-2, max_count=2)
+    assert table.table.shape == (5, 2, 22, 11)
+    assert table.min_count == -2 and table.max_count == 2
+
+def test_lookup_soft_and_hard():
+    table = compile_strategy(basic_strategy)
+    assert table.lookup(18, True, 9) is True
+    assert table.lookup(18, True, 8) is False
+    assert table.lookup(12, False, 4) is False
+
+def test_table_from_array():
+    table = StrategyTable(np.ones((2, 22, 11), dtype=bool))
+    assert table({'player_hand': [10, 10], 'dealer_upcard': 5}) == 'hit'
+
+def test_save_and_load(tmp_path):
+    for table in (BASIC_STRATEGY_TABLE, INDEX_PLAY_TABLE):
+        path = tmp_path / "table.npz"
+        table.save(path)
+        loaded = load_strategy_table(path)
+        assert np.array_equal(loaded.table, table.table)
+        assert loaded.min_count == table.min_count
@@ -44,4 +44,15 @@ def test_build_trajectory_diff_strat_fn():
     arr2 = build_trajectory(sim_fn, dummy2, runs=1, max_hands=1)
 
     assert arr1[0,0] == 1
-    assert arr2[0,0] == 2
\ No newline at end of file
+    assert arr2[0,0] == 2
+
+def test_build_trajectory_uses_single_pass_history():
+    calls = []
+    def sim_fn(strat_fn, num_hands, return_history=False, **kwargs):
+        calls.append(num_hands)
+        return [float(h) for h in range(1, num_hands + 1)]
+
+    arr = build_trajectory(sim_fn, lambda s: 'stand', runs=3, max_hands=4)
+
+    assert calls == [4, 4, 4]
+    assert (arr == np.arange(1, 5)).all()
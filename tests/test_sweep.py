@@ -0,0 +1,71 @@
+import csv
+import json
+import pytest
+from blackjack_game.sweep import DEFAULT_CELL, RESULT_COLUMNS, sweep_grid, run_cell, run_sweep, write_sweep_table
+
+def _grid():
+    return sweep_grid(bet_strategy=['fixed', 'card_counting'], play_strategy=['basic', 'index_play'],
+                      decks=[1, 2, 6], hands=50, runs=3)
+
+def _results(rows):
+    # everything but the timing column
+    return [{k: v for k, v in row.items() if k != 'seconds'} for row in rows]
+
+def test_sweep_grid():
+    grid = _grid()
+    assert len(grid) == 12
+    assert grid[0] == {**DEFAULT_CELL, 'bet_strategy': 'fixed', 'play_strategy': 'basic',
+                       'decks': 1, 'hands': 50, 'runs': 3}
+    assert [g['decks'] for g in grid[:3]] == [1, 2, 6]
+    with pytest.raises(ValueError):
+        sweep_grid(speed=[1, 2])
+
+def test_run_cell():
+    row = run_cell({'hands': 100, 'runs': 4, 'bet': 2.0}, seed=3)
+    assert set(RESULT_COLUMNS) <= set(row)
+    assert _results([row]) == _results([run_cell({'hands': 100, 'runs': 4, 'bet': 2.0}, seed=3)])
+    assert row['ev_per_hand'] == pytest.approx((row['mean_credits'] - 1000.0) / 200)
+    with pytest.raises(ValueError):
+        run_cell({'play_strategy': 'psychic'})
+
+def test_sweep_independent_of_workers():
+    grid = _grid()
+    serial = run_sweep(grid, seed=7, workers=1)
+    parallel = run_sweep(grid, seed=7, workers=2)
+    assert _results(serial) == _results(parallel)
+    assert [row['decks'] for row in serial] == [g['decks'] for g in grid]
+
+def test_checkpoint_resume(tmp_path):
+    grid = _grid()
+    full = run_sweep(grid, seed=7, workers=1)
+    path = str(tmp_path / "sweep.jsonl")
+    # an interrupted sweep: three cells finished, the fourth write cut short
+    with open(path, 'w') as f:
+        for i, row in enumerate(full[:3]):
+            f.write(json.dumps({'cell': i, 'seed': 7, **row}) + '\n')
+        f.write('{"cell": 3, "seed": 7, "bet_str')
+
+    calls = []
+    resumed = run_sweep(grid, seed=7, workers=1, checkpoint=path, progress=lambda done, total: calls.append(done))
+    assert calls == list(range(4, 13))
+    assert _results(resumed) == _results(full)
+    # the checkpoint now holds every cell and a rerun plays nothing
+    assert len(run_sweep(grid, seed=7, workers=1, checkpoint=path, progress=calls.append)) == 12
+    assert len(calls) == 9
+    with pytest.raises(ValueError):
+        run_sweep(sweep_grid(decks=[3]), seed=7, workers=1, checkpoint=path)
+    # cells from another seed tree are never mixed in
+    with pytest.raises(ValueError):
+        run_sweep(grid, seed=8, workers=1, checkpoint=path)
+    with pytest.raises(ValueError):
+        run_sweep(grid, workers=1, checkpoint=str(tmp_path / "unseeded.jsonl"))
+
+def test_write_sweep_table(tmp_path):
+    rows = run_sweep(_grid()[:2], seed=1, workers=1)
+    path = tmp_path / "sweep.csv"
+    write_sweep_table(rows, path)
+    with open(path) as f:
+        table = list(csv.DictReader(f))
+    assert len(table) == 2
+    assert list(table[0]) == list(DEFAULT_CELL) + list(RESULT_COLUMNS)
+    assert float(table[1]['ev_per_hand']) == pytest.approx(rows[1]['ev_per_hand'])
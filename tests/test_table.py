@@ -0,0 +1,75 @@
+import pytest
+from blackjack_game.bj_rules import FULL_BASIC_STRATEGY, STAND, HIT, DOUBLE, SPLIT, TableRules
+from blackjack_game.bj_bots import always_stand_strategy
+from blackjack_game.table import Seat, BlackjackTable, simulate_table
+
+
+def rigged(seats, cards, **rules):
+    table = BlackjackTable(seats, rules=TableRules(**rules), rng=0)
+    table.game.deck = [5] * 20 + cards[::-1]
+    return table
+
+def fixed(*actions):
+    queue = list(actions)
+    return lambda state: queue.pop(0) if queue else STAND
+
+
+def test_seat_count_is_validated():
+    with pytest.raises(ValueError):
+        BlackjackTable([])
+    with pytest.raises(ValueError):
+        BlackjackTable([always_stand_strategy] * 8)
+
+def test_cards_dealt_round_robin_and_dealer_resolves_once():
+    # seat 1 gets 10,9; seat 2 gets 6,5 and doubles onto a 10; dealer 10,6 draws a 10
+    table = rigged([Seat(fixed()), Seat(fixed(DOUBLE))], [10, 6, 10, 9, 5, 6, 10, 10])
+    assert table.play_round() == [1.0, 2.0]
+    assert table.seats[0].hands == [[10, 9]]
+    assert table.seats[1].hands == [[6, 5, 10]] and table.seats[1].bets == [2]
+    assert table.game.dealer == [10, 6, 10]
+    assert [seat.bankroll for seat in table.seats] == [101.0, 102.0]
+
+def test_dealer_skips_drawing_when_every_hand_busted():
+    table = rigged([Seat(fixed(HIT)), Seat(fixed(HIT))], [10, 10, 10, 10, 6, 6, 10, 10])
+    assert table.play_round() == [-1.0, -1.0]
+    assert table.game.dealer == [10, 6]
+
+def test_peeked_dealer_blackjack_and_player_natural():
+    table = rigged([Seat(fixed()), Seat(fixed())], [1, 10, 1, 10, 9, 10])
+    assert table.play_round() == [0.0, -1.0]
+
+def test_broke_seats_sit_out():
+    table = BlackjackTable([Seat(always_stand_strategy, bankroll=0.5), Seat(always_stand_strategy)], rng=1)
+    profits = table.play_round()
+    assert profits[0] == 0.0 and table.seats[0].hands == []
+
+def test_doubles_and_splits_capped_at_bankroll():
+    # seat 1 holds one bet: its 6,5 and its 8,8 cannot double or split
+    offered = []
+    def greedy(state):
+        offered.append(state['actions'])
+        return DOUBLE if DOUBLE in state['actions'] else SPLIT if SPLIT in state['actions'] else STAND
+    table = rigged([Seat(greedy, bankroll=1.0), Seat(fixed(DOUBLE))], [6, 6, 10, 5, 5, 6, 10, 10])
+    table.play_round()
+    assert DOUBLE not in offered[0] and table.seats[0].bets == [1.0]
+    assert table.seats[1].bets == [2]
+    table = rigged([Seat(greedy, bankroll=1.0)], [8, 10, 8, 6, 10])
+    table.play_round()
+    assert SPLIT not in offered[-1] and table.seats[0].hands == [[8, 8]]
+    seats = [Seat(greedy, bankroll=1.0, insure=True) for _ in range(5)]
+    assert all(bankroll >= 0 for bankroll in simulate_table(seats, num_rounds=300, rng=3))
+
+def test_simulate_table_is_reproducible():
+    seats = lambda: [Seat(FULL_BASIC_STRATEGY, bankroll=1000.0) for _ in range(5)]
+    a = simulate_table(seats(), num_rounds=300, return_history=True, rng=2)
+    b = simulate_table(seats(), num_rounds=300, return_history=True, rng=2)
+    assert a == b and len(a) == 5 and all(len(h) == 300 for h in a)
+    assert simulate_table(seats(), num_rounds=300, rng=2) == [h[-1] for h in a]
+
+def test_table_shoe_counts_every_seat():
+    from blackjack_game.bj import HI_LO_TAGS
+    table = BlackjackTable([FULL_BASIC_STRATEGY] * 3, rules=TableRules(penetration=0.75), rng=5)
+    table.play_round()
+    seen = [c for seat in table.seats for hand in seat.hands for c in hand] + table.game.dealer
+    assert table.game.cards_dealt == len(seen)
+    assert table.game.running_count == sum(HI_LO_TAGS[c] for c in seen)
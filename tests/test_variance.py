@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from blackjack_game.bj import BlackjackGame
+from blackjack_game.bj_bots import compute_payout
+from blackjack_game.bj_ev import strategy_ev
+from blackjack_game.strategy_tables import BASIC_STRATEGY_TABLE, INDEX_PLAY_TABLE, ALWAYS_STAND_TABLE, HIT_UNTIL_19_TABLE
+from blackjack_game.variance import (
+    deal_common_rounds,
+    antithetic_rounds,
+    play_rounds,
+    control_variates,
+    estimate_mean,
+    compare_strategies,
+)
+
+def _play_scalar(rounds, i, strategy):
+    # Player hits come from the player stream, dealer draws from the dealer stream
+    game = BlackjackGame()
+    p1, p2, up, hole = rounds['initial'][i].tolist()
+    game.player, game.dealer, game.done = [p1, p2], [up, hole], False
+    is_bj = game._hand_value(game.player) == 21
+    game.deck = [0] * 20 + rounds['player_draws'][i].tolist()[::-1]
+    value, soft = game.player_value()
+    while value <= 21 and strategy.lookup(value, soft, up, rounds['true_count'][i]):
+        value, soft = game.hit()
+    if value > 21:
+        return compute_payout(is_bj, -1, 1.0)
+    game.deck = [0] * 20 + rounds['dealer_draws'][i].tolist()[::-1]
+    return compute_payout(is_bj, game.stand(), 1.0)
+
+def test_deal_common_rounds_layout():
+    rounds = deal_common_rounds(100, num_decks=4, rng=0)
+    assert rounds['initial'].shape == (100, 4)
+    assert rounds['player_draws'].shape == rounds['dealer_draws'].shape == (100, 10)
+    # (208 - 52) // 24 = 6 rounds per shoe; each shoe starts at count zero
+    assert (rounds['true_count'][::6] == 0).all()
+
+@pytest.mark.parametrize("strategy", [BASIC_STRATEGY_TABLE, INDEX_PLAY_TABLE])
+def test_play_rounds_matches_scalar_game(strategy):
+    rounds = deal_common_rounds(400, rng=1)
+    payouts = play_rounds(strategy, rounds)
+    for i in range(400):
+        assert payouts[i] == _play_scalar(rounds, i, strategy)
+
+def test_play_rounds_rejects_short_draw_streams():
+    rounds = deal_common_rounds(200, rng=2, max_draws=1)
+    with pytest.raises(ValueError):
+        play_rounds(HIT_UNTIL_19_TABLE, rounds)
+
+def test_antithetic_swaps_roles():
+    rounds = deal_common_rounds(10, rng=2)
+    swapped = antithetic_rounds(rounds)
+    assert (swapped['initial'][:, :2] == rounds['initial'][:, 2:]).all()
+    assert (swapped['player_draws'] == rounds['dealer_draws']).all()
+    assert (antithetic_rounds(swapped)['initial'] == rounds['initial']).all()
+
+def test_unbiased_against_exact_ev():
+    rounds = deal_common_rounds(100000, rng=3)
+    y = (play_rounds(ALWAYS_STAND_TABLE, rounds) + play_rounds(ALWAYS_STAND_TABLE, antithetic_rounds(rounds))) / 2
+    mean, se = estimate_mean(y, control_variates(rounds))
+    assert abs(mean - strategy_ev(ALWAYS_STAND_TABLE)) < 4 * se
+
+def test_control_variates_zero_mean():
+    controls = control_variates(deal_common_rounds(200000, rng=4))
+    assert np.abs(controls.mean(axis=0)).max() < 0.01
+
+def test_estimate_mean_without_controls():
+    mean, se = estimate_mean(np.array([1.0, -1.0, 1.0, -1.0]))
+    assert mean == 0.0
+    assert se == pytest.approx(np.std([1, -1, 1, -1], ddof=1) / 2)
+
+def test_common_random_numbers_reduce_variance():
+    results = compare_strategies({'basic': BASIC_STRATEGY_TABLE, 'index': INDEX_PLAY_TABLE},
+                                 num_rounds=50000, rng=5)
+    assert results['index']['variance_reduction'] > 10
+    assert results['index']['diff_se'] < results['index']['independent_se']
+    assert 'diff' not in results['basic']